@@ -1,19 +1,37 @@
 from __future__ import annotations  # Allows more recent type hints features
 from typing import TYPE_CHECKING
-from math import isclose
 
-from numpy import array, atleast_2d, zeros, subtract, matmul, divide, seterr, nanmax
-from numpy.linalg import solve
+from numpy import array, asarray, atleast_2d, zeros, ones, empty, arange, subtract, matmul, divide, seterr, nanmax, nonzero, median, int64, isnan, nan_to_num, flatnonzero, concatenate, ix_, unique
+import scipy as sp
+from heapq import heapify, heappop, heappush
+from itertools import compress
+from numpy.linalg import solve, LinAlgError
 
 from Pynite.LoadCombo import LoadCombo
+from Pynite.Factorization import StiffnessFactorization, IterativeStiffnessSolver, LowRankUpdate, ConvergenceError
+from Pynite.SpatialIndex import NodeGrid
+
+# Descriptions of each nodal degree of freedom used in stability messages
+_DOF_DESCRIPTIONS = ('for translation in the global X direction', 'for translation in the global Y direction', 'for translation in the global Z direction',
+                     'for rotation about the global X axis', 'for rotation about the global Y axis', 'for rotation about the global Z axis')
+
+# Name prefix and tag given to the temporary unit load combinations used by superposition analysis
+SUPERPOSITION_PREFIX = '__superposition__ '
+SUPERPOSITION_TAG = '__superposition__'
+
+# Name prefix given to the temporary unit load combinations used to assemble each load case's load vectors
+CASE_LOAD_PREFIX = '__case__ '
 
 if TYPE_CHECKING:
-    from typing import List, Tuple
+    from typing import Dict, List, Tuple
     from Pynite.FEModel3D import FEModel3D
     from numpy import float64
     from numpy.typing import NDArray
     from scipy.sparse import lil_matrix
 
+# The most conjugate gradient iterations spent re-using the initial stiffness factorization for a P-Delta step before factorizing the combined stiffness matrix instead
+_PDELTA_REUSE_ITERATIONS = 25
+
 
 def _prepare_model(model: FEModel3D, n_modes: int = 0) -> None:
     """Prepares a model for analysis by ensuring at least one load combination is defined, generating all meshes that have not already been generated, activating all non-linear members, and internally numbering all nodes and elements.
@@ -24,15 +42,13 @@ def _prepare_model(model: FEModel3D, n_modes: int = 0) -> None:
     :type n_modes: int
     """
 
-    # Reset any nodal displacements
-    model._D = {}
-    for node in model.nodes.values():
-        node.DX = {}
-        node.DY = {}
-        node.DZ = {}
-        node.RX = {}
-        node.RY = {}
-        node.RZ = {}
+    # Reset any nodal displacements and reactions. The nodes may be renumbered below, which would leave earlier results in the wrong rows.
+    model._D.clear(len(model.nodes)*6)
+    model._reactions.clear(len(model.nodes)*6)
+
+    # Discard any stiffness factorization from a prior analysis. Node numbering and element properties may have changed since it was built.
+    model.K11_factorization = None
+    model.solver_stats = {}
 
     # Ensure there is at least 1 load combination to solve if the user didn't define any
     if model.load_combos == {}:
@@ -106,67 +122,324 @@ def _identify_combos(model: FEModel3D, combo_tags: List[str] | None = None) -> L
     return combo_list
 
 
+def _add_case_combos(model: FEModel3D) -> List[LoadCombo]:
+    """Registers a temporary unit load combination for each primitive load case in the model, plus one empty load combination that carries only the enforced displacements. These are solved once during a superposition analysis and then removed by `_remove_case_combos`.
+
+    :param model: The model being analyzed. It must already have been prepared for analysis.
+    :type model: FEModel3D
+    :return: A list of the temporary load combinations. The first entry is always the enforced displacement combination, followed by one unit combination per load case in `model.load_cases` order.
+    :rtype: list
+    """
+
+    # The enforced displacement combination has no load factors. Enforced displacements are applied to every load combination rather than being scaled by load factors, so they need to be solved as their own independent column.
+    case_combos = [LoadCombo(SUPERPOSITION_PREFIX + 'enforced', [SUPERPOSITION_TAG], {})]
+
+    # Add a unit load combination for each primitive load case
+    for case in model.load_cases:
+        case_combos.append(LoadCombo(SUPERPOSITION_PREFIX + case, [SUPERPOSITION_TAG], {case: 1.0}))
+
+    for combo in case_combos:
+
+        # Register the combination with the model so that elements can look it up by name
+        model.load_combos[combo.name] = combo
+
+        # Activate all springs and members for the combination. `_prepare_model` has already run, so this has to be done by hand here.
+        for spring in model.springs.values():
+            spring.active[combo.name] = True
+        for phys_member in model.members.values():
+            phys_member.active[combo.name] = True
+            for member in phys_member.sub_members.values():
+                member.active[combo.name] = True
+
+    # Return the temporary load combinations
+    return case_combos
+
+
+def _remove_case_combos(model: FEModel3D, case_combos: List[LoadCombo]) -> None:
+    """Removes the temporary load combinations created by `_add_case_combos`, along with any results stored for them.
+
+    :param model: The model being analyzed.
+    :type model: FEModel3D
+    :param case_combos: The temporary load combinations to be removed.
+    :type case_combos: list
+    """
+
+    for combo in case_combos:
+
+        # Remove the load combination and its displacements and reactions
+        model.load_combos.pop(combo.name, None)
+        model._D.pop(combo.name, None)
+        model._reactions.pop(combo.name, None)
+
+        # Remove the activation flags
+        for spring in model.springs.values():
+            spring.active.pop(combo.name, None)
+        for phys_member in model.members.values():
+            phys_member.active.pop(combo.name, None)
+            for member in phys_member.sub_members.values():
+                member.active.pop(combo.name, None)
+
+
+def _factor_matrix(model: FEModel3D, combo_list: List[LoadCombo]) -> NDArray[float64]:
+    """Builds the matrix of load factors used to combine primitive load case results into load combination results.
+
+    :param model: The model being analyzed.
+    :type model: FEModel3D
+    :param combo_list: The load combinations to build the factor matrix for.
+    :type combo_list: list
+    :return: A matrix with one row per temporary combination from `_add_case_combos` and one column per load combination. The first row is all ones so that enforced displacements are included in every load combination.
+    :rtype: array
+    """
+
+    cases = model.load_cases
+    factors = zeros((len(cases) + 1, len(combo_list)))
+
+    # Enforced displacements act on every load combination
+    factors[0, :] = 1.0
+
+    # Fill in the load factors. Cases listed in a load combination that have no loads in the model contribute nothing and are skipped.
+    for j, combo in enumerate(combo_list):
+        for i, case in enumerate(cases):
+            factors[i + 1, j] = combo.factors.get(case, 0.0)
+
+    return factors
+
+
+def _superpose_cases(model: FEModel3D, case_combos: List[LoadCombo], combo_list: List[LoadCombo]) -> None:
+    """Forms displacements and reactions for each load combination from the solved temporary load case combinations, and stores them in the model and its nodes. Member end forces and internal results are calculated on demand from the stored displacements, so they follow automatically.
+
+    :param model: The model being analyzed.
+    :type model: FEModel3D
+    :param case_combos: The solved temporary load combinations from `_add_case_combos`.
+    :type case_combos: list
+    :param combo_list: The load combinations to form results for.
+    :type combo_list: list
+    """
+
+    # Build the (cases x combos) factor matrix
+    factors = _factor_matrix(model, combo_list)
+
+    # Gather the global displacement and reaction vectors for each case as the columns of a single matrix, and combine them all at once
+    case_names = [combo.name for combo in case_combos]
+    D_combos = matmul(model._D.matrix(case_names), factors)
+    R_combos = matmul(model._reactions.matrix(case_names), factors)
+
+    # Store the combined results. The nodes read their results from these matrices.
+    combo_names = [combo.name for combo in combo_list]
+    model._D.set_columns(combo_names, D_combos)
+    model._reactions.set_columns(combo_names, R_combos)
+
+
+def _stiffness_state(model: FEModel3D, combo_name: str) -> Tuple:
+    """Returns a key describing which elements contribute to the global stiffness matrix for a load combination. Two load combinations with the same key have identical elastic stiffness matrices, so a factorization built for one can be reused for the other.
+
+    :param model: The model being analyzed.
+    :type model: FEModel3D
+    :param combo_name: The name of the load combination.
+    :type combo_name: str
+    :return: A hashable key describing the stiffness state.
+    :rtype: tuple
+    """
+
+    # Tension/compression-only nodal springs are switched on and off globally
+    node_springs = tuple(spring[2] for node in model.nodes.values()
+                         for spring in (node.spring_DX, node.spring_DY, node.spring_DZ,
+                                        node.spring_RX, node.spring_RY, node.spring_RZ))
+
+    # Springs and members are switched on and off per load combination
+    springs = tuple(spring.active[combo_name] for spring in model.springs.values())
+    members = tuple(phys_member.active[combo_name] for phys_member in model.members.values())
+
+    return (node_springs, springs, members)
+
+
+def _TC_node_springs(model: FEModel3D) -> List[List]:
+    """Returns the model's tension/compression-only node support springs, in node and degree of freedom order. Each spring is the node's `[stiffness, direction, active]` list, so setting `spring[2]` switches the spring on or off.
+
+    :param model: The model being analyzed.
+    :type model: FEModel3D
+    :rtype: list
+    """
+    return [spring for node in model.nodes.values()
+            for spring in (node.spring_DX, node.spring_DY, node.spring_DZ, node.spring_RX, node.spring_RY, node.spring_RZ)
+            if spring[0] is not None and spring[1] is not None]
+
+
+def _permc_spec(model: FEModel3D) -> str:
+    """Returns the column permutation the sparse LU factorization should use. A minimum degree node ordering already reduces fill-in, so the factorization keeps it rather than applying its own column ordering.
+
+    :param model: The model being analyzed.
+    :type model: FEModel3D
+    :return: The `permc_spec` argument for `scipy.sparse.linalg.splu`.
+    :rtype: str
+    """
+    return 'NATURAL' if str(model.node_ordering).upper() == 'AMD' else 'COLAMD'
+
+
+def _factorize(model: FEModel3D, K11, D1_indices: List[int], sparse: bool = True, state: Tuple | None = None, K12=None, K21=None, K22=None, solver: str | None = None, log: bool = False, preconditioner: str = 'jacobi', tolerance: float = 1e-8) -> StiffnessFactorization | IterativeStiffnessSolver:
+    """Factorizes the partitioned stiffness matrix `K11` and stores the factorization on the model as `model.K11_factorization` so that it can be reused.
+
+    :param model: The model being analyzed.
+    :type model: FEModel3D
+    :param K11: The partitioned stiffness matrix for the unknown degrees of freedom.
+    :type K11: NDArray[float64] or scipy sparse matrix
+    :param D1_indices: The global degree of freedom indices for each row/column of `K11`.
+    :type D1_indices: list
+    :param sparse: Indicates whether a sparse factorization should be used. Defaults to True.
+    :type sparse: bool, optional
+    :param state: The stiffness state key from `_stiffness_state`, if any. Defaults to None.
+    :type state: tuple, optional
+    :param K12: The remaining stiffness partitions, kept alongside the factorization for reuse. Defaults to None.
+    :type K12: NDArray[float64] or scipy sparse matrix, optional
+    :param solver: Set to 'banded' to use a banded Cholesky factorization, which falls back to LU if `K11` is not positive-definite, or to 'pcg' to use the preconditioned conjugate gradient solver instead of a factorization. Defaults to None.
+    :type solver: str, optional
+    :param log: Prints a message when the banded factorization falls back to LU. Defaults to False.
+    :type log: bool, optional
+    :param preconditioner: The preconditioner used when `solver` is 'pcg'. Defaults to 'jacobi'.
+    :type preconditioner: str, optional
+    :param tolerance: The relative residual tolerance used when `solver` is 'pcg'. Defaults to 1e-8.
+    :type tolerance: float, optional
+    :return: The factorization.
+    :rtype: StiffnessFactorization or IterativeStiffnessSolver
+    """
+
+    # The iterative solver is warm started from the last solution of the solver it replaces
+    if solver == 'pcg':
+        previous = model.K11_factorization
+        x0 = previous.x0 if isinstance(previous, IterativeStiffnessSolver) else None
+        model.K11_factorization = IterativeStiffnessSolver(K11, D1_indices, state, K12, K21, K22, preconditioner, tolerance, x0=x0)
+        return model.K11_factorization
+
+    banded = solver == 'banded'
+    model.K11_factorization = StiffnessFactorization(K11, D1_indices, sparse, state, K12, K21, K22, _permc_spec(model), banded)
+
+    if banded and not model.K11_factorization.banded and log:
+        print('- Stiffness matrix is not positive-definite. Using LU factorization instead of banded Cholesky')
+
+    return model.K11_factorization
+
+
+def _update_factorization(model: FEModel3D, K11, D1_indices: List[int], sparse: bool = True, state: Tuple | None = None, K12=None, K21=None, K22=None, solver: str | None = None, log: bool = False, max_rank: int = 96, preconditioner: str = 'jacobi', tolerance: float = 1e-8) -> StiffnessFactorization | LowRankUpdate | IterativeStiffnessSolver:
+    """Provides a solver for a new stiffness state, by correcting the model's existing factorization when only a few degrees of freedom have changed, and refactorizing otherwise.
+
+    Tension/compression-only iterations typically switch a few members or springs on or off at a time. Their effect on `K11` is confined to the degrees of freedom of the nodes they connect, so it is applied as a low-rank (Woodbury) correction to the last full factorization. The correction is always made relative to that full factorization, so errors don't accumulate over many iterations.
+
+    :param model: The model being analyzed.
+    :type model: FEModel3D
+    :param K11: The partitioned stiffness matrix for the new stiffness state.
+    :type K11: NDArray[float64] or scipy sparse matrix
+    :param D1_indices: The global degree of freedom indices for each row/column of `K11`.
+    :type D1_indices: list
+    :param sparse: Indicates whether a sparse factorization should be used if refactorizing. Defaults to True.
+    :type sparse: bool, optional
+    :param state: The stiffness state key from `_stiffness_state`. Defaults to None.
+    :type state: tuple, optional
+    :param K12: The remaining stiffness partitions for the new stiffness state. Defaults to None.
+    :type K12: NDArray[float64] or scipy sparse matrix, optional
+    :param solver: The solver passed on to `_factorize` if refactorizing. Low-rank corrections aren't used with the 'pcg' solver. Defaults to None.
+    :type solver: str, optional
+    :param log: Prints which strategy was used if set to True. Defaults to False.
+    :type log: bool, optional
+    :param max_rank: The largest number of changed degrees of freedom handled with a low-rank correction. More changes than this trigger a full refactorization. Set to 0 to always refactorize. Defaults to 96.
+    :type max_rank: int, optional
+    :param preconditioner: The preconditioner passed on to `_factorize` when `solver` is 'pcg'. Defaults to 'jacobi'.
+    :type preconditioner: str, optional
+    :param tolerance: The relative residual tolerance passed on to `_factorize` when `solver` is 'pcg'. Defaults to 1e-8.
+    :type tolerance: float, optional
+    :return: The solver for the new stiffness state, which is also stored as `model.K11_factorization`.
+    :rtype: StiffnessFactorization, LowRankUpdate or IterativeStiffnessSolver
+    """
+
+    # Corrections are always made to the last full factorization
+    base = model.K11_factorization
+    if isinstance(base, LowRankUpdate):
+        base = base.base
+
+    if base is None or max_rank <= 0 or solver == 'pcg' or isinstance(base, IterativeStiffnessSolver) or base.n == 0 or base.n != K11.shape[0]:
+        return _factorize(model, K11, D1_indices, sparse, state, K12, K21, K22, solver, log, preconditioner, tolerance)
+
+    # Find the degrees of freedom where the stiffness has changed. Elements that didn't change contribute identical terms, so the difference is exactly zero away from the switched elements.
+    if hasattr(K11, 'tocsr'):
+        delta = sp.sparse.csr_matrix(K11 - base.K11)
+        delta.eliminate_zeros()
+        dofs = unique(delta.tocoo().row)
+    else:
+        delta = K11 - base.K11
+        dofs = flatnonzero((delta != 0).any(axis=1))
+
+    if len(dofs) > max_rank:
+        if log:
+            print(f'- {len(dofs)} degrees of freedom changed stiffness. Refactorizing the stiffness matrix')
+        return _factorize(model, K11, D1_indices, sparse, state, K12, K21, K22, solver, log, preconditioner, tolerance)
+
+    # Apply the change as a low-rank correction. If the updated matrix is singular, refactorizing reports the instability.
+    try:
+        model.K11_factorization = LowRankUpdate(base, K11, delta, dofs, state, K12, K21, K22)
+    except LinAlgError:
+        return _factorize(model, K11, D1_indices, sparse, state, K12, K21, K22, solver, log, preconditioner, tolerance)
+
+    if log:
+        print(f'- Updating the stiffness matrix factorization with a rank-{len(dofs)} correction')
+
+    return model.K11_factorization
+
+
+def _record_solver_stats(model: FEModel3D, combo_name: str, stats: List[Dict[str, float]], log: bool = False) -> None:
+    """Appends the iteration statistics of an iterative solve to `model.solver_stats` for a load combination.
+
+    :param model: The model being analyzed.
+    :type model: FEModel3D
+    :param combo_name: The name of the load combination that was solved.
+    :type combo_name: str
+    :param stats: One dictionary per solve, holding the number of `iterations` and the final relative `residual`.
+    :type stats: list
+    :param log: Prints the statistics to the console if set to True. Defaults to False.
+    :type log: bool, optional
+    """
+
+    model.solver_stats.setdefault(combo_name, []).extend(stats)
+
+    if log:
+        for stat in stats:
+            print(f"- {combo_name}: conjugate gradient converged in {stat['iterations']} iterations (relative residual {stat['residual']:.2e})")
+
+
 def _check_stability(model: FEModel3D, K: NDArray[float64]) -> None:
     """
     Identifies nodal instabilities in a model's stiffness matrix.
+
+    A degree of freedom is unstable if its diagonal stiffness term is zero and it is not supported. All the unstable degrees of freedom for a node are reported together on one line.
+
+    :param model: The model being checked. It must have been numbered by `_renumber`.
+    :type model: FEModel3D
+    :param K: The global stiffness matrix (dense or sparse).
+    :type K: NDArray[float64] or scipy sparse matrix
+    :raises Exception: Occurs when any node is unstable.
     """
 
-    # Initialize the `unstable` flag to `False`
-    unstable = False
-
-    # Step through each diagonal term in the stiffness matrix
-    for i in range(K.shape[0]):
-
-        # Determine which node this term belongs to
-        node = [node for node in model.nodes.values() if node.ID == int(i/6)][0]
-
-        # Determine which degree of freedom this term belongs to
-        dof = i % 6
-
-        # Check to see if this degree of freedom is supported
-        if dof == 0:
-            supported = node.support_DX
-        elif dof == 1:
-            supported = node.support_DY
-        elif dof == 2:
-            supported = node.support_DZ
-        elif dof == 3:
-            supported = node.support_RX
-        elif dof == 4:
-            supported = node.support_RY
-        elif dof == 5:
-            supported = node.support_RZ
-
-        # Check if the degree of freedom on this diagonal is unstable
-        if isclose(K[i, i], 0) and not supported:
-
-            # Flag the model as unstable
-            unstable = True
-
-            # Identify which direction this instability affects
-            if i%6 == 0:
-                direction = 'for translation in the global X direction.'
-            if i%6 == 1:
-                direction = 'for translation in the global Y direction.'
-            if i%6 == 2:
-                direction = 'for translation in the global Z direction.'
-            if i%6 == 3:
-                direction = 'for rotation about the global X axis.'
-            if i%6 == 4:
-                direction = 'for rotation about the global Y axis.'
-            if i%6 == 5:
-                direction = 'for rotation about the global Z axis.'
-
-            # Print a message to the console
-            print('* Nodal instability detected: node ' + node.name + ' is unstable ' + direction)
-
-    if unstable:
+    # Get the diagonal of the stiffness matrix in one call. This works for both dense and sparse matrices.
+    diagonal = asarray(K.diagonal()).reshape(-1)
+
+    # A diagonal term is unstable if it is zero and its degree of freedom is not supported. `model._supports` holds the support conditions of each node, ordered by node ID.
+    unstable = (diagonal == 0).reshape(-1, 6) & ~model._supports
+
+    # Step through each node with at least one unstable degree of freedom
+    unstable_IDs = nonzero(unstable.any(axis=1))[0]
+    for ID in unstable_IDs:
+
+        # Describe every unstable direction at this node
+        directions = [_DOF_DESCRIPTIONS[dof] for dof in nonzero(unstable[ID])[0]]
+
+        # Print a message to the console
+        print('* Nodal instability detected: node ' + model._nodes_by_ID[ID].name + ' is unstable ' + ', '.join(directions) + '.')
+
+    if unstable_IDs.size > 0:
         raise Exception('Unstable node(s). See console output for details.')
 
     return
 
 
-def _PDelta(model: FEModel3D, combo_name: str, P1: NDArray[float64], FER1: NDArray[float64], D1_indices: List[int], D2_indices: List[int], D2: NDArray[float64], log: bool = True, sparse: bool = True, check_stability: bool = False, max_iter: int = 30) -> None:
+def _PDelta(model: FEModel3D, combo_name: str, P1: NDArray[float64], FER1: NDArray[float64], D1_indices: List[int], D2_indices: List[int], D2: NDArray[float64], log: bool = True, sparse: bool = True, check_stability: bool = False, max_iter: int = 30, solver: str | None = None, preconditioner: str = 'jacobi', tolerance: float = 1e-8) -> None:
     """Performs second order (P-Delta) analysis. This type of analysis is appropriate for most models using beams, columns and braces. Second order analysis is usually required by material-specific codes. Models with slender members and/or members with combined bending and axial loads will generally have more significant P-Delta effects. P-Delta effects in plates/quads are not considered by Pynite at this time.
 
     :param model: The finite element model to be solved.
@@ -187,129 +460,251 @@ def _PDelta(model: FEModel3D, combo_name: str, P1: NDArray[float64], FER1: NDArr
     :type sparse: bool, optional
     :param check_stability: Indicates whether nodal stability should be checked. This slows down the analysis considerably, but can be useful for small models or for debugging. Default is `False`.
     :type check_stability: bool, optional
+    :param solver: Set to 'pcg' to solve each step with the preconditioned conjugate gradient solver, warm started from the previous step's displacements. Defaults to None, which uses the factorization selected by `sparse`.
+    :type solver: str, optional
+    :param preconditioner: The preconditioner used when `solver` is 'pcg'. Defaults to 'jacobi'.
+    :type preconditioner: str, optional
+    :param tolerance: The relative residual tolerance used when `solver` is 'pcg'. Defaults to 1e-8.
+    :type tolerance: float, optional
     :raises ValueError: Occurs when there is a singularity in the stiffness matrix, which indicates an unstable structure.
     :raises Exception: Occurs when a model fails to converge.
     """
 
-    # Import `scipy` features if the sparse solver is being used
-    if sparse == True:
-        from scipy.sparse.linalg import spsolve
+    combo = _ModelCombo(model, combo_name, D1_indices, D2_indices, sparse, check_stability, log)
+    _solve_PDelta(combo, P1, FER1, D2, max_iter, solver, preconditioner, tolerance)
 
-    convergence_TC = False  # Tracks tension/compression-only convergence
-    divergence_TC = False   # Tracks tension/compression-only divergence
-    iter_count_TC = 1
+    # Flag the model as solved
+    model.solution = 'P-Delta'
 
-    # Iterate until either T/C convergence or divergence occurs. Perform at least 2 iterations for the P-Delta analysis.
-    while convergence_TC == False and divergence_TC == False:
 
-        # Inform the user which iteration we're on
-        if log:
-            print('- Beginning tension/compression-only iteration #' + str(iter_count_TC))
+class _ModelCombo():
+    """
+    One load combination of a model being analyzed, as seen by the load stepping and P-Delta drivers (`_solve_load_steps` and `_solve_PDelta`).
 
-        # There will be 2 solution steps in the P-Delta analysis:
-        # Step 1 - Analyze based on initial stiffness
-        # Step 2 - Calculate geometric stiffness and add its effects
-        for solution_step in [1, 2]:
+    The drivers only use the attributes and methods below, so `ParallelAnalysis` runs the same drivers on an array snapshot of the model in its worker processes.
+    """
 
-            # Determine if the user has selected a sparse solution
-            if sparse == True:
+    def __init__(self, model: FEModel3D, combo_name: str, D1_indices: List[int], D2_indices: List[int], sparse: bool = True, check_stability: bool = True, log: bool = False) -> None:
 
-                if solution_step == 1:
+        self.model: FEModel3D = model
+        self.combo_name: str = combo_name
+        self.D1_indices: List[int] = D1_indices     # The global degree of freedom indices of the unknown displacements
+        self.D2_indices: List[int] = D2_indices     # The global degree of freedom indices of the enforced displacements
+        self.sparse: bool = sparse
+        self.check_stability: bool = check_stability
+        self.log: bool = log
+        self.permc_spec: str = _permc_spec(model)   # The column permutation for sparse LU factorizations
 
-                    # Calculate the partitioned initial stiffness matrices. These matrices must be recalculated on each T/C iteration due to tension/compression-only members deactivating or reactivating.
-                    if log:
-                        print('- Calculating initial stiffness matrix')
-                    K11, K12, K21, K22 = _partition(model, model.K(combo_name, log, check_stability, sparse), D1_indices, D2_indices)
+    def factorization(self, solver: str | None = None, max_rank: int = 96, preconditioner: str = 'jacobi', tolerance: float = 1e-8) -> StiffnessFactorization | LowRankUpdate | IterativeStiffnessSolver:
+        """Returns the solver for the load combination's current stiffness state. The stiffness matrix is only assembled when the tension/compression-only elements have changed since the stored factorization was built, and is then factorized or updated by `_update_factorization`."""
 
-                    # The initial stiffness matrices are in `coo` format from construction. They will be converted to `csr` format for efficient mathematical operations.
-                    K11 = K11.tocsr()
-                    K12 = K12.tocsr()
-                    K21 = K21.tocsr()
-                    K22 = K22.tocsr()
+        model = self.model
+        state = _stiffness_state(model, self.combo_name)
+        if model.K11_factorization is None or not model.K11_factorization.matches(state):
 
-                # Check if we are ready to calculate the geometric stiffness
-                if solution_step == 2:
+            if self.log:
+                print('- Calculating the stiffness matrix')
+            K11, K12, K21, K22 = _partition(model, model.K(self.combo_name, self.log, self.check_stability, self.sparse), self.D1_indices, self.D2_indices)
+            _update_factorization(model, K11, self.D1_indices, self.sparse, state, K12, K21, K22, solver, self.log, max_rank, preconditioner, tolerance)
 
-                    # After the first iteration, the geometric stiffness matrix will be added to the linear elastic stiffness matrix.
-                    if log: print('- Calculating geometric stiffness matrix')
-                    Kg11, Kg12, Kg21, Kg22 = _partition(model, model.Kg(combo_name, log, sparse, False), D1_indices, D2_indices)
+        elif self.log:
+            print('- Reusing the stiffness matrix factorization')
 
-                    # The Kg stiffness matrices are in `coo` format from construction. They will be converted to `csr` format for efficient addition. Note that the `+` operator performs matrix addition on `csr` matrices.
-                    if log: print('- Summing initial & geometric stiffness matrices')
-                    K11 = K11 + Kg11.tocsr()
-                    K12 = K12 + Kg12.tocsr()
-                    K21 = K21 + Kg21.tocsr()
-                    K22 = K22 + Kg22.tocsr()
+        return model.K11_factorization
 
-            # Determine if the user has selected a dense solution
-            else:
+    def store(self, D1: NDArray[float64], D2: NDArray[float64], add: bool = False) -> None:
+        """Stores the displacements for the load combination, or adds them to the stored ones if `add` is True."""
+        combo = self.model.load_combos[self.combo_name]
+        if add:
+            _sum_displacements(self.model, D1, D2, self.D1_indices, self.D2_indices, combo)
+        else:
+            _store_displacements(self.model, D1, D2, self.D1_indices, self.D2_indices, combo)
+
+    def check_TC(self, spring_tolerance: float = 0, member_tolerance: float = 0) -> bool:
+        """Updates the tension/compression-only elements from the stored displacements and returns True if none of them changed (see `_check_TC_convergence`)."""
+        return _check_TC_convergence(self.model, self.combo_name, self.log, spring_tolerance, member_tolerance)
+
+    def geometric_stiffness(self) -> Tuple:
+        """Returns the partitioned geometric stiffness matrices `Kg11` and `Kg12` for the member axial forces from the stored displacements."""
+        if self.log:
+            print('- Calculating geometric stiffness matrix')
+        Kg11, Kg12, Kg21, Kg22 = _partition(self.model, self.model.Kg(self.combo_name, self.log, self.sparse, False), self.D1_indices, self.D2_indices)
+        return Kg11, Kg12
+
+    def record_stats(self, stats: List[Dict[str, float]]) -> None:
+        """Records the iteration statistics of an iterative solve (see `_record_solver_stats`)."""
+        _record_solver_stats(self.model, self.combo_name, stats, self.log)
+
+
+def _solve_load_steps(combo: _ModelCombo, P1: NDArray[float64], FER1: NDArray[float64], D2: NDArray[float64], num_steps: int = 1, max_iter: int = 30, spring_tolerance: float = 0, member_tolerance: float = 0, solver: str | None = None, max_rank: int = 96) -> None:
+    """Applies a load combination in equal load steps. Each load step is repeated until the tension/compression-only elements have converged, undoing it each time they change.
+
+    :param combo: The load combination being solved (a `_ModelCombo`, or an equivalent object from `ParallelAnalysis`).
+    :type combo: _ModelCombo
+    :param P1: The partitioned nodal load vector.
+    :type P1: NDArray[float64]
+    :param FER1: The partitioned fixed end reaction vector.
+    :type FER1: NDArray[float64]
+    :param D2: The enforced displacements.
+    :type D2: NDArray[float64]
+    :param num_steps: The number of load steps. Defaults to 1.
+    :type num_steps: int, optional
+    :param max_iter: The maximum number of tension/compression-only iterations per load step. Defaults to 30.
+    :type max_iter: int, optional
+    :param spring_tolerance: Convergence tolerance for tension/compression-only springs. Defaults to 0.
+    :type spring_tolerance: float, optional
+    :param member_tolerance: Convergence tolerance for tension/compression-only members. Defaults to 0.
+    :type member_tolerance: float, optional
+    :param solver: None or 'banded', as for `FEModel3D.analyze`. Defaults to None.
+    :type solver: str, optional
+    :param max_rank: The largest number of changed degrees of freedom handled with a low-rank correction (see `_update_factorization`). Defaults to 96.
+    :type max_rank: int, optional
+    :raises Exception: Occurs when a load step fails to converge.
+    """
 
-                if solution_step == 1:
+    log = combo.log
 
-                    # Calculate the partitioned initial stiffness matrices. These matrices must be recalculated on each T/C iteration due to tension/compression-only members deactivating or reactivating.
-                    K11, K12, K21, K22 = _partition(model, model.K(combo_name, log, check_stability, sparse), D1_indices, D2_indices)
+    # Calculate the load and enforced displacement increments
+    Delta_P1, Delta_FER1, Delta_D2 = P1/num_steps, FER1/num_steps, D2/num_steps
 
-                # Check if we are ready to calculate the geometric stiffness
-                if solution_step == 2:
+    # Apply the load incrementally
+    load_step = 1
+    while load_step <= num_steps:
 
-                    # After the first iteration, the geometric stiffness matrix will be added to the linear elastic stiffness matrix.
-                    Kg11, Kg12, Kg21, Kg22 = _partition(model.Kg(combo_name, log, sparse, False), D1_indices, D2_indices)
+        # Keep track of the number of iterations in this load step
+        iter_count = 1
+        convergence = False
 
-                    K11 = K11 + Kg11
-                    K12 = K12 + Kg12
-                    K21 = K21 + Kg21
-                    K22 = K22 + Kg22
+        # Iterate until convergence or divergence occurs
+        while convergence == False:
 
-            # Calculate the global displacement vector
+            # Check for tension/compression-only divergence
+            if iter_count > max_iter:
+                raise Exception('Model diverged during tension/compression-only analysis')
+
+            # Report which load step we are on
             if log:
-                print('- Calculating the global displacement vector')
-            if K11.shape == (0, 0):
-                # All displacements are known, so D1 is an empty vector
-                D1 = []
+                print(f'- Analyzing load step #{str(load_step)}')
+
+            # Calculate the unknown displacements Delta_D1. Load combinations and iterations that leave the same tension/compression-only elements active share one factorization, and small changes are applied as a low-rank update to it.
+            factorization = combo.factorization(solver, max_rank)
+            Delta_D1 = factorization.solve(subtract(subtract(Delta_P1, Delta_FER1), factorization.K12 @ Delta_D2))
+
+            # Store or sum the calculated displacements
+            combo.store(Delta_D1, Delta_D2, add=load_step > 1)
+
+            # Check for tension/compression-only convergence at this load step
+            convergence = combo.check_TC(spring_tolerance, member_tolerance)
+
+            if convergence == False:
+
+                if log:
+                    print(f'- Undoing load step #{load_step} due to failed convergence.')
+
+                # Undo the latest analysis step to prepare for re-analysis of the load step
+                combo.store(-Delta_D1, -Delta_D2, add=True)
+
             else:
-                try:
-                    # Calculate the displacements, `D1`
-                    if sparse == True:
-                        # The partitioned stiffness matrix is already in `csr` format. The `@` operator performs matrix multiplication on sparse matrices.
-                        D1 = spsolve(K11.tocsr(), subtract(subtract(P1, FER1), K12.tocsr() @ D2))
-                        D1 = D1.reshape(len(D1), 1)
-                    else:
-                        # The partitioned stiffness matrix is in `csr` format. It will be converted to a 2D dense array for mathematical operations.
-                        D1 = solve(K11, subtract(subtract(P1, FER1), matmul(K12, D2)))
-
-                except:
-                    # Return out of the method if 'K' is singular and provide an error message
-                    raise ValueError('The stiffness matrix is singular, which indicates that the structure is unstable.')
-
-            # Store the calculated displacements
-            _store_displacements(model, D1, D2, D1_indices, D2_indices, model.load_combos[combo_name])
+                # Move on to the next load step
+                load_step += 1
 
-        # Check whether the tension/compression-only analysis has converged and deactivate any members that are showing forces they can't hold
-        convergence_TC = _check_TC_convergence(model, combo_name, log)
+            # Keep track of the number of tension/compression only iterations
+            iter_count += 1
 
-        # Report on convergence of tension/compression only analysis
-        if convergence_TC == False:
 
-            if log:
-                print('- Tension/compression-only analysis did not converge on this iteration')
-                print('- Tension/compression-only members will be deactivated or reactivated as necessary')
-                print('- P-Delta analysis will be rerun')
+def _solve_PDelta(combo: _ModelCombo, P1: NDArray[float64], FER1: NDArray[float64], D2: NDArray[float64], max_iter: int = 30, solver: str | None = None, preconditioner: str = 'jacobi', tolerance: float = 1e-8) -> None:
+    """Solves a load combination with the two step P-Delta method, repeated until the tension/compression-only elements have converged.
 
-            # Increment the tension/compression-only iteration count
-            iter_count_TC += 1
+    :param combo: The load combination being solved (a `_ModelCombo`, or an equivalent object from `ParallelAnalysis`).
+    :type combo: _ModelCombo
+    :param P1: The partitioned nodal load vector.
+    :type P1: NDArray[float64]
+    :param FER1: The partitioned fixed end reaction vector.
+    :type FER1: NDArray[float64]
+    :param D2: The enforced displacements.
+    :type D2: NDArray[float64]
+    :param max_iter: The maximum number of tension/compression-only iterations. Defaults to 30.
+    :type max_iter: int, optional
+    :param solver: None or 'pcg', as for `_PDelta`. Defaults to None.
+    :type solver: str, optional
+    :param preconditioner: The preconditioner used when `solver` is 'pcg'. Defaults to 'jacobi'.
+    :type preconditioner: str, optional
+    :param tolerance: The relative residual tolerance used when `solver` is 'pcg'. Defaults to 1e-8.
+    :type tolerance: float, optional
+    :raises Exception: Occurs when the tension/compression-only iteration fails to converge.
+    """
+
+    log = combo.log
+    iter_count_TC = 1
+
+    # Iterate until either T/C convergence or divergence occurs
+    while True:
+
+        # Inform the user which iteration we're on
+        if log:
+            print('- Beginning tension/compression-only iteration #' + str(iter_count_TC))
 
+        # Step 1 - Analyze based on the initial stiffness. The initial stiffness matrix must be recalculated on each T/C iteration due to tension/compression-only members deactivating or reactivating, but it is only rebuilt when the set of active elements has actually changed. Otherwise the stored factorization (from a previous load combination or iteration) is reused.
+        initial = combo.factorization(solver, 0, preconditioner, tolerance)
+        if log:
+            print('- Calculating the global displacement vector')
+        D1 = initial.solve(subtract(subtract(P1, FER1), initial.K12 @ D2))
+        if solver == 'pcg':
+            combo.record_stats(initial.stats)
+        combo.store(D1, D2)
+
+        # Step 2 - Add the geometric stiffness from the step 1 axial forces to the initial stiffness
+        Kg11, Kg12 = combo.geometric_stiffness()
+        if log:
+            print('- Summing initial & geometric stiffness matrices')
+        K11 = initial.K11 + Kg11
+        K12 = initial.K12 + Kg12
+
+        # The combined stiffness matrix is specific to this load combination, so it is not stored. That leaves the initial stiffness factorization available for the next load combination.
+        if solver == 'pcg':
+            factorization = IterativeStiffnessSolver(K11, combo.D1_indices, preconditioner=preconditioner, tolerance=tolerance, x0=initial.x0)
         else:
+            # The geometric stiffness is usually a small change to the initial stiffness, so the initial stiffness factorization is a very strong preconditioner for the combined matrix. Conjugate gradients started from the step 1 displacements normally converge in a few iterations, which avoids factorizing the combined matrix for every load combination. If they don't, the combined matrix is factorized.
+            factorization = IterativeStiffnessSolver(K11, combo.D1_indices, preconditioner=initial, tolerance=1e-12, max_iter=_PDELTA_REUSE_ITERATIONS, x0=D1)
+
+        # Calculate the global displacement vector
+        if log:
+            print('- Calculating the global displacement vector')
+        RHS = subtract(subtract(P1, FER1), K12 @ D2)
+        try:
+            D1 = factorization.solve(RHS)
+        except ConvergenceError:
+            if solver == 'pcg':
+                raise
+            if log:
+                print('- Factorizing the combined stiffness matrix')
+            factorization = StiffnessFactorization(K11, combo.D1_indices, combo.sparse, permc_spec=combo.permc_spec)
+            D1 = factorization.solve(RHS)
+
+        # Record the iteration counts, and pass the latest displacements on as the starting point for the next solve
+        if solver == 'pcg':
+            combo.record_stats(factorization.stats)
+            initial.x0 = factorization.x0
+
+        # Store the calculated displacements
+        combo.store(D1, D2)
+
+        # Check whether the tension/compression-only analysis has converged and deactivate any members that are showing forces they can't hold
+        if combo.check_TC():
             if log:
                 print('- Tension/compression-only analysis converged after ' + str(iter_count_TC) + ' iteration(s)')
+            break
+
+        if log:
+            print('- Tension/compression-only analysis did not converge on this iteration')
+            print('- Tension/compression-only members will be deactivated or reactivated as necessary')
+            print('- P-Delta analysis will be rerun')
 
         # Check for divergence in the tension/compression-only analysis
+        iter_count_TC += 1
         if iter_count_TC > max_iter:
-            divergence_TC = True
             raise Exception('- Model diverged during tension/compression-only analysis')
 
-    # Flag the model as solved
-    model.solution = 'P-Delta'
-
 
 def _pushover_step(model: FEModel3D, combo_name: str, push_combo: str, step_num: int, P1: NDArray[float64], FER1: NDArray[float64], D1_indices: List[int], D2_indices: List[int], D2: NDArray[float64], log: bool = True, sparse: bool = True, check_stability: bool = False) -> None:
 
@@ -356,7 +751,7 @@ def _pushover_step(model: FEModel3D, combo_name: str, push_combo: str, step_num:
             # Geometric stiffness matrix
             # The `combo_name` variable in the code below is not the name of the pushover load combination. Rather it is the name of the primary combination that the pushover load will be added to. Axial loads used to develop Kg are calculated from the displacements stored in `combo_name`.
             if log: print('Calculating geometric stiffness matrix [Kg]')
-            Kg11, Kg12, Kg21, Kg22 = _partition(model.Kg(combo_name, log, sparse, False), D1_indices, D2_indices)
+            Kg11, Kg12, Kg21, Kg22 = _partition(model, model.Kg(combo_name, log, sparse, False), D1_indices, D2_indices)
 
             # Calculate the stiffness reduction matrix
             if log: print('Calculating plastic reduction matrix [Km]')
@@ -454,26 +849,15 @@ def _unpartition_disp(model: FEModel3D, D1: NDArray[float64], D2: NDArray[float6
 
     D = zeros((len(model.nodes)*6, 1))
 
-    # Step through each node in the model
-    for node in model.nodes.values():
+    # Scatter the calculated and enforced displacements back to their global degrees of freedom
+    D[D1_indices] = asarray(D1).reshape(-1, 1)
+    D[D2_indices] = asarray(D2).reshape(-1, 1)
 
-        # Step through each degree of freedom at the node
-        for i in range(6):
-
-            # Check if the dof is in the list of enforced displacements
-            if node.ID*6 + i in D2_indices:
-                # Get the enforced displacement
-                D[(node.ID*6 + i, 0)] = D2[D2_indices.index(node.ID*6 + i), 0]
-            else:
-                # Get the calculated displacement
-                D[(node.ID*6 + i, 0)] = D1[D1_indices.index(node.ID*6 + i), 0]
-
-    # Return the displacement vector
     return D
 
 
 def _store_displacements(model: FEModel3D, D1: NDArray[float64], D2: NDArray[float64], D1_indices: List[int], D2_indices: List[int], combo: LoadCombo) -> None:
-    """Stores calculated displacements from the solver into the model's displacement vector `_D` and into each node object in the model
+    """Stores calculated displacements from the solver into the model's displacement matrix `_D`, which the nodes read their displacements from
 
     :param model: The finite element model being evaluated.
     :type model: FEModel3D
@@ -494,19 +878,9 @@ def _store_displacements(model: FEModel3D, D1: NDArray[float64], D2: NDArray[flo
 
     if combo != None:
 
-        # Store the displacements in the model's global displacement vector
+        # Store the displacements in the load combination's column of the model's displacement matrix
         model._D[combo.name] = D
 
-        # Store the calculated global nodal displacements into each node object
-        for node in model.nodes.values():
-
-            node.DX[combo.name] = D[node.ID*6 + 0, 0]
-            node.DY[combo.name] = D[node.ID*6 + 1, 0]
-            node.DZ[combo.name] = D[node.ID*6 + 2, 0]
-            node.RX[combo.name] = D[node.ID*6 + 3, 0]
-            node.RY[combo.name] = D[node.ID*6 + 4, 0]
-            node.RZ[combo.name] = D[node.ID*6 + 5, 0]
-
 
 def _sum_displacements(model: FEModel3D, Delta_D1: NDArray[float64], Delta_D2: NDArray[float64], D1_indices: List[int], D2_indices: List[int], combo: LoadCombo) -> None:
     """Sums calculated displacements for a load step from the solver into the model's displacement vector `_D` and into each node object in the model.
@@ -528,18 +902,40 @@ def _sum_displacements(model: FEModel3D, Delta_D1: NDArray[float64], Delta_D2: N
     # The raw results from the solver are partitioned. Unpartition them.
     Delta_D = _unpartition_disp(model, Delta_D1, Delta_D2, D1_indices, D2_indices)
 
-    # Sum the load step's global displacement vector with the model's global displacement vector
+    # Sum the load step's global displacement vector with the model's global displacement vector. The nodes read their displacements from it.
     model._D[combo.name] += Delta_D
 
-    # Sum the load step's calculated global nodal displacements to each node object's global displacement
-    for node in model.nodes.values():
+def _node_springs_active(displacement: NDArray[float64], sign: NDArray[float64], tolerance: float = 0) -> NDArray:
+    """Returns which tension/compression-only node support springs should be active for the given displacements.
+
+    :param displacement: The displacement at each spring.
+    :type displacement: NDArray[float64]
+    :param sign: +1 for springs that act for positive displacements ('+'), and -1 for springs that act for negative displacements ('-').
+    :type sign: NDArray[float64]
+    :param tolerance: The displacement a spring must reach in its active direction before it is switched on. Defaults to 0.
+    :type tolerance: float, optional
+    :return: A boolean array, True where the spring should be active.
+    :rtype: NDArray[bool]
+    """
+    return ((sign < 0) & (displacement <= -tolerance)) | ((sign > 0) & (displacement >= tolerance))
+
+
+def _TC_deactivated(tension_only: NDArray, P_max: NDArray[float64], P_min: NDArray[float64], tolerance: float = 0) -> NDArray:
+    """Returns which active tension/compression-only springs or members must be deactivated. Axial forces are positive in compression, so tension-only elements are deactivated when their largest axial force exceeds `tolerance`, and compression-only elements when their smallest axial force is below `-tolerance`.
+
+    :param tension_only: True for tension-only elements, False for compression-only elements.
+    :type tension_only: NDArray[bool]
+    :param P_max: The largest axial force in each element.
+    :type P_max: NDArray[float64]
+    :param P_min: The smallest axial force in each element.
+    :type P_min: NDArray[float64]
+    :param tolerance: The axial force tolerance. Defaults to 0.
+    :type tolerance: float, optional
+    :return: A boolean array, True where the element must be deactivated.
+    :rtype: NDArray[bool]
+    """
+    return (tension_only & (P_max > tolerance)) | (~tension_only & (P_min < -tolerance))
 
-        node.DX[combo.name] += Delta_D[node.ID*6 + 0, 0]
-        node.DY[combo.name] += Delta_D[node.ID*6 + 1, 0]
-        node.DZ[combo.name] += Delta_D[node.ID*6 + 2, 0]
-        node.RX[combo.name] += Delta_D[node.ID*6 + 3, 0]
-        node.RY[combo.name] += Delta_D[node.ID*6 + 4, 0]
-        node.RZ[combo.name] += Delta_D[node.ID*6 + 5, 0]
 
 def _check_TC_convergence(model: FEModel3D, combo_name: str = "Combo 1", log: bool = True, spring_tolerance: float = 0, member_tolerance: float = 0) -> bool:
     """Checks for convergence in tension-only and compression-only analysis.
@@ -562,8 +958,8 @@ def _check_TC_convergence(model: FEModel3D, combo_name: str = "Combo 1", log: bo
         that physical member and all its sub-members are deactivated. This action
         flags the analysis as not converged. A future enhancement is noted to allow elements to
         reactivate if deformations indicate they should return to an active state.
-    *   **Sub-member Reset**: After checking, the `_solved_combo` flag for all sub-members is
-        reset to `None`. This ensures that they will be resegmented and re-evaluated in subsequent
+    *   **Sub-member Reset**: After checking, the segments of all sub-members are reset (the
+        `_solved_combo` flag is set to `None` and any cached segments are discarded). This ensures that they will be resegmented and re-evaluated in subsequent
         iterations of the analysis, allowing for further changes as needed for convergence.
 
     :param model: The finite element model currently being evaluated.
@@ -595,23 +991,24 @@ def _check_TC_convergence(model: FEModel3D, combo_name: str = "Combo 1", log: bo
     if log:
         print("- Checking for tension/compression-only support spring convergence")
 
-    # Loop through each node and each directional spring to check and update their active status
+    # Gather the tension/compression-only node support springs. `+1` springs act for positive displacements and `-1` springs for negative ones.
+    node_springs, displacements, signs = [], [], []
     for node in model.nodes.values():
 
         for direction in ["DX", "DY", "DZ", "RX", "RY", "RZ"]:
             spring = getattr(node, f"spring_{direction}")
-            displacement = getattr(node, direction)[combo_name]
 
             if spring[1] is not None:
-                # Determine if the spring should be active based on its designation ('+' or '-') and the displacement
-                should_be_active = (
-                    spring[1] == "-" and displacement <= -spring_tolerance
-                ) or (spring[1] == "+" and displacement >= spring_tolerance)
+                node_springs.append(spring)
+                displacements.append(getattr(node, direction)[combo_name])
+                signs.append(1.0 if spring[1] == "+" else -1.0)
 
-                # Check if there's a need to switch the active state of the spring
-                if spring[2] != should_be_active:
-                    spring[2] = should_be_active
-                    convergence = False
+    # Switch each spring on or off to match the direction of its displacement
+    should_be_active = _node_springs_active(array(displacements, dtype=float), array(signs, dtype=float), spring_tolerance)
+    for spring, active in zip(node_springs, should_be_active):
+        if spring[2] != active:
+            spring[2] = bool(active)
+            convergence = False
 
     # TODO: Adjust the code below to allow elements to reactivate on subsequent iterations if deformations at element nodes indicate the member goes back into an active state. This will lead to a less conservative and more realistic analysis. Nodal springs (above) already do this.
 
@@ -619,65 +1016,40 @@ def _check_TC_convergence(model: FEModel3D, combo_name: str = "Combo 1", log: bo
     if log:
         print('- Checking for tension/compression-only spring convergence')
 
-    for spring in model.springs.values():
-
-        if spring.active[combo_name] == True:
-
-            # Check if tension-only conditions exist
-            if (spring.tension_only == True) and (spring.axial(combo_name) > spring_tolerance):
-                if log:
-                    print(f'- Deactivating spring {spring.name}')
-                spring.active[combo_name] = False
-                convergence = False
-
-            # Check if compression-only conditions exist
-            elif (spring.comp_only == True) and (spring.axial(combo_name) < -spring_tolerance):
-                if log:
-                    print(f'- Deactivating spring {spring.name}')
-                spring.active[combo_name] = False
-                convergence = False
+    springs = [spring for spring in model.springs.values() if spring.active[combo_name] == True and (spring.tension_only or spring.comp_only)]
+    axial = array([spring.axial(combo_name) for spring in springs], dtype=float)
+    tension_only = array([spring.tension_only for spring in springs], dtype=bool)
+    for spring in compress(springs, _TC_deactivated(tension_only, axial, axial, spring_tolerance)):
+        if log:
+            print(f'- Deactivating spring {spring.name}')
+        spring.active[combo_name] = False
+        convergence = False
 
-    # Check tension/compression only members
+    # Check tension/compression only members. Only the largest (tension-only) or smallest (compression-only) axial force is needed for each member.
     if log:
         print('- Checking for tension/compression-only member convergence')
-    for phys_member in model.members.values():
 
-        # Only run the tension/compression only check if the member is still active
-        if phys_member.active[combo_name] == True:
+    phys_members = [phys_member for phys_member in model.members.values() if phys_member.active[combo_name] == True and (phys_member.tension_only or phys_member.comp_only)]
+    axial = array([phys_member.max_axial(combo_name) if phys_member.tension_only else phys_member.min_axial(combo_name) for phys_member in phys_members], dtype=float)
+    tension_only = array([phys_member.tension_only for phys_member in phys_members], dtype=bool)
+    for phys_member in compress(phys_members, _TC_deactivated(tension_only, axial, axial, member_tolerance)):
 
-            # Check if a tension-only conditions exist
-            if phys_member.tension_only == True and phys_member.max_axial(combo_name) > member_tolerance:
-
-                # Deactivate the physical member
-                if log:
-                    print(f'- Deactivating member {phys_member.name}')
-                phys_member.active[combo_name] = False
-
-                # Deactivate all the sub-members
-                for sub_member in phys_member.sub_members.values():
-                    sub_member.active[combo_name] = False
-
-                # Flag the analysis as not converged
-                convergence = False
-
-            # Check if a compression-only conditions exist
-            elif phys_member.comp_only == True and phys_member.min_axial(combo_name) < - member_tolerance:
-
-                # Deactivate the physical member
-                if log:
-                    print(f'- Deactivating member {phys_member.name}')
-                phys_member.active[combo_name] = False
+        # Deactivate the physical member
+        if log:
+            print(f'- Deactivating member {phys_member.name}')
+        phys_member.active[combo_name] = False
 
-                # Deactivate all the sub-members
-                for sub_member in phys_member.sub_members.values():
-                    sub_member.active[combo_name] = False
+        # Deactivate all the sub-members
+        for sub_member in phys_member.sub_members.values():
+            sub_member.active[combo_name] = False
 
-                # Flag the analysis as not converged
-                convergence = False
+        # Flag the analysis as not converged
+        convergence = False
 
-        # Reset the sub-member's flag to unsolved. This will allow it to resolve for the same load combination after subsequent iterations have made further changes.
+    # Reset the sub-members' flag to unsolved. This will allow them to resolve for the same load combination after subsequent iterations have made further changes.
+    for phys_member in model.members.values():
         for sub_member in phys_member.sub_members.values():
-            sub_member._solved_combo = None
+            sub_member._reset_segments()
 
     # Return whether the TC analysis has converged
     return convergence
@@ -687,6 +1059,8 @@ def _calc_reactions(model: FEModel3D, log: bool = False, combo_tags: List[str] |
     """
     Calculates reactions internally once the model is solved.
 
+    Reactions are recovered directly from the partitioned global matrices as ``K21*D1 + K22*D2 - P2 + FER2`` for every load combination at once, rather than by summing element end forces node by node. Load combinations that share a stiffness state (see `_stiffness_state`) share a single stiffness matrix. For P-Delta solutions each load combination's geometric stiffness matrix is added, which is consistent with the member end forces reported by `Member3D.f`.
+
     Parameters
     ----------
     model : FEModel3D
@@ -703,241 +1077,62 @@ def _calc_reactions(model: FEModel3D, log: bool = False, combo_tags: List[str] |
 
     # Identify which load combinations to evaluate
     combo_list = _identify_combos(model, combo_tags)
+    if not combo_list:
+        return
 
-    # Calculate the reactions node by node
-    for node in model.nodes.values():
+    n_dofs = len(model.nodes)*6
+    D1_indices, D2_indices, _ = _partition_D(model)
 
-        # Step through each load combination
-        for combo in combo_list:
-
-            # Initialize reactions for this node and load combination
-            node.RxnFX[combo.name] = 0.0
-            node.RxnFY[combo.name] = 0.0
-            node.RxnFZ[combo.name] = 0.0
-            node.RxnMX[combo.name] = 0.0
-            node.RxnMY[combo.name] = 0.0
-            node.RxnMZ[combo.name] = 0.0
+    # Gather the displacements for every load combination as the columns of a single matrix
+    combo_names = [combo.name for combo in combo_list]
+    D = model._D.matrix(combo_names)
 
-            # Determine if the node has any supports
-            if (node.support_DX or node.support_DY or node.support_DZ
-            or  node.support_RX or node.support_RY or node.support_RZ):
-
-                # Sum the spring end forces at the node
-                for spring in model.springs.values():
+    # Gather the applied nodal loads and fixed end reactions at the supported degrees of freedom
+    P, FER = model._load_vectors(combo_names)
+    P2, FER2 = P[D2_indices, :], FER[D2_indices, :]
 
-                    if spring.i_node == node and spring.active[combo.name] == True:
+    # Calculate `K21*D1 + K22*D2` for each group of load combinations that share a stiffness matrix
+    K2_D = zeros((len(D2_indices), len(combo_list)))
+    groups = {}
+    for j, combo in enumerate(combo_list):
+        groups.setdefault(_stiffness_state(model, combo.name), []).append(j)
 
-                        # Get the spring's global force matrix
-                        # Storing it as a local variable eliminates the need to rebuild it every time a term is needed
-                        spring_F = spring.F(combo.name)
+    for state, columns in groups.items():
 
-                        if node.support_DX: node.RxnFX[combo.name] += spring_F[0, 0]
-                        if node.support_DY: node.RxnFY[combo.name] += spring_F[1, 0]
-                        if node.support_DZ: node.RxnFZ[combo.name] += spring_F[2, 0]
-                        if node.support_RX: node.RxnMX[combo.name] += spring_F[3, 0]
-                        if node.support_RY: node.RxnMY[combo.name] += spring_F[4, 0]
-                        if node.support_RZ: node.RxnMZ[combo.name] += spring_F[5, 0]
-
-                    elif spring.j_node == node and spring.active[combo.name] == True:
-
-                        # Get the spring's global force matrix
-                        # Storing it as a local variable eliminates the need to rebuild it every time a term is needed
-                        spring_F = spring.F(combo.name)
+        # Reuse the partitions stored with the model's factorization if it was built for this stiffness state
+        factorization = model.K11_factorization
+        if factorization is not None and factorization.matches(state) and factorization.K21 is not None:
+            K21, K22 = factorization.K21, factorization.K22
+        else:
+            K21, K22 = _partition(model, model.K(combo_list[columns[0]].name, log=False, check_stability=False, sparse=True), D1_indices, D2_indices)[2:]
+
+        K2_D[:, columns] = K21 @ D[D1_indices][:, columns] + K22 @ D[D2_indices][:, columns]
+
+    # P-Delta member end forces include the geometric stiffness of each member for each load combination
+    if model.solution == 'P-Delta':
+        for j, combo in enumerate(combo_list):
+            Kg2 = model.Kg(combo.name, log=False, sparse=True, first_step=False).tocsr()[D2_indices, :]
+            K2_D[:, j] += Kg2 @ D[:, j]
+
+    # Build the stiffness vector of the active nodal spring supports
+    k_springs = zeros(n_dofs)
+    for node in model.nodes.values():
+        for dof, spring in enumerate((node.spring_DX, node.spring_DY, node.spring_DZ, node.spring_RX, node.spring_RY, node.spring_RZ)):
+            if spring[0] is not None and spring[2] == True:
+                k_springs[node.ID*6 + dof] = float(spring[0])
 
-                        if node.support_DX: node.RxnFX[combo.name] += spring_F[6, 0]
-                        if node.support_DY: node.RxnFY[combo.name] += spring_F[7, 0]
-                        if node.support_DZ: node.RxnFZ[combo.name] += spring_F[8, 0]
-                        if node.support_RX: node.RxnMX[combo.name] += spring_F[9, 0]
-                        if node.support_RY: node.RxnMY[combo.name] += spring_F[10, 0]
-                        if node.support_RZ: node.RxnMZ[combo.name] += spring_F[11, 0]
-
-                # Step through each physical member in the model
-                for phys_member in model.members.values():
-
-                    # Sum the sub-member end forces at the node
-                    for member in phys_member.sub_members.values():
+    # The reactions at supports are the element end forces less the applied loads. Nodal springs are included in `K`, so their contribution is removed here and reported separately below.
+    R = zeros((n_dofs, len(combo_list)))
+    R[D2_indices] = K2_D - k_springs[D2_indices, None]*D[D2_indices] - P2 + FER2
 
-                        if member.i_node == node and phys_member.active[combo.name] == True:
-
-                            # Get the member's global force matrix
-                            # Storing it as a local variable eliminates the need to rebuild it every time a term is needed
-                            member_F = member.F(combo.name)
-
-                            if node.support_DX: node.RxnFX[combo.name] += member_F[0, 0]
-                            if node.support_DY: node.RxnFY[combo.name] += member_F[1, 0]
-                            if node.support_DZ: node.RxnFZ[combo.name] += member_F[2, 0]
-                            if node.support_RX: node.RxnMX[combo.name] += member_F[3, 0]
-                            if node.support_RY: node.RxnMY[combo.name] += member_F[4, 0]
-                            if node.support_RZ: node.RxnMZ[combo.name] += member_F[5, 0]
-
-                        elif member.j_node == node and phys_member.active[combo.name] == True:
-
-                            # Get the member's global force matrix
-                            # Storing it as a local variable eliminates the need to rebuild it every time a term is needed
-                            member_F = member.F(combo.name)
-
-                            if node.support_DX: node.RxnFX[combo.name] += member_F[6, 0]
-                            if node.support_DY: node.RxnFY[combo.name] += member_F[7, 0]
-                            if node.support_DZ: node.RxnFZ[combo.name] += member_F[8, 0]
-                            if node.support_RX: node.RxnMX[combo.name] += member_F[9, 0]
-                            if node.support_RY: node.RxnMY[combo.name] += member_F[10, 0]
-                            if node.support_RZ: node.RxnMZ[combo.name] += member_F[11, 0]
-
-                # Sum the plate forces at the node
-                for plate in model.plates.values():
-
-                    if plate.i_node == node:
-
-                        # Get the plate's global force matrix
-                        # Storing it as a local variable eliminates the need to rebuild it every time a term is needed
-                        plate_F = plate.F(combo.name)
-
-                        if node.support_DX: node.RxnFX[combo.name] += plate_F[0, 0]
-                        if node.support_DY: node.RxnFY[combo.name] += plate_F[1, 0]
-                        if node.support_DZ: node.RxnFZ[combo.name] += plate_F[2, 0]
-                        if node.support_RX: node.RxnMX[combo.name] += plate_F[3, 0]
-                        if node.support_RY: node.RxnMY[combo.name] += plate_F[4, 0]
-                        if node.support_RZ: node.RxnMZ[combo.name] += plate_F[5, 0]
-
-                    elif plate.j_node == node:
+    # Only supported degrees of freedom carry a support reaction. Degrees of freedom with an enforced displacement but no support do not.
+    R[~model._supports.reshape(-1)] = 0.0
 
-                        # Get the plate's global force matrix
-                        # Storing it as a local variable eliminates the need to rebuild it every time a term is needed
-                        plate_F = plate.F(combo.name)
-
-                        if node.support_DX: node.RxnFX[combo.name] += plate_F[6, 0]
-                        if node.support_DY: node.RxnFY[combo.name] += plate_F[7, 0]
-                        if node.support_DZ: node.RxnFZ[combo.name] += plate_F[8, 0]
-                        if node.support_RX: node.RxnMX[combo.name] += plate_F[9, 0]
-                        if node.support_RY: node.RxnMY[combo.name] += plate_F[10, 0]
-                        if node.support_RZ: node.RxnMZ[combo.name] += plate_F[11, 0]
-
-                    elif plate.m_node == node:
-
-                        # Get the plate's global force matrix
-                        # Storing it as a local variable eliminates the need to rebuild it every time a term is needed
-                        plate_F = plate.F(combo.name)
-
-                        if node.support_DX: node.RxnFX[combo.name] += plate_F[12, 0]
-                        if node.support_DY: node.RxnFY[combo.name] += plate_F[13, 0]
-                        if node.support_DZ: node.RxnFZ[combo.name] += plate_F[14, 0]
-                        if node.support_RX: node.RxnMX[combo.name] += plate_F[15, 0]
-                        if node.support_RY: node.RxnMY[combo.name] += plate_F[16, 0]
-                        if node.support_RZ: node.RxnMZ[combo.name] += plate_F[17, 0]
-
-                    elif plate.n_node == node:
-
-                        # Get the plate's global force matrix
-                        # Storing it as a local variable eliminates the need to rebuild it every time a term is needed
-                        plate_F = plate.F(combo.name)
-
-                        if node.support_DX: node.RxnFX[combo.name] += plate_F[18, 0]
-                        if node.support_DY: node.RxnFY[combo.name] += plate_F[19, 0]
-                        if node.support_DZ: node.RxnFZ[combo.name] += plate_F[20, 0]
-                        if node.support_RX: node.RxnMX[combo.name] += plate_F[21, 0]
-                        if node.support_RY: node.RxnMY[combo.name] += plate_F[22, 0]
-                        if node.support_RZ: node.RxnMZ[combo.name] += plate_F[23, 0]
-
-                # Sum the quad forces at the node
-                for quad in model.quads.values():
-
-                    if quad.i_node == node:
-
-                        # Get the quad's global force matrix
-                        # Storing it as a local variable eliminates the need to rebuild it every time a term is needed
-                        quad_F = quad.F(combo.name)
-
-                        if node.support_DX: node.RxnFX[combo.name] += quad_F[0, 0]
-                        if node.support_DY: node.RxnFY[combo.name] += quad_F[1, 0]
-                        if node.support_DZ: node.RxnFZ[combo.name] += quad_F[2, 0]
-                        if node.support_RX: node.RxnMX[combo.name] += quad_F[3, 0]
-                        if node.support_RY: node.RxnMY[combo.name] += quad_F[4, 0]
-                        if node.support_RZ: node.RxnMZ[combo.name] += quad_F[5, 0]
-
-                    elif quad.j_node == node:
-
-                        # Get the quad's global force matrix
-                        # Storing it as a local variable eliminates the need to rebuild it every time a term is needed
-                        quad_F = quad.F(combo.name)
-
-                        if node.support_DX: node.RxnFX[combo.name] += quad_F[6, 0]
-                        if node.support_DY: node.RxnFY[combo.name] += quad_F[7, 0]
-                        if node.support_DZ: node.RxnFZ[combo.name] += quad_F[8, 0]
-                        if node.support_RX: node.RxnMX[combo.name] += quad_F[9, 0]
-                        if node.support_RY: node.RxnMY[combo.name] += quad_F[10, 0]
-                        if node.support_RZ: node.RxnMZ[combo.name] += quad_F[11, 0]
-
-                    elif quad.m_node == node:
-
-                        # Get the quad's global force matrix
-                        # Storing it as a local variable eliminates the need to rebuild it every time a term is needed
-                        quad_F = quad.F(combo.name)
-
-                        if node.support_DX: node.RxnFX[combo.name] += quad_F[12, 0]
-                        if node.support_DY: node.RxnFY[combo.name] += quad_F[13, 0]
-                        if node.support_DZ: node.RxnFZ[combo.name] += quad_F[14, 0]
-                        if node.support_RX: node.RxnMX[combo.name] += quad_F[15, 0]
-                        if node.support_RY: node.RxnMY[combo.name] += quad_F[16, 0]
-                        if node.support_RZ: node.RxnMZ[combo.name] += quad_F[17, 0]
-
-                    elif quad.n_node == node:
-
-                        # Get the quad's global force matrix
-                        # Storing it as a local variable eliminates the need to rebuild it every time a term is needed
-                        quad_F = quad.F(combo.name)
-
-                        if node.support_DX: node.RxnFX[combo.name] += quad_F[18, 0]
-                        if node.support_DY: node.RxnFY[combo.name] += quad_F[19, 0]
-                        if node.support_DZ: node.RxnFZ[combo.name] += quad_F[20, 0]
-                        if node.support_RX: node.RxnMX[combo.name] += quad_F[21, 0]
-                        if node.support_RY: node.RxnMY[combo.name] += quad_F[22, 0]
-                        if node.support_RZ: node.RxnMZ[combo.name] += quad_F[23, 0]
-
-                # Sum the joint loads applied to the node
-                for load in node.NodeLoads:
-
-                    for case, factor in combo.factors.items():
-
-                        if load[2] == case:
-
-                            if load[0] == 'FX' and node.support_DX:
-                                node.RxnFX[combo.name] -= load[1]*factor
-                            elif load[0] == 'FY' and node.support_DY:
-                                node.RxnFY[combo.name] -= load[1]*factor
-                            elif load[0] == 'FZ' and node.support_DZ:
-                                node.RxnFZ[combo.name] -= load[1]*factor
-                            elif load[0] == 'MX' and node.support_RX:
-                                node.RxnMX[combo.name] -= load[1]*factor
-                            elif load[0] == 'MY' and node.support_RY:
-                                node.RxnMY[combo.name] -= load[1]*factor
-                            elif load[0] == 'MZ' and node.support_RZ:
-                                node.RxnMZ[combo.name] -= load[1]*factor
-
-            # Calculate any reactions due to active spring supports at the node
-            if node.spring_DX[0] is not None and node.spring_DX[2] == True:
-                k = float(node.spring_DX[0])
-                DX = node.DX[combo.name]
-                node.RxnFX[combo.name] -= k*DX
-            if node.spring_DY[0] is not None and node.spring_DY[2] == True:
-                k = float(node.spring_DY[0])
-                DY = node.DY[combo.name]
-                node.RxnFY[combo.name] -= k*DY
-            if node.spring_DZ[0] is not None and node.spring_DZ[2] == True:
-                k = float(node.spring_DZ[0])
-                DZ = node.DZ[combo.name]
-                node.RxnFZ[combo.name] -= k*DZ
-            if node.spring_RX[0] is not None and node.spring_RX[2] == True:
-                k = float(node.spring_RX[0])
-                RX = node.RX[combo.name]
-                node.RxnMX[combo.name] -= k*RX
-            if node.spring_RY[0] is not None and node.spring_RY[2] == True:
-                k = float(node.spring_RY[0])
-                RY = node.RY[combo.name]
-                node.RxnMY[combo.name] -= k*RY
-            if node.spring_RZ[0] is not None and node.spring_RZ[2] == True:
-                k = float(node.spring_RZ[0])
-                RZ = node.RZ[combo.name]
-                node.RxnMZ[combo.name] -= k*RZ
+    # Calculate any reactions due to active spring supports
+    R -= k_springs[:, None]*D
+
+    # Store the reactions in the model's reaction matrix, which the nodes read their reactions from
+    model._reactions.set_columns(combo_names, R)
 
 
 def _check_statics(model: FEModel3D, combo_tags: List[str] | None = None) -> None:
@@ -970,58 +1165,42 @@ def _check_statics(model: FEModel3D, combo_tags: List[str] | None = None) -> Non
             if any(tag in combo.combo_tags for tag in combo_tags):
                 combo_list.append(combo)
 
+    # Get the coordinates of every node, ordered by node ID, so that moments can be summed for all nodes at once
+    nodes = model._nodes_by_ID
+    X = array([node.X for node in nodes])
+    Y = array([node.Y for node in nodes])
+    Z = array([node.Z for node in nodes])
+
+    # Get the global force vectors and global fixed end reaction vectors for every load combination at once
+    combo_list = list(combo_list)
+    P, FER = model._load_vectors([combo.name for combo in combo_list])
+
     # Step through each load combination
-    for combo in combo_list:
-
-        # Initialize force and moment summations to zero
-        SumFX, SumFY, SumFZ = 0.0, 0.0, 0.0
-        SumMX, SumMY, SumMZ = 0.0, 0.0, 0.0
-        SumRFX, SumRFY, SumRFZ = 0.0, 0.0, 0.0
-        SumRMX, SumRMY, SumRMZ = 0.0, 0.0, 0.0
-
-        # Get the global force vector and the global fixed end reaction vector
-        P = model.P(combo.name)
-        FER = model.FER(combo.name)
-
-        # Step through each node and sum its forces
-        for node in model.nodes.values():
-
-            # Get the node's coordinates
-            X = node.X
-            Y = node.Y
-            Z = node.Z
-
-            # Get the nodal forces
-            FX = P[node.ID*6+0][0] - FER[node.ID*6+0][0]
-            FY = P[node.ID*6+1][0] - FER[node.ID*6+1][0]
-            FZ = P[node.ID*6+2][0] - FER[node.ID*6+2][0]
-            MX = P[node.ID*6+3][0] - FER[node.ID*6+3][0]
-            MY = P[node.ID*6+4][0] - FER[node.ID*6+4][0]
-            MZ = P[node.ID*6+5][0] - FER[node.ID*6+5][0]
-
-            # Get the nodal reactions
-            RFX = node.RxnFX[combo.name]
-            RFY = node.RxnFY[combo.name]
-            RFZ = node.RxnFZ[combo.name]
-            RMX = node.RxnMX[combo.name]
-            RMY = node.RxnMY[combo.name]
-            RMZ = node.RxnMZ[combo.name]
-
-            # Sum the global forces
-            SumFX += FX
-            SumFY += FY
-            SumFZ += FZ
-            SumMX += MX - FY*Z + FZ*Y
-            SumMY += MY + FX*Z - FZ*X
-            SumMZ += MZ - FX*Y + FY*X
-
-            # Sum the global reactions
-            SumRFX += RFX
-            SumRFY += RFY
-            SumRFZ += RFZ
-            SumRMX += RMX - RFY*Z + RFZ*Y
-            SumRMY += RMY + RFX*Z - RFZ*X
-            SumRMZ += RMZ - RFX*Y + RFY*X
+    for j, combo in enumerate(combo_list):
+
+        # Get the nodal forces from the load combination's columns, one row per node
+        F = (P[:, j] - FER[:, j]).reshape(-1, 6)
+        FX, FY, FZ, MX, MY, MZ = F.T
+
+        # Get the nodal reactions, one row per node (in node ID order)
+        R = model._reactions[combo.name].reshape(-1, 6)
+        RFX, RFY, RFZ, RMX, RMY, RMZ = R.T
+
+        # Sum the global forces
+        SumFX = FX.sum()
+        SumFY = FY.sum()
+        SumFZ = FZ.sum()
+        SumMX = (MX - FY*Z + FZ*Y).sum()
+        SumMY = (MY + FX*Z - FZ*X).sum()
+        SumMZ = (MZ - FX*Y + FY*X).sum()
+
+        # Sum the global reactions
+        SumRFX = RFX.sum()
+        SumRFY = RFY.sum()
+        SumRFZ = RFZ.sum()
+        SumRMX = (RMX - RFY*Z + RFZ*Y).sum()
+        SumRMY = (RMY + RFX*Z - RFZ*X).sum()
+        SumRMZ = (RMZ - RFX*Y + RFY*X).sum()
 
         # Add the results to the table
         statics_table.add_row([combo.name, '{:.3g}'.format(SumFX), '{:.3g}'.format(SumRFX),
@@ -1036,158 +1215,227 @@ def _check_statics(model: FEModel3D, combo_tags: List[str] | None = None) -> Non
     print('')
 
 
-def _partition_D(model: FEModel3D) -> Tuple[List[int], List[int], NDArray[float64]]:
+def _partition_D(model: FEModel3D) -> Tuple[NDArray[int64], NDArray[int64], NDArray[float64]]:
     """Builds a list with known nodal displacements and with the positions in global stiffness matrix of known and unknown nodal displacements
 
-    :return: A list of the global matrix indices for the unknown nodal displacements (D1_indices). A list of the global matrix indices for the known nodal displacements (D2_indices). A list of the known nodal displacements (D2).
-    :rtype: list, list, list
+    The partition only depends on the node numbering, supports and enforced displacements, so it is built once after `_renumber` and reused for the rest of the analysis. A permutation that moves the unknown degrees of freedom ahead of the known ones is stored with it for `_partition`.
+
+    :return: An array of the global matrix indices for the unknown nodal displacements (D1_indices). An array of the global matrix indices for the known nodal displacements (D2_indices). A column vector of the known nodal displacements (D2).
+    :rtype: array, array, array
     """
 
-    D1_indices = []  # A list of the indices for the unknown nodal displacements
-    D2_indices = []  # A list of the indices for the known nodal displacements
-    D2 = []          # A list of the values of the known nodal displacements
+    # Reuse the partition if it has already been built for the current numbering
+    if model._dof_partition is not None:
+        return model._dof_partition[:3]
 
-    # Create the auxiliary table
-    for node in model.nodes.values():
+    # Gather the enforced displacements of each node, ordered by node ID. Unenforced displacements (`None`) become `nan`.
+    enforced = array([[node.EnforcedDX, node.EnforcedDY, node.EnforcedDZ, node.EnforcedRX, node.EnforcedRY, node.EnforcedRZ]
+                      for node in model._nodes_by_ID], dtype=float).reshape(-1)
 
-        # Unknown displacement DX
-        if node.support_DX == False and node.EnforcedDX == None:
-            D1_indices.append(node.ID*6 + 0)
-        # Known displacement DX
-        elif node.EnforcedDX != None:
-            D2_indices.append(node.ID*6 + 0)
-            D2.append(node.EnforcedDX)
-        # Support at DX
-        else:
-            D2_indices.append(node.ID*6 + 0)
-            D2.append(0.0)
-
-        # Unknown displacement DY
-        if node.support_DY == False and node.EnforcedDY == None:
-            D1_indices.append(node.ID*6 + 1)
-        # Known displacement DY
-        elif node.EnforcedDY != None:
-            D2_indices.append(node.ID*6 + 1)
-            D2.append(node.EnforcedDY)
-        # Support at DY
-        else:
-            D2_indices.append(node.ID*6 + 1)
-            D2.append(0.0)
-
-        # Unknown displacement DZ
-        if node.support_DZ == False and node.EnforcedDZ == None:
-            D1_indices.append(node.ID*6 + 2)
-        # Known displacement DZ
-        elif node.EnforcedDZ != None:
-            D2_indices.append(node.ID*6 + 2)
-            D2.append(node.EnforcedDZ)
-        # Support at DZ
-        else:
-            D2_indices.append(node.ID*6 + 2)
-            D2.append(0.0)
-
-        # Unknown displacement RX
-        if node.support_RX == False and node.EnforcedRX == None:
-            D1_indices.append(node.ID*6 + 3)
-        # Known displacement RX
-        elif node.EnforcedRX != None:
-            D2_indices.append(node.ID*6 + 3)
-            D2.append(node.EnforcedRX)
-        # Support at RX
-        else:
-            D2_indices.append(node.ID*6 + 3)
-            D2.append(0.0)
-
-        # Unknown displacement RY
-        if node.support_RY == False and node.EnforcedRY == None:
-            D1_indices.append(node.ID*6 + 4)
-        # Known displacement RY
-        elif node.EnforcedRY != None:
-            D2_indices.append(node.ID*6 + 4)
-            D2.append(node.EnforcedRY)
-        # Support at RY
-        else:
-            D2_indices.append(node.ID*6 + 4)
-            D2.append(0.0)
-
-        # Unknown displacement RZ
-        if node.support_RZ == False and node.EnforcedRZ == None:
-            D1_indices.append(node.ID*6 + 5)
-        # Known displacement RZ
-        elif node.EnforcedRZ != None:
-            D2_indices.append(node.ID*6 + 5)
-            D2.append(node.EnforcedRZ)
-        # Support at RZ
-        else:
-            D2_indices.append(node.ID*6 + 5)
-            D2.append(0.0)
+    # A displacement is known if it is supported or enforced. Supported displacements that aren't enforced are zero.
+    known = model._supports.reshape(-1) | ~isnan(enforced)
+    D1_indices = flatnonzero(~known)
+    D2_indices = flatnonzero(known)
+    D2 = nan_to_num(enforced[D2_indices], nan=0.0).reshape(-1, 1)
 
-    # Legacy code on the next line. I will leave it here until the line that follows has been proven over time.
-    # D2 = atleast_2d(D2)
+    # Build the permutation that places the unknown degrees of freedom first, and the inverse that gives each degree of freedom's position in the permuted ordering
+    permutation = concatenate((D1_indices, D2_indices))
+    position = empty(len(permutation), dtype=int64)
+    position[permutation] = arange(len(permutation))
 
-    # Convert D2 from a list to a matrix
-    D2 = array(D2, ndmin=2).T
+    model._dof_partition = (D1_indices, D2_indices, D2, permutation, position)
 
     # Return the indices and the known displacements
     return D1_indices, D2_indices, D2
 
 
-def _partition(model: FEModel3D, unp_matrix: NDArray[float64] | lil_matrix, D1_indices: List[int], D2_indices: List[int]) -> Tuple[NDArray[float64], NDArray[float64]] | Tuple[NDArray[float64], NDArray[float64], NDArray[float64], NDArray[float64]]:
+def _partition(model: FEModel3D, unp_matrix: NDArray[float64] | lil_matrix, D1_indices: NDArray[int64], D2_indices: NDArray[int64]) -> Tuple[NDArray[float64], NDArray[float64]] | Tuple[NDArray[float64], NDArray[float64], NDArray[float64], NDArray[float64]]:
     """Partitions a matrix (or vector) into submatrices (or subvectors) based on degree of freedom boundary conditions.
 
+    The degrees of freedom are reordered once with the permutation built by `_partition_D`, which places the unknown displacements first. Each partition is then a contiguous block of the permuted matrix (a view, for dense arrays and vectors).
+
     :param unp_matrix: The unpartitioned matrix (or vector) to be partitioned.
-    :type unp_matrix: ndarray or lil_matrix
-    :param D1_indices: A list of the indices for degrees of freedom that have unknown displacements.
-    :type D1_indices: list
-    :param D2_indices: A list of the indices for degrees of freedom that have known displacements.
-    :type D2_indices: list
-    :return: Partitioned submatrices (or subvectors) based on degree of freedom boundary conditions.
+    :type unp_matrix: ndarray or sparse matrix
+    :param D1_indices: The indices for degrees of freedom that have unknown displacements.
+    :type D1_indices: array
+    :param D2_indices: The indices for degrees of freedom that have known displacements.
+    :type D2_indices: array
+    :return: Partitioned submatrices (or subvectors) based on degree of freedom boundary conditions. Sparse matrices are returned in `csr` format.
     :rtype: array, array, array, array
     """
 
-    # Convert sparse matrices to CSR so they support efficient slicing
-    if hasattr(unp_matrix, 'tocsr'):
-        unp_matrix = unp_matrix.tocsr()
-
-    # Determine if this is a 1D vector or a 2D matrix
+    # Use the permutation stored by `_partition_D`, unless other indices have been given
+    partition = model._dof_partition
+    if partition is not None and D1_indices is partition[0] and D2_indices is partition[1]:
+        permutation, position = partition[3], partition[4]
+    else:
+        permutation = concatenate((asarray(D1_indices, dtype=int64), asarray(D2_indices, dtype=int64)))
+        position = empty(len(permutation), dtype=int64)
+        position[permutation] = arange(len(permutation))
+    n1 = len(D1_indices)
 
     # 1D vectors
     if unp_matrix.shape[1] == 1:
         # Partition the vector into 2 subvectors
-        m1 = unp_matrix[D1_indices, :]
-        m2 = unp_matrix[D2_indices, :]
-        return m1, m2
-    # 2D matrices
+        if hasattr(unp_matrix, 'tocsr'):
+            unp_matrix = unp_matrix.toarray()
+        permuted = asarray(unp_matrix)[permutation]
+        return permuted[:n1], permuted[n1:]
+
+    # Sparse matrices. The rows and columns are permuted once, after which each partition is a contiguous slice.
+    if hasattr(unp_matrix, 'tocsr'):
+        permuted = unp_matrix.tocsr()[permutation][:, permutation]
+        top, bottom = permuted[:n1], permuted[n1:]
+        return top[:, :n1], top[:, n1:], bottom[:, :n1], bottom[:, n1:]
+
+    # Dense matrices. The permuted copy is made once and the partitions are views of it.
+    permuted = asarray(unp_matrix)[ix_(permutation, permutation)]
+    return permuted[:n1, :n1], permuted[:n1, n1:], permuted[n1:, :n1], permuted[n1:, n1:]
+
+
+def _node_order(model: FEModel3D) -> NDArray[int64]:
+    """Returns the order in which the model's nodes should be numbered, as indices into `model.nodes`.
+
+    The ordering is selected by `model.node_ordering`:
+
+    * ``'Natural'`` keeps the order the nodes were added to the model.
+    * ``'RCM'`` applies the Reverse Cuthill-McKee ordering to the node connectivity graph. This minimizes the bandwidth of the stiffness matrix.
+    * ``'AMD'`` applies a minimum degree ordering to the node connectivity graph (see `_minimum_degree`). This reduces the fill-in of sparse factorizations. The option keeps the name of the approximate minimum degree algorithm it stands in for, but the ordering is an exact minimum degree one.
+
+    Physical members must already be descritized so their sub-members can be included in the connectivity graph.
+
+    :param model: The model being numbered.
+    :type model: FEModel3D
+    :raises ValueError: Occurs when `model.node_ordering` is not recognized.
+    :return: The index (in `model.nodes`) of the node to be given each ID.
+    :rtype: NDArray[int64]
+    """
+
+    ordering = str(model.node_ordering).upper()
+    n = len(model.nodes)
+
+    if ordering not in ('NATURAL', 'RCM', 'AMD'):
+        raise ValueError(f"Unrecognized node ordering '{model.node_ordering}'. Use 'Natural', 'RCM' or 'AMD'.")
+
+    if ordering == 'NATURAL' or n < 3:
+        return arange(n)
+
+    # Build the node connectivity graph. Every pair of nodes that share an element are connected.
+    index = {node: i for i, node in enumerate(model.nodes.values())}
+    elements = [element for element in model.springs.values()]
+    elements += [member for phys_member in model.members.values() for member in phys_member.sub_members.values()]
+    elements += list(model.plates.values()) + list(model.quads.values())
+
+    rows, cols = [], []
+    for element in elements:
+        element_nodes = [index[node] for node in (getattr(element, node_type, None) for node_type in ('i_node', 'j_node', 'm_node', 'n_node')) if node is not None]
+        for a in element_nodes:
+            for b in element_nodes:
+                if a != b:
+                    rows.append(a)
+                    cols.append(b)
+
+    graph = sp.sparse.csr_matrix((ones(len(rows)), (rows, cols)), shape=(n, n))
+
+    if ordering == 'RCM':
+        return asarray(sp.sparse.csgraph.reverse_cuthill_mckee(graph, symmetric_mode=True), dtype=int64)
     else:
-        # Partition the matrix into 4 submatrices
-        m11 = unp_matrix[D1_indices, :][:, D1_indices]
-        m12 = unp_matrix[D1_indices, :][:, D2_indices]
-        m21 = unp_matrix[D2_indices, :][:, D1_indices]
-        m22 = unp_matrix[D2_indices, :][:, D2_indices]
-        return m11, m12, m21, m22
+        return _minimum_degree(graph)
+
+
+def _minimum_degree(graph) -> NDArray[int64]:
+    """Returns a minimum degree ordering of a symmetric graph.
+
+    Nodes are eliminated one at a time, always choosing the node with the fewest neighbors in the elimination graph (ties go to the lowest index). Eliminating a node connects all of its neighbors to each other, which is the fill-in a factorization would produce. Degrees are updated lazily through a priority queue.
+
+    This is the exact minimum degree algorithm: the fill is stored explicitly as Python sets rather than through the quotient graph and approximate degrees of AMD. Eliminating a node of degree d costs O(d^2) set operations, and the sets grow to hold every nonzero of the factor. That's cheap for frame models, where nodes have few neighbors, but on large plate and quad meshes the ordering takes time and memory comparable to a symbolic factorization done in Python.
+
+    :param graph: The symmetric adjacency matrix of the graph.
+    :type graph: scipy.sparse.csr_matrix
+    :return: The elimination order.
+    :rtype: NDArray[int64]
+    """
+
+    n = graph.shape[0]
+    adjacency = [set(graph.indices[graph.indptr[i]:graph.indptr[i + 1]].tolist()) - {i} for i in range(n)]
+
+    # Queue every node by its current degree
+    queue = [(len(neighbors), i) for i, neighbors in enumerate(adjacency)]
+    heapify(queue)
+
+    eliminated = [False]*n
+    order = []
+    while queue:
+
+        degree, v = heappop(queue)
+
+        # Skip nodes that were already eliminated, and queue entries that are out of date
+        if eliminated[v] or degree != len(adjacency[v]):
+            continue
+
+        eliminated[v] = True
+        order.append(v)
+
+        # Eliminating `v` connects its neighbors to each other
+        neighbors = adjacency[v]
+        for w in neighbors:
+            adjacency[w] |= neighbors
+            adjacency[w].discard(w)
+            adjacency[w].discard(v)
+            heappush(queue, (len(adjacency[w]), w))
+        adjacency[v] = set()
+
+    return array(order, dtype=int64)
 
 
 def _renumber(model: FEModel3D) -> None:
     """
-    Assigns node and element ID numbers to be used internally by the program. Numbers are
-    assigned according to the order in which they occur in each dictionary.
+    Assigns node and element ID numbers to be used internally by the program. Element numbers are
+    assigned according to the order in which they occur in each dictionary. Node numbers follow
+    the ordering selected by `model.node_ordering` (see `_node_order`), which controls the
+    bandwidth and fill-in of the global stiffness matrix.
     """
 
-    # Number each node in the model
-    for id, node in enumerate(model.nodes.values()):
-        node.ID = id
-
     # Number each spring in the model
     for id, spring in enumerate(model.springs.values()):
         spring.ID = id
 
+    # Build a spatial index of the nodes once, so each physical member only has to check the nodes near it for intermediate nodes. Cells about the size of a typical member keep the number of cells each member overlaps small.
+    if model.members:
+        lengths = [phys_member.L() for phys_member in model.members.values()]
+        model._node_grid = NodeGrid(model.nodes.values(), float(median(lengths)))
+
     # Descritize all the physical members and number each member in the model
     id = 0
-    for phys_member in model.members.values():
-        phys_member.descritize()
-        for member in phys_member.sub_members.values():
-            member.ID = id
-            id += 1
+    try:
+        for phys_member in model.members.values():
+            phys_member.descritize()
+            for member in phys_member.sub_members.values():
+                member.ID = id
+                id += 1
+    finally:
+        # The index is a snapshot of the current node locations, so don't keep it around
+        model._node_grid = None
+
+    # Number each node in the model. This is done after the members have been descritized, so the ordering can account for the sub-members' connectivity.
+    nodes = list(model.nodes.values())
+    model._node_permutation = _node_order(model)
+    nodes_by_ID = [nodes[i] for i in model._node_permutation]
+
+    # The cached load case vectors are stored by node ID, so they are only still valid if every node kept its ID
+    if len(nodes_by_ID) != len(model._nodes_by_ID) or any(new is not old for new, old in zip(nodes_by_ID, model._nodes_by_ID)):
+        model._case_loads = {}
+
+    model._nodes_by_ID = nodes_by_ID
+    for id, node in enumerate(model._nodes_by_ID):
+        node.ID = id
+
+    # Keep each node's support conditions (ordered by ID), so that DOF indices can be mapped back to supports without searching the node dictionary
+    model._supports = array([[node.support_DX, node.support_DY, node.support_DZ, node.support_RX, node.support_RY, node.support_RZ]
+                             for node in model._nodes_by_ID], dtype=bool).reshape(-1, 6)
+
+    # The degree of freedom partition depends on the numbering, so it is rebuilt by `_partition_D` when next needed
+    model._dof_partition = None
 
     # Number each plate in the model
     for id, plate in enumerate(model.plates.values()):
@@ -18,10 +18,15 @@ from Pynite.LoadCombo import LoadCombo
 from Pynite.Mesh import Mesh, RectangleMesh, AnnulusMesh, FrustrumMesh, CylinderMesh
 from Pynite.ShearWall import ShearWall
 from Pynite.MatFoundation import MatFoundation
-from Pynite import Analysis
+from Pynite.SparseAssembly import SparsePattern
+from Pynite.SegmentCache import SegmentCache
+from Pynite.NodeResults import ResultMatrix
+from Pynite import Analysis, MemberKernels, ParallelAnalysis
 
 if TYPE_CHECKING:
-    from typing import Dict, List
+    from typing import Any, Dict, List, Tuple
+    from Pynite.Factorization import StiffnessFactorization, IterativeStiffnessSolver
+    from Pynite.SpatialIndex import NodeGrid
     from numpy import float64
     from numpy.typing import NDArray
 
@@ -51,10 +56,48 @@ class FEModel3D():
         self.shear_walls: Dict[str, ShearWall] = {}    # A dictionary of the model's shear walls
         self.mats: Dict[str, MatFoundation] = {}       # A dictionary of the model's mat foundations
         self.load_combos: Dict[str, LoadCombo] = {}    # A dictionary of the model's load combinations
-        self._D: Dict[str, NDArray[float64]] = {}      # A dictionary of the model's nodal displacements by load combination
+        self._D: ResultMatrix = ResultMatrix()         # The model's global displacement vectors, one column per load combination
+        self._reactions: ResultMatrix = ResultMatrix() # The model's global reaction vectors, one column per load combination
 
         self.solution: str | None = None  # Indicates the solution type for the latest run of the model
 
+        # The ordering used to number the nodes for analysis: 'Natural' (the order nodes were added), 'RCM' (Reverse Cuthill-McKee, minimizes bandwidth) or 'AMD' (minimum degree, reduces fill-in, see `Analysis._minimum_degree` for its cost on large meshes). Results are reported by node name, so the ordering only affects solution speed and memory.
+        self.node_ordering: str = 'RCM'
+
+        # The most recent factorization of the partitioned stiffness matrix `K11`. It can be reused to solve additional right-hand sides without refactorizing.
+        self.K11_factorization: StiffnessFactorization | IterativeStiffnessSolver | None = None
+
+        # Iteration statistics from the conjugate gradient solver, keyed by load combination name. Each entry is a list with one `{'iterations': ..., 'residual': ...}` dictionary per solve.
+        self.solver_stats: Dict[str, List[Dict[str, float]]] = {}
+
+        # A counter that is incremented whenever node coordinates, section properties, material properties or member geometry change. Members use it to tell whether their cached stiffness matrices are still valid.
+        self._version: int = 0
+
+        # Nodes ordered by their internal ID, the node permutation relative to the `nodes` dictionary, and the nodes' support conditions as an (n_nodes, 6) boolean array. All are rebuilt whenever the model is renumbered for analysis.
+        self._nodes_by_ID: List[Node3D] = []
+        self._node_permutation: NDArray[np.int64] = np.zeros(0, dtype=np.int64)  # The position in `nodes` of the node with each ID
+        self._supports: NDArray[np.bool_] = np.zeros((0, 6), dtype=bool)
+
+        # The degree of freedom partition built by `Analysis._partition_D`: the unknown and known DOF indices, the known displacements, and the permutation (and its inverse) that places the unknown DOFs first. It is cleared whenever the model is renumbered.
+        self._dof_partition: Tuple[NDArray[np.int64], NDArray[np.int64], NDArray[np.float64], NDArray[np.int64], NDArray[np.int64]] | None = None
+
+        # The most recently used member segmentations (the `SegmentsZ`, `SegmentsY` and `SegmentsX` used for member results) for each load combination. Its `max_bytes` attribute sets the memory budget.
+        self.segment_cache: SegmentCache = SegmentCache()
+
+        # The symbolic sparse structure of each global matrix ('K', 'Kg' and 'Km'), reused by later assemblies with the same term positions
+        self._sparse_patterns: Dict[str, SparsePattern] = {}
+
+        # The global nodal force vector and fixed end reaction vector for each primitive load case, calculated once and combined by load factors to get the load vectors for any load combination. Entries are discarded when the loads in their load case change, and the whole cache is discarded when the geometry, releases, elements or node numbering change, or when a load list is edited directly.
+        self._case_loads: Dict[str, Tuple[NDArray[float64], NDArray[float64]]] = {}  # Key = load case name, Value = (P, FER) as 1D arrays
+        self._case_loads_key: Tuple | None = None                                      # The `_version`, number of degrees of freedom and load signature the cache was built for
+
+        # An index of which elements (springs, members, plates and quads) are attached to each node, and which nodes each element is attached to. It is kept up to date by the `add_*` and `delete_*` methods so that topology queries don't need to scan every element in the model. Node and element objects are used as keys, so the index is unaffected by renaming.
+        self._node_elements: Dict[Node3D, Dict[Any, str]] = {}      # Key = node, Value = {element: name of the model dictionary holding the element}
+        self._element_nodes: Dict[Any, Tuple[Node3D, ...]] = {}    # Key = element, Value = the nodes the element is attached to
+
+        # A spatial index of the model's nodes used by `PhysMember.descritize` to find intermediate nodes along members. It only exists while the model is being numbered for analysis.
+        self._node_grid: NodeGrid | None = None
+
     # Decorator marks this helper as not needing class/instance state.
     @staticmethod
     # Define helper that flattens node DOFs into a single index vector.
@@ -93,7 +136,7 @@ class FEModel3D():
     # Define helper that converts a dense element block into coo-format row/col/data arrays.
     def _append_sparse_block(dofs: NDArray[np.int64], block: np.ndarray,
                               row_parts: list[np.ndarray], col_parts: list[np.ndarray],
-                              data_parts: list[np.ndarray]) -> None:
+                              data_parts: list[np.ndarray], scale: float = 1.0) -> None:
         """Converts an element sub-matrix into row/col/data arrays for COO assembly.
 
         Compared to the former nested loops, this function handles the conversion in
@@ -102,7 +145,9 @@ class FEModel3D():
         2. ``cols = tile(dofs, size)``
         3. ``data = block.reshape(-1)``
 
-        Optional zero filtering keeps the sparse storage compact.
+        Optional zero filtering keeps the sparse storage compact. The zeros are found before
+        ``scale`` is applied, so an inactive element (``scale=0``) keeps the same entries as an
+        active one and the sparse pattern doesn't change between iterations.
         """
 
         # Ensure we are working with a float ndarray copy of the element block.
@@ -143,7 +188,7 @@ class FEModel3D():
         col_parts.append(cols[nonzero_mask])
         
         # Append the nonzero data values to the running parts list.
-        data_parts.append(flat[nonzero_mask])
+        data_parts.append(scale*flat[nonzero_mask])
 
     # Decorator marks this helper as purely functional for dense updates.
     @staticmethod
@@ -161,6 +206,37 @@ class FEModel3D():
         # Use numpy advanced indexing to add the entire block in one statement.
         global_matrix[np.ix_(dofs, dofs)] += block
 
+    def _assemble_sparse(self, name: str, row_parts: list[np.ndarray], col_parts: list[np.ndarray],
+                         data_parts: list[np.ndarray]) -> sp.sparse.csr_matrix:
+        """Sums the collected element terms into a sparse global matrix.
+
+        The symbolic structure of the matrix is stored in ``_sparse_patterns[name]``. When the next
+        assembly has its terms in the same positions (e.g. the next tension/compression-only
+        iteration or P-Delta step) only the values are summed into the stored structure, which
+        avoids sorting every term again in a COO to CSR conversion.
+        """
+
+        n = len(self.nodes)*6
+
+        # Concatenate the per-element contributions into single vectors.
+        if row_parts:
+            row = np.concatenate(row_parts).astype(np.int64, copy=False)
+            col = np.concatenate(col_parts).astype(np.int64, copy=False)
+            data = np.concatenate(data_parts).astype(float, copy=False)
+        else:
+            # Provide empty vectors when no elements contributed (edge case).
+            row = np.array([], dtype=np.int64)
+            col = np.array([], dtype=np.int64)
+            data = np.array([], dtype=float)
+
+        # Reuse the stored structure if the terms are in the same positions, otherwise build a new one
+        pattern = self._sparse_patterns.get(name)
+        if pattern is None or not pattern.matches(row, col, (n, n)):
+            pattern = SparsePattern(row, col, (n, n))
+            self._sparse_patterns[name] = pattern
+
+        return pattern.assemble(data)
+
     @property
     def load_cases(self) -> List[str]:
         """Returns a list of all the load cases in the model (in alphabetical order).
@@ -398,6 +474,7 @@ class FEModel3D():
 
         # Add the new spring to the model
         self.springs[name] = new_spring
+        self._link_element('springs', new_spring)
 
         # Flag the model as unsolved
         self.solution = None
@@ -452,6 +529,7 @@ class FEModel3D():
 
         # Add the new member to the model
         self.members[name] = new_member
+        self._link_element('members', new_member)
 
         # Flag the model as unsolved
         self.solution = None
@@ -516,6 +594,7 @@ class FEModel3D():
 
         # Add the new plate to the model
         self.plates[name] = new_plate
+        self._link_element('plates', new_plate)
 
         # Flag the model as unsolved
         self.solution = None
@@ -583,6 +662,7 @@ class FEModel3D():
 
         # Add the new member to the model
         self.quads[name] = new_quad
+        self._link_element('quads', new_quad)
 
         # Flag the model as unsolved
         self.solution = None
@@ -927,35 +1007,18 @@ class FEModel3D():
         self.solution = None
 
     def merge_duplicate_nodes(self, tolerance: float = 0.001) -> list:
-        """Removes duplicate nodes from the model and returns a list of the removed node names.
+        """Removes duplicate nodes from the model and returns a list of the removed node names. Each node is merged into the first node (in the order nodes were added) within `tolerance` of it. Candidate pairs are found with a KD-tree, so the search scales as O(n log n) rather than checking every pair of nodes.
 
         :param tolerance: The maximum distance between two nodes in order to consider them duplicates. Defaults to 0.001.
         :type tolerance: float, optional
         :return: A list of the names of the nodes that were removed from the model.
         """
 
-        # Initialize a dictionary marking where each node is used
-        node_lookup = {node_name: [] for node_name in self.nodes.keys()}
-        element_dicts = ('springs', 'members', 'plates', 'quads')
+        # The attributes an element may use to reference a node
         node_types = ('i_node', 'j_node', 'm_node', 'n_node')
 
-        # Step through each dictionary of elements in the model (springs, members, plates, quads)
-        for element_dict in element_dicts:
-
-            # Step through each element in the dictionary
-            for element in getattr(self, element_dict).values():
-
-                # Step through each possible node type in the element (i-node, j-node, m-node, n-node)
-                for node_type in node_types:
-
-                    # Get the current element's node having the current type
-                    # Return `None` if the element doesn't have this node type
-                    node = getattr(element, node_type, None)
-
-                    # Determine if the node exists on the element
-                    if node is not None:
-                        # Add the element to the list of elements attached to the node
-                        node_lookup[node.name].append((element, node_type))
+        # Keep track of the nodes that have been removed
+        removed = set()
 
         # Make a list of the names of each node in the model
         node_names = list(self.nodes.keys())
@@ -963,30 +1026,39 @@ class FEModel3D():
         # Make a list of nodes to be removed from the model
         remove_list = []
 
+        # Find every pair of nodes within `tolerance` of each other using a KD-tree, rather than checking every pair of nodes. `query_pairs` returns each pair once as (i, j) with i < j.
+        neighbors = [[] for _ in node_names]
+        if len(node_names) > 1:
+            coords = np.array([[node.X, node.Y, node.Z] for node in self.nodes.values()], dtype=float)
+            for i, j in sp.spatial.cKDTree(coords).query_pairs(tolerance):
+                neighbors[i].append(j)
+
         # Step through each node in the copy of the `Nodes` dictionary
         for i, node_1_name in enumerate(node_names):
 
             # Skip iteration if `node_1` has already been removed
-            if node_lookup[node_1_name] is None:
+            if node_1_name in removed:
                 continue
 
-            # There is no need to check `node_1` against itself
-            for node_2_name in node_names[i + 1:]:
+            # Step through the nodes within `tolerance` of `node_1` that come after it, in the same order the nodes were added to the model
+            for j in sorted(neighbors[i]):
+                node_2_name = node_names[j]
 
                 # Skip iteration if node_2 has already been removed
-                if node_lookup[node_2_name] is None:
-                    continue
-
-                # Calculate the distance between nodes
-                if self.nodes[node_1_name].distance(self.nodes[node_2_name]) > tolerance:
+                if node_2_name in removed:
                     continue
 
-                # Replace references to `node_2` in each element with references to `node_1`
-                for element, node_type in node_lookup[node_2_name]:
-                    setattr(element, node_type, self.nodes[node_1_name])
+                # Replace references to `node_2` in each attached element with references to `node_1`, and update the adjacency index
+                node_1, node_2 = self.nodes[node_1_name], self.nodes[node_2_name]
+                for element, element_dict in list(self._attached_elements(node_2).items()):
+                    for node_type in node_types:
+                        if getattr(element, node_type, None) is node_2:
+                            setattr(element, node_type, node_1)
+                    self._link_element(element_dict, element)
 
                 # Flag `node_2` as no longer used
-                node_lookup[node_2_name] = None
+                self._node_elements.pop(node_2, None)
+                removed.add(node_2_name)
 
                 # Merge any boundary conditions
                 support_cond = ('support_DX', 'support_DY', 'support_DZ', 'support_RX', 'support_RY', 'support_RZ')
@@ -1013,12 +1085,7 @@ class FEModel3D():
                         # Fix the dictionary key
                         mesh.nodes[node_1_name] = mesh.nodes.pop(node_2_name)
 
-                    # Fix the elements in the mesh
-                    for element in mesh.elements.values():
-                        if node_2_name == element.i_node.name: element.i_node = self.nodes[node_1_name]
-                        if node_2_name == element.j_node.name: element.j_node = self.nodes[node_1_name]
-                        if node_2_name == element.m_node.name: element.m_node = self.nodes[node_1_name]
-                        if node_2_name == element.n_node.name: element.n_node = self.nodes[node_1_name]
+                    # The mesh's elements are the same objects as the model's plates and quads, so they were already updated above
 
                 # Add the node to the `remove` list
                 remove_list.append(node_2_name)
@@ -1042,12 +1109,18 @@ class FEModel3D():
 
         # Remove the node. Nodal loads are stored within the node, so they
         # will be deleted automatically when the node is deleted.
-        self.nodes.pop(node_name)
+        node = self.nodes.pop(node_name)
 
         # Find any elements attached to the node and remove them
-        self.members = {name: member for name, member in self.members.items() if member.i_node.name != node_name and member.j_node.name != node_name}
-        self.plates = {name: plate for name, plate in self.plates.items() if plate.i_node.name != node_name and plate.j_node.name != node_name and plate.m_node.name != node_name and plate.n_node.name != node_name}
-        self.quads = {name: quad for name, quad in self.quads.items() if quad.i_node.name != node_name and quad.j_node.name != node_name and quad.m_node.name != node_name and quad.n_node.name != node_name}
+        for element, element_dict in list(self._attached_elements(node).items()):
+            getattr(self, element_dict).pop(element.name, None)
+            self._unlink_element(element)
+            if element_dict == 'members':
+                self._discard_segments(element)
+        self._node_elements.pop(node, None)
+
+        # The node's loads and the loads on its elements have been removed, so discard the cached load vectors
+        self._case_loads = {}
 
         # Flag the model as unsolved
         self.solution = None
@@ -1060,7 +1133,10 @@ class FEModel3D():
         """
 
         # Remove the spring
-        self.springs.pop(spring_name)
+        self._unlink_element(self.springs.pop(spring_name))
+
+        # Discard the cached load vectors
+        self._case_loads = {}
 
         # Flag the model as unsolved
         self.solution = None
@@ -1075,7 +1151,12 @@ class FEModel3D():
 
         # Remove the member. Member loads are stored within the member, so they
         # will be deleted automatically when the member is deleted.
-        self.members.pop(member_name)
+        phys_member = self.members.pop(member_name)
+        self._unlink_element(phys_member)
+        self._discard_segments(phys_member)
+
+        # The member's loads have been removed, so discard the cached load vectors
+        self._case_loads = {}
 
         # Flag the model as unsolved
         self.solution = None
@@ -1105,6 +1186,57 @@ class FEModel3D():
         # Flag the model as unsolved
         self.solution = None
 
+    def _link_element(self, element_dict: str, element) -> None:
+        """Adds an element to the node/element adjacency index, or refreshes its entry if the element's nodes have changed.
+
+        :param element_dict: The name of the model dictionary holding the element ('springs', 'members', 'plates' or 'quads').
+        :type element_dict: str
+        :param element: The element to add.
+        :type element: Spring3D, PhysMember, Plate3D or Quad3D
+        """
+
+        # Remove any stale entry for this element first
+        self._unlink_element(element)
+
+        # Find the nodes the element is attached to. Springs and members only have an i-node and j-node.
+        nodes = tuple(node for node in (getattr(element, node_type, None) for node_type in ('i_node', 'j_node', 'm_node', 'n_node')) if node is not None)
+
+        # Record the element against each of its nodes
+        self._element_nodes[element] = nodes
+        for node in nodes:
+            self._node_elements.setdefault(node, {})[element] = element_dict
+
+    def _unlink_element(self, element) -> None:
+        """Removes an element from the node/element adjacency index. Elements that aren't in the index are ignored.
+
+        :param element: The element to remove.
+        :type element: Spring3D, PhysMember, Plate3D or Quad3D
+        """
+
+        for node in self._element_nodes.pop(element, ()):
+            attached = self._node_elements.get(node)
+            if attached is not None:
+                attached.pop(element, None)
+
+    def _discard_segments(self, phys_member: PhysMember) -> None:
+        """Removes a physical member's (and its sub-members') cached segments from the model's `segment_cache`, so a deleted member isn't kept alive by the cache.
+
+        :param phys_member: The physical member being removed.
+        :type phys_member: PhysMember
+        """
+        for member in (phys_member, *phys_member.sub_members.values()):
+            self.segment_cache.discard(member)
+
+    def _attached_elements(self, node: Node3D) -> Dict[Any, str]:
+        """Returns the elements attached to a node, using the node/element adjacency index.
+
+        :param node: The node to look up.
+        :type node: Node3D
+        :return: A dictionary with the attached elements as keys, and the name of the model dictionary holding each element as values.
+        :rtype: dict
+        """
+        return self._node_elements.get(node, {})
+
     def def_support(self, node_name: str, support_DX: bool = False, support_DY: bool = False,
                     support_DZ: bool = False, support_RX: bool = False, support_RY: bool = False,
                     support_RZ: bool = False):
@@ -1269,6 +1401,9 @@ class FEModel3D():
         except KeyError:
             raise NameError(f"Member '{member_name}' does not exist in the model")
 
+        # End releases change how member loads are distributed to the nodes, so the cached load vectors are out of date
+        self._case_loads = {}
+
         # Flag the model as unsolved
         self.solution = None
 
@@ -1316,6 +1451,9 @@ class FEModel3D():
         except KeyError:
             raise NameError(f"Node '{node_name}' does not exist in the model")
 
+        # The load case's cached load vectors are out of date
+        self._case_loads.pop(case, None)
+
         # Flag the model as unsolved
         self.solution = None
 
@@ -1349,6 +1487,9 @@ class FEModel3D():
         except KeyError:
             raise NameError(f"Member '{member_name}' does not exist in the model")
 
+        # The load case's cached load vectors are out of date
+        self._case_loads.pop(case, None)
+
         # Flag the model as unsolved
         self.solution = None
 
@@ -1403,6 +1544,9 @@ class FEModel3D():
         except KeyError:
             raise NameError(f"Member '{member_name}' does not exist in the model")
 
+        # The load case's cached load vectors are out of date
+        self._case_loads.pop(case, None)
+
         # Flag the model as unsolved
         self.solution = None
 
@@ -1458,6 +1602,9 @@ class FEModel3D():
         except KeyError:
             raise NameError(f"Plate '{plate_name}' does not exist in the model")
 
+        # The load case's cached load vectors are out of date
+        self._case_loads.pop(case, None)
+
         # Flag the model as unsolved
         self.solution = None
 
@@ -1479,6 +1626,9 @@ class FEModel3D():
         except KeyError:
             raise NameError(f"Quad '{quad_name}' does not exist in the model")
 
+        # The load case's cached load vectors are out of date
+        self._case_loads.pop(case, None)
+
         # Flag the model as unsolved
         self.solution = None
 
@@ -1493,6 +1643,10 @@ class FEModel3D():
             member.SegmentsZ = []
             member.SegmentsY = []
             member.SegmentsX = []
+            member._solved_combo = None
+
+        # Delete the cached segments of every member
+        self.segment_cache.clear()
 
         # Delete the plate loads
         for plate in self.plates.values():
@@ -1502,32 +1656,25 @@ class FEModel3D():
         for quad in self.quads.values():
             quad.pressures = []
 
-        # Delete the nodal loads, calculated displacements, and calculated reactions
+        # Delete the nodal loads
         for node in self.nodes.values():
-
             node.NodeLoads = []
 
-            node.DX = {}
-            node.DY = {}
-            node.DZ = {}
-            node.RX = {}
-            node.RY = {}
-            node.RZ = {}
+        # Delete the calculated displacements and reactions
+        self._D.clear()
+        self._reactions.clear()
 
-            node.RxnFX = {}
-            node.RxnFY = {}
-            node.RxnFZ = {}
-            node.RxnMX = {}
-            node.RxnMY = {}
-            node.RxnMZ = {}
+        # Delete the cached load vectors
+        self._case_loads = {}
 
         # Flag the model as unsolved
         self.solution = None
 
     def K(self, combo_name='Combo 1', log=False, check_stability=True, sparse=True):
         """Returns the model's global stiffness matrix. The stiffness matrix will be returned in
-           scipy's sparse coo format, which reduces memory usage and can be easily converted to
-           other formats.
+           scipy's sparse csr format, which reduces memory usage and can be easily converted to
+           other formats. Earlier versions returned a `coo_matrix`. Code that reads the `row`,
+           `col` and `data` attributes directly should call `.tocoo()` on the result first.
 
         :param combo_name: The load combination to get the stiffness matrix for. Defaults to 'Combo 1'.
         :type combo_name: str, optional
@@ -1539,8 +1686,8 @@ class FEModel3D():
         :param sparse: Returns a sparse matrix if set to True, and a dense matrix otherwise.
                        Defaults to True.
         :type sparse: bool, optional
-        :return: The global stiffness matrix for the structure.
-        :rtype: ndarray or coo_matrix
+        :return: The global stiffness matrix for the structure: a `csr_matrix` (not a `coo_matrix`) if `sparse` is True, otherwise a dense array.
+        :rtype: ndarray or csr_matrix
         """
 
         # Determine if a sparse matrix has been requested
@@ -1561,108 +1708,31 @@ class FEModel3D():
         if log: print('- Adding nodal spring support stiffness terms to global stiffness matrix')
         for node in self.nodes.values():
 
-            # Determine if the node has any spring supports
-            if node.spring_DX[0] is not None:
-
-                # Check for an active spring support
-                if node.spring_DX[2] == True:
-                    m, n = node.ID*6, node.ID*6
-                    # Cache the spring stiffness value once for reuse below.
-                    val = float(node.spring_DX[0])
-                    if sparse == True:
-                        # Record the row index associated with the restrained DOF.
-                        row_parts.append(np.array([m], dtype=np.int64))
-                        # Record the column index associated with the same DOF.
-                        col_parts.append(np.array([n], dtype=np.int64))
-                        # Record the spring stiffness contribution for this DOF.
-                        data_parts.append(np.array([val], dtype=float))
-                    else:
-                        K[m, n] += val
-
-            if node.spring_DY[0] is not None:
-
-                # Check for an active spring support
-                if node.spring_DY[2] == True:
-                    m, n = node.ID*6 + 1, node.ID*6 + 1
-                    # Capture the Y-direction spring stiffness once per DOF.
-                    val = float(node.spring_DY[0])
-                    if sparse == True:
-                        # Store the row index for the Y spring term.
-                        row_parts.append(np.array([m], dtype=np.int64))
-                        # Store the column index for the Y spring term.
-                        col_parts.append(np.array([n], dtype=np.int64))
-                        # Store the spring stiffness coefficient for this DOF.
-                        data_parts.append(np.array([val], dtype=float))
-                    else:
-                        K[m, n] += val
-
-            if node.spring_DZ[0] is not None:
-
-                # Check for an active spring support
-                if node.spring_DZ[2] == True:
-                    m, n = node.ID*6 + 2, node.ID*6 + 2
-                    # Capture the Z-direction spring stiffness once per DOF.
-                    val = float(node.spring_DZ[0])
-                    if sparse == True:
-                        # Store the row index for the Z spring contribution.
-                        row_parts.append(np.array([m], dtype=np.int64))
-                        # Store the column index for the Z spring contribution.
-                        col_parts.append(np.array([n], dtype=np.int64))
-                        # Store the spring stiffness magnitude itself.
-                        data_parts.append(np.array([val], dtype=float))
-                    else:
-                        K[m, n] += val
-
-            if node.spring_RX[0] is not None:
+            # Step through the spring supports for each degree of freedom at the node
+            for dof, spring in enumerate((node.spring_DX, node.spring_DY, node.spring_DZ, node.spring_RX, node.spring_RY, node.spring_RZ)):
 
-                # Check for an active spring support
-                if node.spring_RX[2] == True:
-                    m, n = node.ID*6 + 3, node.ID*6 + 3
-                    # Capture the rotational X-direction spring stiffness.
-                    val = float(node.spring_RX[0])
-                    if sparse == True:
-                        # Store the row index for the RX spring.
-                        row_parts.append(np.array([m], dtype=np.int64))
-                        # Store the column index for the RX spring.
-                        col_parts.append(np.array([n], dtype=np.int64))
-                        # Store the rotational stiffness value for RX.
-                        data_parts.append(np.array([val], dtype=float))
-                    else:
-                        K[m, n] += val
+                # Determine if the node has a spring support for this degree of freedom
+                if spring[0] is None:
+                    continue
 
-            if node.spring_RY[0] is not None:
+                m = node.ID*6 + dof
 
                 # Check for an active spring support
-                if node.spring_RY[2] == True:
-                    m, n = node.ID*6 + 4, node.ID*6 + 4
-                    # Capture the rotational Y-direction spring stiffness.
-                    val = float(node.spring_RY[0])
-                    if sparse == True:
-                        # Store the row index for the RY spring.
-                        row_parts.append(np.array([m], dtype=np.int64))
-                        # Store the column index for the RY spring.
-                        col_parts.append(np.array([n], dtype=np.int64))
-                        # Store the rotational stiffness value for RY.
-                        data_parts.append(np.array([val], dtype=float))
-                    else:
-                        K[m, n] += val
-
-            if node.spring_RZ[0] is not None:
+                if spring[2] == True:
+                    val = float(spring[0])
+                elif sparse == True:
+                    # Inactive springs keep their (zero) entry so the sparse pattern doesn't change between tension/compression-only iterations
+                    val = 0.0
+                else:
+                    continue
 
-                # Check for an active spring support
-                if node.spring_RZ[2] == True:
-                    m, n = node.ID*6 + 5, node.ID*6 + 5
-                    # Capture the rotational Z-direction spring stiffness.
-                    val = float(node.spring_RZ[0])
-                    if sparse == True:
-                        # Store the row index for the RZ spring.
-                        row_parts.append(np.array([m], dtype=np.int64))
-                        # Store the column index for the RZ spring.
-                        col_parts.append(np.array([n], dtype=np.int64))
-                        # Store the rotational stiffness value for RZ.
-                        data_parts.append(np.array([val], dtype=float))
-                    else:
-                        K[m, n] += val
+                if sparse == True:
+                    # Record the row, column and stiffness of the spring term.
+                    row_parts.append(np.array([m], dtype=np.int64))
+                    col_parts.append(np.array([m], dtype=np.int64))
+                    data_parts.append(np.array([val], dtype=float))
+                else:
+                    K[m, m] += val
 
         # Add stiffness terms for each spring in the model
         if log: print('- Adding spring stiffness terms to global stiffness matrix')
@@ -1684,29 +1754,47 @@ class FEModel3D():
                     # Add the spring block directly to the dense global matrix.
                     self._add_dense_block(K, dofs, spring_K)
 
+            elif sparse == True:
+                # Inactive springs keep their entries, with zero values, so the sparse pattern doesn't change between iterations.
+                dofs = self._build_dof_vector(spring.i_node, spring.j_node)
+                self._append_sparse_block(dofs, spring.K(), row_parts, col_parts, data_parts, scale=0.0)
+
         # Add stiffness terms for each physical member in the model
         if log: print('- Adding member stiffness terms to global stiffness matrix')
+
+        # Gather the sub-members of every active physical member, and compute all of their
+        # global stiffness matrices in one batched (n_members, 12, 12) kernel call rather than
+        # building each 12x12 matrix individually.
+        # For sparse matrices inactive members are included too, with zero values, so the sparse
+        # pattern doesn't change between tension/compression-only iterations.
+        members, scale = [], []
         for phys_member in self.members.values():
+            active = phys_member.active[combo_name] == True
+            if active or sparse == True:
+                for member in phys_member.sub_members.values():
+                    members.append(member)
+                    scale.append(1.0 if active else 0.0)
 
-            # Check to see if the physical member is active for the given load combination
-            if phys_member.active[combo_name] == True:
+        if members:
 
-                # Step through each sub-member in the physical member and add terms
-                for member in phys_member.sub_members.values():
+            # Build the global stiffness matrices and the matching (n_members, 12) DOF indices.
+            # Members with a valid cached stiffness matrix (e.g. from a previous tension/compression-only
+            # iteration) are not recalculated.
+            member_K = MemberKernels.cached_global_stiffness(members)
+            member_dofs = MemberKernels.dofs(members)
 
-                    # Build the member DOF vector once so we can add the entire 12x12 block,
-                    # keeping parity with the previous (i,j) nested summation.
-                    # Capture the member's i/j DOFs for subsequent block placement.
-                    dofs = self._build_dof_vector(member.i_node, member.j_node)
-                    # Grab the member's global stiffness matrix.
-                    member_K = member.K()
+            # Flatten every member block into COO row/col/data vectors at once.
+            rows, cols, data = MemberKernels.coo_entries(member_K, member_dofs, np.array(scale))
 
-                    if sparse == True:
-                        # Append the member block into the sparse assembly lists.
-                        self._append_sparse_block(dofs, member_K, row_parts, col_parts, data_parts)
-                    else:
-                        # Inject the member block into the dense matrix via vectorized indexing.
-                        self._add_dense_block(K, dofs, member_K)
+            if sparse == True:
+                # Append all the member terms to the sparse assembly lists in a single chunk.
+                row_parts.append(rows)
+                col_parts.append(cols)
+                data_parts.append(data)
+            else:
+                # Scatter the member terms into the dense matrix. `np.add.at` accumulates
+                # repeated (row, col) pairs from members sharing a node.
+                np.add.at(K, (rows, cols), data)
 
         # Add stiffness terms for each quadrilateral in the model
         if log: print('- Adding quadrilateral stiffness terms to global stiffness matrix')
@@ -1746,29 +1834,13 @@ class FEModel3D():
                 self._add_dense_block(K, dofs, plate_K)
 
         if sparse:
-            # Concatenate the per-element contributions into the vectors scipy expects.
-            if row_parts:
-                # Collapse all stored row chunks into one contiguous vector.
-                row = np.concatenate(row_parts)
-                # Collapse all stored column chunks into one contiguous vector.
-                col = np.concatenate(col_parts)
-                # Collapse all stored data chunks into one contiguous vector.
-                data = np.concatenate(data_parts)
-            else:
-                # Provide empty row vector when no elements contributed (edge case).
-                row = np.array([], dtype=np.int64)
-                # Provide empty column vector when no elements contributed (edge case).
-                col = np.array([], dtype=np.int64)
-                # Provide empty data vector when no elements contributed (edge case).
-                data = np.array([], dtype=float)
-
-            # Build the sparse COO matrix from the assembled vectors.
-            K = sp.sparse.coo_matrix((data, (row, col)), shape=(len(self.nodes)*6, len(self.nodes)*6))
+            # Sum the element terms into the sparse matrix, reusing the stored pattern when possible.
+            K = self._assemble_sparse('K', row_parts, col_parts, data_parts)
 
         # Check that there are no nodal instabilities
         if check_stability:
             if log: print('- Checking nodal stability')
-            if sparse: Analysis._check_stability(self, K.tocsr())
+            if sparse: Analysis._check_stability(self, K)
             else: Analysis._check_stability(self, K)
 
         # Return the global stiffness matrix
@@ -1777,6 +1849,8 @@ class FEModel3D():
     def Kg(self, combo_name='Combo 1', log=False, sparse=True, first_step=True):
         """Returns the model's global geometric stiffness matrix. Geometric stiffness of plates is not considered.
 
+        The sparse matrix is returned in scipy's csr format. Earlier versions returned a `coo_matrix`, so code that reads its `row`, `col` and `data` attributes directly should call `.tocoo()` on the result first.
+
         :param combo_name: The name of the load combination to derive the matrix for. Defaults to 'Combo 1'.
         :type combo_name: str, optional
         :param log: Prints updates to the console if set to `True`. Defaults to `False`.
@@ -1785,82 +1859,42 @@ class FEModel3D():
         :type sparse: bool, optional
         :param first_step: Used to indicate if the analysis is occuring at the first load step. Used in nonlinear analysis where the load is broken into multiple steps. Default is `True`.
         :type first_step: bool, optional
-        :return: The global geometric stiffness matrix for the structure.
-        :rtype: ndarray or coo_matrix
+        :return: The global geometric stiffness matrix for the structure: a `csr_matrix` (not a `coo_matrix`) if `sparse` is True, otherwise a dense array.
+        :rtype: ndarray or csr_matrix
         """
 
-        if sparse == True:
-            # The geometric stiffness matrix will be stored as a scipy `coo_matrix`. Scipy's documentation states that this type of matrix is ideal for efficient construction of finite element matrices. When converted to another format, the `coo_matrix` sums values at the same (i, j) index. We'll build the matrix from three lists.
-            row, col, data = [], [], []
-        else:
-            Kg = np.zeros((len(self.nodes)*6, len(self.nodes)*6))
-
-        # Add stiffness terms for each physical member in the model
+        # Gather the sub-members of every physical member. For sparse matrices inactive members are
+        # included too, with zero values, so the sparse pattern doesn't change between iterations.
         if log:
             print('- Adding member geometric stiffness terms to global geometric stiffness matrix')
+        members, scale = [], []
         for phys_member in self.members.values():
-
-            # Check to see if the physical member is active for the given load combination
-            if phys_member.active[combo_name] == True:
-
-                # Step through each sub-member in the physical member and add terms
+            active = phys_member.active[combo_name] == True
+            if active or sparse == True:
                 for member in phys_member.sub_members.values():
+                    members.append(member)
+                    scale.append(1.0 if active else 0.0)
 
-                    # Calculate the axial force in the member
-                    E = member.material.E
-                    A = member.section.A
-                    L = member.L()
+        # Calculate the axial force acting on each member. For the first load step take P = 0.
+        if first_step or not members:
+            P = np.zeros(len(members))
+        else:
+            # Calculate the member axial forces due to axial strain, all in one batch
+            P = MemberKernels.axial_forces(members, self._D[combo_name])
 
-                    # Calculate the axial force acting on the member
-                    if first_step:
-                        # For the first load step take P = 0
-                        P = 0
-                    else:
-                        # Calculate the member axial force due to axial strain
-                        d = member.d(combo_name)
-                        P = E*A/L*(d[6, 0] - d[0, 0])
-
-                    # Get the member's global stiffness matrix
-                    # Storing it as a local variable eliminates the need to rebuild it every time a term is needed
-                    member_Kg = member.Kg(P)
-
-                    # Step through each term in the member's stiffness matrix
-                    # 'a' & 'b' below are row/column indices in the member's stiffness matrix
-                    # 'm' & 'n' are corresponding row/column indices in the global stiffness matrix
-                    for a in range(12):
-
-                        # Determine if index 'a' is related to the i-node or j-node
-                        if a < 6:
-                            # Find the corresponding index 'm' in the global stiffness matrix
-                            m = member.i_node.ID*6 + a
-                        else:
-                            # Find the corresponding index 'm' in the global stiffness matrix
-                            m = member.j_node.ID*6 + (a-6)
-
-                        for b in range(12):
-
-                            # Determine if index 'b' is related to the i-node or j-node
-                            if b < 6:
-                                # Find the corresponding index 'n' in the global stiffness matrix
-                                n = member.i_node.ID*6 + b
-                            else:
-                                # Find the corresponding index 'n' in the global stiffness matrix
-                                n = member.j_node.ID*6 + (b-6)
-
-                            # Now that 'm' and 'n' are known, place the term in the global stiffness matrix
-                            if sparse == True:
-                                row.append(m)
-                                col.append(n)
-                                data.append(member_Kg[(a, b)])
-                            else:
-                                Kg[m, n] += member_Kg[(a, b)]
+        # The geometric stiffness is proportional to the axial force, so each member's matrix for a unit force is cached and scaled
+        member_Kg = MemberKernels.geometric_stiffness(members, P)
+
+        # Every term is kept, since the matrices are all zero on the first load step
+        rows, cols, data = MemberKernels.coo_entries(member_Kg, MemberKernels.dofs(members), np.array(scale), drop_zeros=False)
 
         if sparse:
-            # Convert the row, col, data lists to numpy arrays and create the COO matrix
-            row = np.array(row)
-            col = np.array(col)
-            data = np.array(data)
-            Kg = sp.sparse.coo_matrix((data, (row, col)), shape=(len(self.nodes)*6, len(self.nodes)*6))
+            # Sum the member terms into the sparse matrix, reusing the stored pattern when possible.
+            Kg = self._assemble_sparse('Kg', [rows], [cols], [data])
+        else:
+            # `np.add.at` accumulates repeated (row, col) pairs from members sharing a node.
+            Kg = np.zeros((len(self.nodes)*6, len(self.nodes)*6))
+            np.add.at(Kg, (rows, cols), data)
 
         # Return the global geometric stiffness matrix
         return Kg
@@ -1868,6 +1902,8 @@ class FEModel3D():
     def Km(self, combo_name='Combo 1', push_combo='Push', step_num=1, log=False, sparse=True):
         """Calculates the structure's global plastic reduction matrix, which is used for nonlinear inelastic analysis.
 
+        The sparse matrix is returned in scipy's csr format. Earlier versions returned a `coo_matrix`, so code that reads its `row`, `col` and `data` attributes directly should call `.tocoo()` on the result first.
+
         :param combo_name: The name of the load combination to get the plastic reduction matrix for. Defaults to 'Combo 1'.
         :type combo_name: str, optional
         :param push_combo: The name of the load combination that contains the pushover load definition. Defaults to 'Push'.
@@ -1878,70 +1914,36 @@ class FEModel3D():
         :type log: bool, optional
         :param sparse: Indicates whether the sparse solver should be used. Defaults to True.
         :type sparse: bool, optional
-        :return: The global plastic reduction matrix.
-        :rtype: np.array
+        :return: The global plastic reduction matrix: a `csr_matrix` (not a `coo_matrix`) if `sparse` is True, otherwise a dense array.
+        :rtype: ndarray or csr_matrix
         """
 
-        # Determine if a sparse matrix has been requested
-        if sparse == True:
-            # The plastic reduction matrix will be stored as a scipy `coo_matrix`. Scipy's documentation states that this type of matrix is ideal for efficient construction of finite element matrices. When converted to another format, the `coo_matrix` sums values at the same (i, j) index. We'll build the matrix from three lists.
-            row = []
-            col = []
-            data = []
-        else:
-            # Initialize a dense matrix of zeros
-            Km = np.zeros((len(self.nodes)*6, len(self.nodes)*6))
-
-        # Add stiffness terms for each physical member in the model
+        # Gather the sub-members of every physical member. For sparse matrices inactive members are
+        # included too, with zero values, so the sparse pattern doesn't change between load steps.
+        members, scale = [], []
         for phys_member in self.members.values():
-
-            # Check to see if the physical member is active for the given load combination
-            if phys_member.active[combo_name] == True:
-
-                # Step through each sub-member in the physical member and add terms
+            active = phys_member.active[combo_name] == True
+            if active or sparse == True:
                 for member in phys_member.sub_members.values():
+                    members.append(member)
+                    scale.append(1.0 if active else 0.0)
+
+        # Get each member's global plastic reduction matrix
+        member_Km = np.zeros((len(members), 12, 12))
+        for index, member in enumerate(members):
+            if scale[index] != 0.0:
+                member_Km[index] = member.Km(combo_name)
 
-                    # Get the member's global plastic reduction matrix
-                    # Storing it as a local variable eliminates the need to rebuild it every time a term is needed
-                    member_Km = member.Km(combo_name)
-
-                    # Step through each term in the member's plastic reduction matrix
-                    # 'a' & 'b' below are row/column indices in the member's matrix
-                    # 'm' & 'n' are corresponding row/column indices in the structure's global matrix
-                    for a in range(12):
-
-                        # Determine if index 'a' is related to the i-node or j-node
-                        if a < 6:
-                            # Find the corresponding index 'm' in the global plastic reduction matrix
-                            m = member.i_node.ID*6 + a
-                        else:
-                            # Find the corresponding index 'm' in the global plastic reduction matrix
-                            m = member.j_node.ID*6 + (a-6)
-
-                        for b in range(12):
-
-                            # Determine if index 'b' is related to the i-node or j-node
-                            if b < 6:
-                                # Find the corresponding index 'n' in the global plastic reduction matrix
-                                n = member.i_node.ID*6 + b
-                            else:
-                                # Find the corresponding index 'n' in the global plastic reduction matrix
-                                n = member.j_node.ID*6 + (b-6)
-
-                            # Now that 'm' and 'n' are known, place the term in the global plastic reduction matrix
-                            if sparse == True:
-                                row.append(m)
-                                col.append(n)
-                                data.append(member_Km[a, b])
-                            else:
-                                Km[m, n] += member_Km[a, b]
+        # Every term is kept, since the matrices are all zero until the members yield
+        rows, cols, data = MemberKernels.coo_entries(member_Km, MemberKernels.dofs(members), drop_zeros=False)
 
         if sparse:
-            # The plastic reduction matrix will be stored as a scipy `coo_matrix`. Scipy's documentation states that this type of matrix is ideal for efficient construction of finite element matrices. When converted to another format, the `coo_matrix` sums values at the same (i, j) index.
-            row = np.array(row)
-            col = np.array(col)
-            data = np.array(data)
-            Km = sp.sparse.coo_matrix((data, (row, col)), shape=(len(self.nodes)*6, len(self.nodes)*6))
+            # Sum the member terms into the sparse matrix, reusing the stored pattern when possible.
+            Km = self._assemble_sparse('Km', [rows], [cols], [data])
+        else:
+            # `np.add.at` accumulates repeated (row, col) pairs from members sharing a node.
+            Km = np.zeros((len(self.nodes)*6, len(self.nodes)*6))
+            np.add.at(Km, (rows, cols), data)
 
         # Check that there are no nodal instabilities
         # if check_stability:
@@ -2114,96 +2116,157 @@ class FEModel3D():
         :rtype: NDArray[float64]
         """
 
-        # Initialize a zero vector to hold all the terms
-        FER = np.zeros((len(self.nodes) * 6, 1))
+        # Combine the cached load case vectors using the load combination's factors
+        return self._load_vectors([combo_name])[1]
 
-        # Step through each physical member in the model; each sub-member reports a 12x1 block
-        # that already lives in global coordinates, so we can drop it straight onto the matching
-        # DOFs without touching individual entries.
-        for phys_member in self.members.values():
+    def P(self, combo_name='Combo 1') -> NDArray[float64]:
+        """Assembles and returns the global nodal force vector.
 
-            # Step through each sub-member and add terms
-            for member in phys_member.sub_members.values():
+        :param combo_name: The name of the load combination to get the force vector for. Defaults
+                           to 'Combo 1'.
+        :type combo_name: str, optional
+        :return: The global nodal force vector.
+        :rtype: NDArray[float64]
+        """
 
-                # Grab the member's fixed-end reactions and add the entire 12x1 block
-                # directly at the matching DOF locations. Casting/reshaping makes sure we have
-                # a flat float vector that aligns with the DOF helper ordering.
-                member_FER = np.asarray(member.FER(combo_name), dtype=float).reshape(-1)
-                dofs = self._build_dof_vector(member.i_node, member.j_node)
-                FER[dofs, 0] += member_FER
+        # Combine the cached load case vectors using the load combination's factors
+        return self._load_vectors([combo_name])[0]
 
-        # Repeat the same block-based add for rectangular plates (24x1 reaction blocks).
-        for plate in self.plates.values():
+    def _load_vectors(self, combo_names: List[str]) -> Tuple[NDArray[float64], NDArray[float64]]:
+        """Returns the global nodal force vectors and fixed end reaction vectors for several load combinations at once.
 
-            # Add the 24x1 plate reactions with the same DOF helper used for stiffness/mass so
-            # the indexing stays consistent across every assembler.
-            plate_FER = np.asarray(plate.FER(combo_name), dtype=float).reshape(-1)
-            dofs = self._build_dof_vector(plate.i_node, plate.j_node, plate.m_node, plate.n_node)
-            FER[dofs, 0] += plate_FER
+        Load vectors are linear in the load factors, so they are calculated once for each primitive load case and then combined for every load combination with a single matrix multiplication.
 
-        # Quadrilaterals follow the same pattern: 24x1 block dropped in via the DOF helper.
-        for quad in self.quads.values():
+        :param combo_names: The names of the load combinations.
+        :type combo_names: list
+        :return: The nodal force vectors and the fixed end reaction vectors, each as an (n_dofs, len(combo_names)) array with one column per load combination.
+        :rtype: tuple
+        """
 
-            # Add the 24x1 quad reactions in a single vectorized write via the DOF helper.
-            quad_FER = np.asarray(quad.FER(combo_name), dtype=float).reshape(-1)
-            dofs = self._build_dof_vector(quad.i_node, quad.j_node, quad.m_node, quad.n_node)
-            FER[dofs, 0] += quad_FER
+        # Collect the load cases used by the load combinations
+        combos = [self.load_combos[name] for name in combo_names]
+        cases = list(dict.fromkeys(case for combo in combos for case in combo.factors))
 
-        # Return the global fixed end reaction vector
-        return FER
+        # Build the (n_cases x n_combos) matrix of load factors
+        factors = np.zeros((len(cases), len(combos)))
+        row = {case: i for i, case in enumerate(cases)}
+        for j, combo in enumerate(combos):
+            for case, factor in combo.factors.items():
+                factors[row[case], j] += factor
 
-    def P(self, combo_name='Combo 1') -> NDArray[float64]:
-        """Assembles and returns the global nodal force vector.
+        # Combine the load case vectors
+        P_cases, FER_cases = self._case_load_vectors(cases)
+        return P_cases @ factors, FER_cases @ factors
 
-        :param combo_name: The name of the load combination to get the force vector for. Defaults
-                           to 'Combo 1'.
-        :type combo_name: str, optional
-        :return: The global nodal force vector.
-        :rtype: NDArray[float64]
+    def _case_load_vectors(self, cases: List[str]) -> Tuple[NDArray[float64], NDArray[float64]]:
+        """Returns the global nodal force vector and fixed end reaction vector for each of the given load cases, calculating any that aren't already cached.
+
+        The `add_*_load` and `add_*_surface_pressure` methods keep the cache up to date for the load case they change. Loads edited directly in a node's or element's load list are caught by comparing a snapshot of every load list (see `_load_signature`) with the one the cache was built for, which discards the whole cache when they differ.
+
+        :param cases: The names of the load cases.
+        :type cases: list
+        :return: The nodal force vectors and the fixed end reaction vectors, each as an (n_dofs, len(cases)) array with one column per load case.
+        :rtype: tuple
         """
 
-        # Initialize a zero vector to hold all the terms
-        P = np.zeros((len(self.nodes)*6, 1))
+        n_dofs = len(self.nodes)*6
+
+        # Discard the cache if the model's geometry, size or loads have changed since it was built
+        key = (self._version, n_dofs, self._load_signature())
+        if key != self._case_loads_key:
+            self._case_loads = {}
+            self._case_loads_key = key
+
+        # Calculate the load vectors for any load cases that aren't cached yet
+        missing = [case for case in cases if case not in self._case_loads]
+        if missing:
+            self._assemble_case_loads(missing)
 
-        # Get the load combination for the given 'combo_name'
-        combo = self.load_combos[combo_name]
+        # Gather the load case vectors into matrices
+        P = np.zeros((n_dofs, len(cases)))
+        FER = np.zeros((n_dofs, len(cases)))
+        for j, case in enumerate(cases):
+            P[:, j], FER[:, j] = self._case_loads[case]
+
+        return P, FER
+
+    def _load_signature(self) -> Tuple:
+        """Returns a snapshot of every node load, member load and plate/quad pressure in the model, used to tell whether the load case cache is still valid. The snapshot is compared by value rather than hashed, so distinct loads can never be mistaken for each other. Building and comparing it takes one pass over the load lists, which is much cheaper than re-assembling the fixed end reactions.
+
+        :return: A tuple holding each element's loads as tuples.
+        :rtype: tuple
+        """
+
+        loads = [tuple(map(tuple, node.NodeLoads)) for node in self.nodes.values()]
+        for member in self.members.values():
+            loads.append(tuple(map(tuple, member.PtLoads)))
+            loads.append(tuple(map(tuple, member.DistLoads)))
+        for element in (*self.plates.values(), *self.quads.values()):
+            loads.append(tuple(map(tuple, element.pressures)))
+
+        return tuple(loads)
+
+    def _assemble_case_loads(self, cases: List[str]) -> None:
+        """Assembles the global nodal force vector and fixed end reaction vector for each of the given load cases with a unit load factor, and stores them in the load case cache.
+
+        :param cases: The names of the load cases to assemble.
+        :type cases: list
+        """
+
+        n_dofs = len(self.nodes)*6
+        column = {case: j for j, case in enumerate(cases)}
+        P = np.zeros((n_dofs, len(cases)))
+        FER = np.zeros((n_dofs, len(cases)))
 
         # Map load direction strings to their DOF offsets once so we do not re-run the
         # if/elif ladder for every single nodal load.
         dof_lookup = {'FX': 0, 'FY': 1, 'FZ': 2, 'MX': 3, 'MY': 4, 'MZ': 5}
 
-        # Add terms for each node in the model
+        # Add each nodal load straight into its load case's column. Unknown direction labels are ignored to match the previous behavior.
         for node in self.nodes.values():
-
-            # Accumulate this node's six DOF loads locally before writing to the global vector.
-            # This keeps the code vectorized and avoids hammering the global array for every
-            # individual load tuple.
-            local = np.zeros(6, dtype=float)
-
             for direction, magnitude, case in node.NodeLoads:
-                # Look up the combo factor once per load; loads from unrelated cases are skipped
-                # immediately instead of falling through nested conditionals.
-                factor = combo.factors.get(case)
-                if factor is None:
+                j = column.get(case)
+                idx = dof_lookup.get(direction.upper())
+                if j is None or idx is None:
                     continue
+                P[node.ID*6 + idx, j] += magnitude
 
-                # Normalize the direction string and map it to the correct DOF slot. Unknown
-                # direction labels are ignored to match the previous behavior.
-                idx = dof_lookup.get(direction.upper())
-                if idx is None:
-                    continue  # Ignore load types outside the standard 6 DOFs
+        # Elements look their loads up through a load combination, so register a temporary unit load combination for each load case
+        unit_combos = {case: LoadCombo(Analysis.CASE_LOAD_PREFIX + case, None, {case: 1.0}) for case in cases}
+        for combo in unit_combos.values():
+            self.load_combos[combo.name] = combo
+
+        try:
+
+            # Step through each sub-member. Each one reports a 12x1 block that already lives in global coordinates, so it can be dropped straight onto the matching DOFs. Only the load cases the sub-member actually carries loads for are evaluated.
+            for phys_member in self.members.values():
+                for member in phys_member.sub_members.values():
+                    member_cases = {load[3] for load in member.PtLoads} | {load[5] for load in member.DistLoads}
+                    member_cases = [case for case in member_cases if case in column]
+                    if not member_cases:
+                        continue
+                    dofs = self._build_dof_vector(member.i_node, member.j_node)
+                    for case in member_cases:
+                        FER[dofs, column[case]] += np.asarray(member.FER(unit_combos[case].name), dtype=float).reshape(-1)
 
-                # Add the scaled load into the local 6-entry accumulator.
-                local[idx] += factor * magnitude
+            # Repeat the same block-based add for rectangular plates and quadrilaterals (24x1 reaction blocks)
+            for element in (*self.plates.values(), *self.quads.values()):
+                element_cases = [case for case in {pressure[1] for pressure in element.pressures} if case in column]
+                if not element_cases:
+                    continue
+                dofs = self._build_dof_vector(element.i_node, element.j_node, element.m_node, element.n_node)
+                for case in element_cases:
+                    FER[dofs, column[case]] += np.asarray(element.FER(unit_combos[case].name), dtype=float).reshape(-1)
 
-            # Once all loads for this node are tallied, drop the 6x1 block into the global
-            # vector via the DOF helper. Empty accumulators are skipped to avoid pointless writes.
-            if np.any(local):
-                dofs = self._build_dof_vector(node)
-                P[dofs, 0] += local
+        finally:
 
-        # Return the global nodal force vector
-        return P
+            # Remove the temporary load combinations
+            for combo in unit_combos.values():
+                self.load_combos.pop(combo.name, None)
+
+        # Store each load case's vectors
+        for case, j in column.items():
+            self._case_loads[case] = (P[:, j].copy(), FER[:, j].copy())
 
     def D(self, combo_name='Combo 1') -> NDArray[float64]:
         """Returns the global displacement vector for the model.
@@ -2216,9 +2279,31 @@ class FEModel3D():
         """
 
         # Return the global displacement vector
+        return self.node_displacements(combo_name)
+
+    def node_displacements(self, combo_name='Combo 1') -> NDArray[float64]:
+        """Returns the displacements of every node for a load combination, as the load combination's column of the model's displacement matrix. Node `node.ID` occupies rows `node.ID*6` to `node.ID*6 + 5` (DX, DY, DZ, RX, RY, RZ).
+
+        :param combo_name: The name of the load combination to get the results for. Defaults to 'Combo 1'.
+        :type combo_name: str, optional
+        :raises KeyError: Occurs when the load combination has not been solved.
+        :return: An (n_dofs, 1) view of the displacements. Entries that have not been calculated are NaN.
+        :rtype: NDArray[float64]
+        """
         return self._D[combo_name]
 
-    def analyze_linear(self, log=False, check_stability=True, check_statics=False, sparse=True, combo_tags=None):
+    def node_reactions(self, combo_name='Combo 1') -> NDArray[float64]:
+        """Returns the reactions of every node for a load combination, as the load combination's column of the model's reaction matrix. Rows are ordered as for `node_displacements` (FX, FY, FZ, MX, MY, MZ).
+
+        :param combo_name: The name of the load combination to get the results for. Defaults to 'Combo 1'.
+        :type combo_name: str, optional
+        :raises KeyError: Occurs when the load combination's reactions have not been calculated.
+        :return: An (n_dofs, 1) view of the reactions. Entries that have not been calculated are NaN.
+        :rtype: NDArray[float64]
+        """
+        return self._reactions[combo_name]
+
+    def analyze_linear(self, log=False, check_stability=True, check_statics=False, sparse=True, combo_tags=None, solver=None, preconditioner='jacobi', tolerance=1e-8):
         """Performs first-order static analysis. This analysis procedure is much faster since it only assembles the global stiffness matrix once, rather than once for each load combination. It is not appropriate when non-linear behavior such as tension/compression only analysis or P-Delta analysis are required.
 
         :param log: Prints the analysis log to the console if set to True. Default is False.
@@ -2229,74 +2314,118 @@ class FEModel3D():
         :type check_statics: bool, optional
         :param sparse: Indicates whether the sparse matrix solver should be used. A matrix can be considered sparse or dense depening on how many zero terms there are. Structural stiffness matrices often contain many zero terms. The sparse solver can offer faster solutions for such matrices. Using the sparse solver on dense matrices may lead to slower solution times. Be sure ``scipy`` is installed to use the sparse solver. Default is True.
         :type sparse: bool, optional
+        :param solver: Set to ``'banded'`` to store ``K11`` in symmetric band form and solve every load combination with a banded Cholesky factorization. This is usually the fastest option for frame models numbered with reverse Cuthill-McKee ordering (see ``node_ordering``). If the stiffness matrix is not positive-definite the analysis falls back to the LU factorization selected by ``sparse``. Set to ``'pcg'`` to solve with preconditioned conjugate gradients instead of factorizing, which needs far less memory on very large models. Each load combination is warm started from the previous combination's displacements, and the iteration counts are stored in ``solver_stats``. Defaults to ``None``, which uses the LU factorization.
+        :type solver: str, optional
+        :param preconditioner: The preconditioner used when ``solver`` is ``'pcg'``: ``'jacobi'`` (diagonal scaling), ``'block_jacobi'`` (inverse of each node's 6x6 block) or ``'ilu'`` (incomplete LU factorization). Defaults to ``'jacobi'``.
+        :type preconditioner: str, optional
+        :param tolerance: The relative residual at which the ``'pcg'`` solver is considered converged. Defaults to ``1e-8``.
+        :type tolerance: float, optional
+        :raises ValueError: Occurs when `solver` is not recognized.
         :raises Exception: Occurs when a singular stiffness matrix is found. This indicates an unstable structure has been modeled.
         """
 
+        # Validate the requested solver before doing any work
+        if solver not in (None, 'banded', 'pcg'):
+            raise ValueError(f"Unrecognized solver '{solver}'. Use None, 'banded' or 'pcg'.")
+
+        # Prepare the model, then assemble and factorize the stiffness matrix once. The same factorization is used for every load combination, and is left on the model so it can be reused after the analysis.
+        D1_indices, D2_indices, D2, factorization = self._factorize_linear('Analyzing: Linear', log, check_stability, sparse, solver, preconditioner, tolerance)
+
+        # Identify which load combinations have the tags the user has given
+        combo_list = Analysis._identify_combos(self, combo_tags)
+
+        # Build the right-hand side for every load combination as one column of a single matrix
         if log:
-            print('+-------------------+')
-            print('| Analyzing: Linear |')
-            print('+-------------------+')
+            print('')
+            print('- Assembling load vectors for ' + str(len(combo_list)) + ' load combinations')
+        P, FER = self._load_vectors([combo.name for combo in combo_list])
+        RHS = P[D1_indices, :] - FER[D1_indices, :] - factorization.K12 @ D2
 
-        # Import `scipy` features if the sparse solver is being used
-        if sparse == True:
-            from scipy.sparse.linalg import spsolve
+        # Calculate the global displacement vectors for all load combinations in one batched solve
+        if log:
+            print('- Calculating global displacement vectors')
+        D1_combos = factorization.solve(RHS)
 
-        # Prepare the model for analysis
-        Analysis._prepare_model(self)
+        # Record how many iterations each load combination took
+        if solver == 'pcg':
+            for j, combo in enumerate(combo_list):
+                Analysis._record_solver_stats(self, combo.name, factorization.stats[j:j + 1], log)
 
-        # Get the auxiliary list used to determine how the matrices will be partitioned
-        D1_indices, D2_indices, D2 = Analysis._partition_D(self)
+        # Store the calculated displacements to the model and the nodes in the model
+        for j, combo in enumerate(combo_list):
+            Analysis._store_displacements(self, D1_combos[:, j:j + 1], D2, D1_indices, D2_indices, combo)
 
-        # Get the partitioned global stiffness matrix K11, K12, K21, K22
-        # Note that for linear analysis the stiffness matrix can be obtained for any load combination, as it's the same for all of them
-        combo_name = list(self.load_combos.keys())[0]
-        if sparse == True:
-            K11, K12, K21, K22 = Analysis._partition(self, self.K(combo_name, log, check_stability, sparse).tocsr(), D1_indices, D2_indices)
-        else:
-            K11, K12, K21, K22 = Analysis._partition(self, self.K(combo_name, log, check_stability, sparse), D1_indices, D2_indices)
+        # Calculate reactions
+        Analysis._calc_reactions(self, log, combo_tags)
 
-        # Identify which load combinations have the tags the user has given
+        if log:
+            print('')
+            print('- Analysis complete')
+            print('')
+
+        # Check statics if requested
+        if check_statics == True:
+            Analysis._check_statics(self, combo_tags)
+
+        # Flag the model as solved
+        self.solution = 'Linear'
+
+    def analyze_superposition(self, log=False, check_stability=True, check_statics=False, sparse=True, combo_tags=None):
+        """Performs first-order static analysis by superposition of load cases. The global stiffness matrix is assembled once and every primitive load case in ``load_cases`` is solved in a single multi-column solve. Displacements and reactions for each load combination are then formed by multiplying the load case results by a (cases x combos) matrix of load factors, so adding load combinations costs almost nothing. Member end forces and internal results are calculated from the combined displacements. Like `analyze_linear`, this is not appropriate when tension/compression-only or P-Delta behavior is required.
+
+        :param log: Prints the analysis log to the console if set to True. Default is False.
+        :type log: bool, optional
+        :param check_stability: When set to True, checks the stiffness matrix for any unstable degrees of freedom and reports them back to the console. This does add to the solution time. Defaults to True.
+        :type check_stability: bool, optional
+        :param check_statics: When set to True, causes a statics check to be performed. Defaults to False.
+        :type check_statics: bool, optional
+        :param sparse: Indicates whether the sparse matrix solver should be used. Default is True.
+        :type sparse: bool, optional
+        :param combo_tags: Tags used to select which load combinations to calculate results for. If ``None``, all load combinations are calculated. Defaults to ``None``.
+        :type combo_tags: list, optional
+        :raises Exception: Occurs when a singular stiffness matrix is found. This indicates an unstable structure has been modeled.
+        """
+
+        # Prepare the model, then assemble and factorize the stiffness matrix once for all the load cases
+        D1_indices, D2_indices, D2, factorization = self._factorize_linear('Analyzing: Linear Superposition', log, check_stability, sparse)
+
+        # Identify which load combinations have the tags the user has given. This has to be done before the temporary load case combinations are added to the model.
         combo_list = Analysis._identify_combos(self, combo_tags)
 
-        # Step through each load combination
-        for combo in combo_list:
+        # Add a temporary unit load combination for each load case
+        case_combos = Analysis._add_case_combos(self)
+
+        try:
 
             if log:
-                print('')
-                print('- Analyzing load combination ' + combo.name)
+                print('- Solving ' + str(len(case_combos) - 1) + ' load cases for ' + str(len(combo_list)) + ' load combinations')
 
-            # Get the partitioned global fixed end reaction vector
-            FER1, FER2 = Analysis._partition(self, self.FER(combo.name), D1_indices, D2_indices)
+            # Build one right-hand side column per load case. The first column carries the enforced displacements only, and the load case columns are solved with all known displacements set to zero so they can be freely scaled by load factors.
+            RHS = np.zeros((len(D1_indices), len(case_combos)))
+            if len(D1_indices) > 0:
+                RHS[:, 0:1] = -(factorization.K12 @ D2)
+            P, FER = self._load_vectors([combo.name for combo in case_combos[1:]])
+            RHS[:, 1:] = P[D1_indices, :] - FER[D1_indices, :]
 
-            # Get the partitioned global nodal force vector
-            P1, P2 = Analysis._partition(self, self.P(combo.name), D1_indices, D2_indices)
+            # Calculate the global displacement vectors for all the load cases in one batched solve
+            D1_cases = factorization.solve(RHS)
 
-            # Calculate the global displacement vector
-            if log:
-                print('- Calculating global displacement vector')
-            if K11.shape == (0, 0):
-                # All displacements are known, so D1 is an empty vector
-                D1 = []
-            else:
-                try:
-                    # Calculate the unknown displacements D1
-                    if sparse == True:
-                        # The partitioned stiffness matrix originates as `coo` and is converted
-                        # to `csr` format for mathematical operations. The `@` operator performs
-                        # matrix multiplication on sparse matrices.
-                        D1 = spsolve(K11.tocsr(), np.subtract(np.subtract(P1, FER1), K12.tocsr() @ D2))
-                        D1 = D1.reshape(len(D1), 1)
-                    else:
-                        D1 = solve(K11, np.subtract(np.subtract(P1, FER1), np.matmul(K12, D2)))
-                except:
-                    # Return out of the method if 'K' is singular and provide an error message
-                    raise Exception('The stiffness matrix is singular, which implies rigid body motion. The structure is unstable. Aborting analysis.')
+            # Store the displacements for each load case
+            D2_zero = np.zeros(D2.shape)
+            for j, combo in enumerate(case_combos):
+                Analysis._store_displacements(self, D1_cases[:, j:j + 1], D2 if j == 0 else D2_zero, D1_indices, D2_indices, combo)
 
-            # Store the calculated displacements to the model and the nodes in the model
-            Analysis._store_displacements(self, D1, D2, D1_indices, D2_indices, combo)
+            # Calculate reactions for each load case
+            Analysis._calc_reactions(self, log, [Analysis.SUPERPOSITION_TAG])
 
-        # Calculate reactions
-        Analysis._calc_reactions(self, log, combo_tags)
+            # Combine the load case results into load combination results
+            if log:
+                print('- Combining load case results')
+            Analysis._superpose_cases(self, case_combos, combo_list)
+
+        finally:
+            # Remove the temporary load combinations and their results from the model
+            Analysis._remove_case_combos(self, case_combos)
 
         if log:
             print('')
@@ -2310,13 +2439,62 @@ class FEModel3D():
         # Flag the model as solved
         self.solution = 'Linear'
 
-    def analyze(self, log=False, check_stability=True, check_statics=False, max_iter=30, sparse=True, combo_tags=None, spring_tolerance=0, member_tolerance=0, num_steps=1):
+    def _factorize_linear(self, title: str, log: bool = False, check_stability: bool = True, sparse: bool = True, solver: str | None = None, preconditioner: str = 'jacobi', tolerance: float = 1e-8) -> Tuple:
+        """Prepares the model for a linear analysis, then assembles, partitions and factorizes the global stiffness matrix. Shared by `analyze_linear` and `analyze_superposition`.
+
+        :param title: The heading printed to the console when `log` is True.
+        :type title: str
+        :param log: Prints updates to the console if set to True. Defaults to False.
+        :type log: bool, optional
+        :param check_stability: Checks the stiffness matrix for instabilities if set to True. Defaults to True.
+        :type check_stability: bool, optional
+        :param sparse: Indicates whether sparse matrices and factorizations should be used. Defaults to True.
+        :type sparse: bool, optional
+        :param solver: The solver passed on to `Analysis._factorize`. Defaults to None.
+        :type solver: str, optional
+        :param preconditioner: The preconditioner used when `solver` is 'pcg'. Defaults to 'jacobi'.
+        :type preconditioner: str, optional
+        :param tolerance: The relative residual tolerance used when `solver` is 'pcg'. Defaults to 1e-8.
+        :type tolerance: float, optional
+        :return: The unknown and enforced degree of freedom indices, the enforced displacements, and the factorization of `K11` (which also holds `K12`).
+        :rtype: tuple
+        """
+
+        if log:
+            print('+' + '-'*(len(title) + 2) + '+')
+            print('| ' + title + ' |')
+            print('+' + '-'*(len(title) + 2) + '+')
+
+        # Prepare the model for analysis
+        Analysis._prepare_model(self)
+
+        # Get the auxiliary list used to determine how the matrices will be partitioned
+        D1_indices, D2_indices, D2 = Analysis._partition_D(self)
+
+        # Get the partitioned global stiffness matrix K11, K12, K21, K22
+        # Note that for linear analysis the stiffness matrix can be obtained for any load combination, as it's the same for all of them
+        combo_name = list(self.load_combos.keys())[0]
+        K11, K12, K21, K22 = Analysis._partition(self, self.K(combo_name, log, check_stability, sparse), D1_indices, D2_indices)
+
+        # Factorize K11
+        if log:
+            print('- Factorizing the global stiffness matrix')
+        factorization = Analysis._factorize(self, K11, D1_indices, sparse, Analysis._stiffness_state(self, combo_name), K12, K21, K22, solver, log, preconditioner, tolerance)
+
+        return D1_indices, D2_indices, D2, factorization
+
+    def analyze(self, log=False, check_stability=True, check_statics=False, max_iter=30, sparse=True, combo_tags=None, spring_tolerance=0, member_tolerance=0, num_steps=1, solver=None, max_update_rank=96, workers=1):
         """Performs a first-order elastic analysis of the model.
 
         Allows sparse solvers for larger models, handles tension/compression-only
         behavior for nodal springs and members via iteration, and supports load
         stepping for improved convergence.
 
+        Every load combination starts from the tension/compression-only node support
+        spring states at the start of the analysis, so the results don't depend on the
+        order of the load combinations or on `workers`. After the analysis the node
+        support springs are left in the final state of the last load combination.
+
         :param log: If ``True``, prints progress messages during analysis. Defaults to ``False``.
         :type log: bool, optional
         :param check_stability: If ``True``, checks model stability at each analysis step. Defaults to ``True``.
@@ -2335,18 +2513,25 @@ class FEModel3D():
         :type member_tolerance: float, optional
         :param num_steps: Number of load increments for applying load combinations. Use more steps for better convergence in highly nonlinear cases. Defaults to ``1``.
         :type num_steps: int, optional
+        :param solver: Set to ``'banded'`` to store ``K11`` in symmetric band form and solve every load combination with a banded Cholesky factorization. This is usually the fastest option for frame models numbered with reverse Cuthill-McKee ordering (see ``node_ordering``). If the stiffness matrix is not positive-definite the analysis falls back to the LU factorization selected by ``sparse``. Defaults to ``None``, which uses the LU factorization.
+        :type solver: str, optional
+        :param max_update_rank: When tension/compression-only elements switch on or off, the existing factorization is corrected with a low-rank (Woodbury) update instead of refactorizing, as long as no more than this many degrees of freedom are affected. Set to ``0`` to always refactorize. Defaults to ``96``.
+        :type max_update_rank: int, optional
+        :param workers: The number of worker processes used to solve the load combinations in parallel. Each load combination is solved independently from a compact array snapshot of the model, starting from the support spring states at the start of the analysis, and the results are stored in load combination order. Set to ``None`` to use one worker per CPU. Models with member loads on tension/compression-only members are always solved sequentially. Defaults to ``1``.
+        :type workers: int, optional
+        :raises ValueError: If `solver` is not recognized.
         :raises Exception: If the stiffness matrix is singular (indicating instability) or if the model fails to converge within the maximum allowed iterations.
         """
 
+        # Validate the requested solver before doing any work
+        if solver not in (None, 'banded'):
+            raise ValueError(f"Unrecognized solver '{solver}'. Use None or 'banded'.")
+
         if log:
             print('+-----------+')
             print('| Analyzing |')
             print('+-----------+')
 
-        # Import `scipy` features if the sparse solver is being used
-        if sparse == True:
-            from scipy.sparse.linalg import spsolve
-
         # Prepare the model for analysis
         Analysis._prepare_model(self)
 
@@ -2356,96 +2541,31 @@ class FEModel3D():
         # Get the auxiliary list used to determine how the matrices will be partitioned
         D1_indices, D2_indices, D2 = Analysis._partition_D(self)
 
-        # Calculate the incremental enforced displacement vector
-        Delta_D2 = D2/num_steps
-
-        # Step through each load combination
-        for combo in combo_list:
-
-            if log:
-                print('')
-                print('- Analyzing load combination ' + combo.name)
-
-            # Get the partitioned total global fixed end reaction vector
-            FER1, FER2 = Analysis._partition(self, self.FER(combo.name), D1_indices, D2_indices)
-
-            # Calculate the incremental global fixed end reaction vector
-            Delta_FER1 = FER1/num_steps
-
-            # Get the partitioned total global nodal force vector
-            P1, P2 = Analysis._partition(self, self.P(combo.name), D1_indices, D2_indices)
+        # Solve the load combinations in worker processes if requested, otherwise step through them one at a time
+        if not self._analyze_in_parallel(combo_list, D1_indices, D2_indices, D2, workers, log, check_stability, sparse, max_iter, spring_tolerance, member_tolerance, num_steps, solver, max_update_rank):
 
-            # Calculate the incremental global nodal force vector
-            Delta_P1 = P1/num_steps
+            # Every load combination starts from the node support spring states at the start of the analysis, as it does in the worker processes
+            node_springs = Analysis._TC_node_springs(self)
+            initial_states = [spring[2] for spring in node_springs]
 
-            # Apply the load incrementally
-            load_step = 1
-            while load_step <= num_steps:
+            for combo in combo_list:
 
-                # Keep track of the number of iterations in this load step
-                iter_count = 1
-                convergence = False
-                divergence = False
-
-                # Iterate until convergence or divergence occurs
-                while convergence == False and divergence == False:
-
-                    # Check for tension/compression-only divergence
-                    if iter_count > max_iter:
-                        divergence = True
-                        raise Exception('Model diverged during tension/compression-only analysis')
-
-                    # Report which load step we are on
-                    if log:
-                        print(f'- Analyzing load step #{str(load_step)}')
-
-                    # Get the partitioned global stiffness matrix K11, K12, K21, K22
-                    if sparse == True:
-                        K11, K12, K21, K22 = Analysis._partition(self, self.K(combo.name, log, check_stability, sparse).tocsr(), D1_indices, D2_indices)
-                    else:
-                        K11, K12, K21, K22 = Analysis._partition(self, self.K(combo.name, log, check_stability, sparse), D1_indices, D2_indices)
-
-                    if K11.shape == (0, 0):
-                        # All displacements are known, so Delta_D1 is an empty vector
-                        Delta_D1 = []
-                    else:
-                        try:
-                            # Calculate the unknown displacements Delta_D1
-                            if sparse == True:
-                                # The partitioned stiffness matrix originates as `coo` and is converted to `csr`
-                                # format for mathematical operations. The `@` operator performs matrix multiplication
-                                # on sparse matrices.
-                                Delta_D1 = spsolve(K11.tocsr(), np.subtract(np.subtract(Delta_P1, Delta_FER1), K12.tocsr() @ Delta_D2))
-                                Delta_D1 = Delta_D1.reshape(len(Delta_D1), 1)
-                            else:
-                                Delta_D1 = solve(K11, np.subtract(np.subtract(Delta_P1, Delta_FER1), np.matmul(K12, Delta_D2)))
-                        except:
-                            # Return out of the method if 'K' is singular and provide an error message
-                            raise Exception('The stiffness matrix is singular, which implies rigid body motion. The structure is unstable. Aborting analysis.')
-
-                    # Store or sum the calculated displacements to the model and the nodes in the model
-                    if load_step == 1:
-                        Analysis._store_displacements(self, Delta_D1, Delta_D2, D1_indices, D2_indices, combo)
-                    else:
-                        Analysis._sum_displacements(self, Delta_D1, Delta_D2, D1_indices, D2_indices, combo)
-
-                    # Check for tension/compression-only convergence at this load step
-                    convergence = Analysis._check_TC_convergence(self, combo.name, log=log, spring_tolerance=spring_tolerance, member_tolerance=member_tolerance)
-
-                    if convergence == False:
+                if log:
+                    print('')
+                    print('- Analyzing load combination ' + combo.name)
 
-                        if log:
-                            print(f'- Undoing load step #{load_step} due to failed convergence.')
+                for spring, active in zip(node_springs, initial_states):
+                    spring[2] = active
 
-                        # Undo the latest analysis step to prepare for re-analysis of the load step
-                        Analysis._sum_displacements(self, -Delta_D1, -Delta_D2, D1_indices, D2_indices, combo)
+                # Get the partitioned total global fixed end reaction vector
+                FER1, FER2 = Analysis._partition(self, self.FER(combo.name), D1_indices, D2_indices)
 
-                    else:
-                        # Move on to the next load step
-                        load_step += 1
+                # Get the partitioned total global nodal force vector
+                P1, P2 = Analysis._partition(self, self.P(combo.name), D1_indices, D2_indices)
 
-                    # Keep track of the number of tension/compression only iterations
-                    iter_count += 1
+                # Apply the load incrementally, iterating each load step until the tension/compression-only elements converge
+                combo_model = Analysis._ModelCombo(self, combo.name, D1_indices, D2_indices, sparse, check_stability, log)
+                Analysis._solve_load_steps(combo_model, P1, FER1, D2, num_steps, max_iter, spring_tolerance, member_tolerance, solver, max_update_rank)
 
         # Calculate reactions
         Analysis._calc_reactions(self, log, combo_tags)
@@ -2462,7 +2582,7 @@ class FEModel3D():
         # Flag the model as solved
         self.solution = 'Nonlinear TC'
 
-    def analyze_PDelta(self, log=False, check_stability=True, max_iter=30, sparse=True, combo_tags=None):
+    def analyze_PDelta(self, log=False, check_stability=True, max_iter=30, sparse=True, combo_tags=None, solver=None, preconditioner='jacobi', tolerance=1e-8, workers=1):
         """Performs second order (P-Delta) analysis. This type of analysis is appropriate for most models using beams, columns and braces. Second order analysis is usually required by material specific codes. The analysis is iterative and takes longer to solve. Models with slender members and/or members with combined bending and axial loads will generally have more significant P-Delta effects. P-Delta effects in plates/quads are not considered.
 
         :param log: Prints updates to the console if set to True. Default is False.
@@ -2473,19 +2593,27 @@ class FEModel3D():
         :type max_iter: int, optional
         :param sparse: Indicates whether the sparse matrix solver should be used. A matrix can be considered sparse or dense depening on how many zero terms there are. Structural stiffness matrices often contain many zero terms. The sparse solver can offer faster solutions for such matrices. Using the sparse solver on dense matrices may lead to slower solution times. Be sure ``scipy`` is installed to use the sparse solver. Default is True.
         :type sparse: bool, optional
-        :raises ValueError: Occurs when there is a singularity in the stiffness matrix, which indicates an unstable structure.
+        :param solver: Set to ``'pcg'`` to solve with preconditioned conjugate gradients instead of factorizing. Each solve is warm started from the previous P-Delta iteration's displacements, and the iteration counts are stored in ``solver_stats``. Defaults to ``None``, which uses the factorization selected by ``sparse``.
+        :type solver: str, optional
+        :param preconditioner: The preconditioner used when ``solver`` is ``'pcg'``: ``'jacobi'`` (diagonal scaling), ``'block_jacobi'`` (inverse of each node's 6x6 block) or ``'ilu'`` (incomplete LU factorization). Defaults to ``'jacobi'``.
+        :type preconditioner: str, optional
+        :param tolerance: The relative residual at which the ``'pcg'`` solver is considered converged. Defaults to ``1e-8``.
+        :type tolerance: float, optional
+        :param workers: The number of worker processes used to solve the load combinations in parallel, as for ``analyze``. Not used with the ``'pcg'`` solver. As with ``analyze``, every load combination starts from the node support spring states at the start of the analysis, so the results don't depend on the number of workers. Defaults to ``1``.
+        :type workers: int, optional
+        :raises ValueError: Occurs when there is a singularity in the stiffness matrix, which indicates an unstable structure, or when `solver` is not recognized.
         :raises Exception: Occurs when a model fails to converge.
         """
 
+        # Validate the requested solver before doing any work
+        if solver not in (None, 'pcg'):
+            raise ValueError(f"Unrecognized solver '{solver}'. Use None or 'pcg'.")
+
         if log:
             print('+--------------------+')
             print('| Analyzing: P-Delta |')
             print('+--------------------+')
 
-        # Import `scipy` features if the sparse solver is being used
-        if sparse == True:
-            from scipy.sparse.linalg import spsolve
-
         # Prepare the model for analysis
         Analysis._prepare_model(self)
 
@@ -2495,17 +2623,26 @@ class FEModel3D():
         # Identify which load combinations have the tags the user has given
         combo_list = Analysis._identify_combos(self, combo_tags)
 
-        # Step through each load combination
-        for combo in combo_list:
+        # Solve the load combinations in worker processes if requested, otherwise step through them one at a time
+        if solver == 'pcg' or not self._analyze_in_parallel(combo_list, D1_indices, D2_indices, D2, workers, log, check_stability, sparse, max_iter, pdelta=True):
 
-            # Get the partitioned global fixed end reaction vector
-            FER1, FER2 = Analysis._partition(self, self.FER(combo.name), D1_indices, D2_indices)
+            # Every load combination starts from the node support spring states at the start of the analysis, as it does in the worker processes
+            node_springs = Analysis._TC_node_springs(self)
+            initial_states = [spring[2] for spring in node_springs]
 
-            # Get the partitioned global nodal force vector
-            P1, P2 = Analysis._partition(self, self.P(combo.name), D1_indices, D2_indices)
+            for combo in combo_list:
 
-            # Run the P-Delta analysis for this load combination
-            Analysis._PDelta(self, combo.name, P1, FER1, D1_indices, D2_indices, D2, log, sparse, check_stability, max_iter)
+                for spring, active in zip(node_springs, initial_states):
+                    spring[2] = active
+
+                # Get the partitioned global fixed end reaction vector
+                FER1, FER2 = Analysis._partition(self, self.FER(combo.name), D1_indices, D2_indices)
+
+                # Get the partitioned global nodal force vector
+                P1, P2 = Analysis._partition(self, self.P(combo.name), D1_indices, D2_indices)
+
+                # Run the P-Delta analysis for this load combination
+                Analysis._PDelta(self, combo.name, P1, FER1, D1_indices, D2_indices, D2, log, sparse, check_stability, max_iter, solver, preconditioner, tolerance)
 
         # Calculate reactions
         Analysis._calc_reactions(self, log, combo_tags)
@@ -2518,6 +2655,37 @@ class FEModel3D():
         # Flag the model as solved
         self.solution = 'P-Delta'
 
+    def _analyze_in_parallel(self, combo_list, D1_indices, D2_indices, D2, workers=1, log=False, check_stability=True, sparse=True, max_iter=30, spring_tolerance=0, member_tolerance=0, num_steps=1, solver=None, max_update_rank=96, pdelta=False) -> bool:
+        """Solves the load combinations in a pool of worker processes (see `ParallelAnalysis`), if more than one worker has been requested and the model can be represented by a `ParallelAnalysis.ModelSnapshot`.
+
+        :param workers: The number of worker processes requested. None uses one per CPU.
+        :type workers: int
+        :param pdelta: Set to True for P-Delta analysis. Defaults to False.
+        :type pdelta: bool, optional
+        :return: True if the load combinations were solved, and False if they still need to be solved sequentially.
+        :rtype: bool
+        """
+
+        if workers is None:
+            workers = ParallelAnalysis.default_workers()
+        workers = min(int(workers), len(combo_list))
+        if workers <= 1:
+            return False
+
+        reason = ParallelAnalysis.ModelSnapshot.supported(self)
+        if reason is not None:
+            if log:
+                print(f'- Solving load combinations sequentially: {reason}')
+            return False
+
+        # The workers don't check the stiffness matrix for instabilities, so the initial stiffness matrix is checked here
+        if check_stability:
+            self.K(combo_list[0].name, log, check_stability, sparse)
+
+        snapshot = ParallelAnalysis.ModelSnapshot(self, combo_list, D1_indices, D2_indices, D2, sparse, pdelta)
+        ParallelAnalysis.solve_combos(self, snapshot, workers, max_iter, spring_tolerance, member_tolerance, num_steps, solver, max_update_rank, log)
+        return True
+
     def analyze_modal(self, num_modes: int = 12, mass_combo_name: str = 'Combo 1', mass_direction: str = 'Y', gravity: float = 1.0, log=False, check_stability=True):
         """
         Performs modal analysis to determine natural frequencies and mode shapes.
@@ -2582,7 +2750,10 @@ class FEModel3D():
             # Solve the generalized eigenvalue problem: [K11]{φ} = λ[M11]{φ}, where λ = ω²
             # Or rewritten: (-[M11]ω² + [K11]){φ} = 0
             # (See "Structural Dynamics for Structural Engineers" by Hart & Wong Equation 4.96)
-            eigenvalues, eigenvectors = sp.sparse.linalg.eigsh(A=K11, k=num_modes, M=M11, sigma=0.0, which='LM')
+            # The shift-invert mode needs the inverse of K11 (the shift is zero). Factorize K11 once and hand the factorization to the eigensolver, rather than letting it build its own. The factorization is also left on the model for reuse.
+            factorization = Analysis._factorize(self, K11, D1_indices, True, Analysis._stiffness_state(self, mass_combo_name), K12, K21, K22)
+            OPinv = sp.sparse.linalg.LinearOperator(K11.shape, matvec=factorization.solve, dtype=float)
+            eigenvalues, eigenvectors = sp.sparse.linalg.eigsh(A=K11, k=num_modes, M=M11, sigma=0.0, which='LM', OPinv=OPinv)
 
         except sp.linalg.LinAlgError as e:
             raise Exception(f'Eigenvalue solution failed: {str(e)}. Check matrix conditioning.')
@@ -2809,27 +2980,8 @@ class FEModel3D():
         Returns a list of the names of nodes that are not attached to any elements.
         """
 
-        # Initialize a list of orphaned nodes
-        orphans = []
-
-        # Step through each node in the model
-        for node in self.nodes.values():
-
-            orphaned = False
-
-            # Check to see if the node is attached to any elements
-            quads = [quad.name for quad in self.quads.values() if quad.i_node == node or quad.j_node == node or quad.m_node == node or quad.n_node == node]
-            plates = [plate.name for plate in self.plates.values() if plate.i_node == node or plate.j_node == node or plate.m_node == node or plate.n_node == node]
-            members = [member.name for member in self.members.values() if member.i_node == node or member.j_node == node]
-            springs = [spring.name for spring in self.springs.values() if spring.i_node == node or spring.j_node == node]
-
-            # Determine if the node is orphaned
-            if quads == [] and plates == [] and members == [] and springs == []:
-                orphaned = True
-
-            # Add the orphaned nodes to the list of orphaned nodes
-            if orphaned == True:
-                orphans.append(node.name)
+        # A node is orphaned if no elements are attached to it in the adjacency index
+        orphans = [node.name for node in self.nodes.values() if not self._attached_elements(node)]
 
         return orphans
 
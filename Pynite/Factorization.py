@@ -0,0 +1,454 @@
+from __future__ import annotations  # Allows more recent type hints features
+from typing import TYPE_CHECKING
+
+import numpy as np
+import scipy as sp
+
+if TYPE_CHECKING:
+    from typing import Dict, Hashable, List, Tuple
+    from numpy import float64
+    from numpy.typing import NDArray
+
+
+class StiffnessFactorization():
+    """
+    A factorization of the partitioned global stiffness matrix `K11` that can be reused to solve any number of right-hand sides.
+
+    Factorizing `K11` is by far the most expensive part of a linear solve, so the factorization is built once per stiffness state and then reused for every load combination, load case, modal shift-invert iteration or influence line that needs it. The most recent factorization is stored on the model as `FEModel3D.K11_factorization`.
+    """
+
+    def __init__(self, K11, D1_indices: List[int], sparse: bool = True, state: Hashable = None, K12=None, K21=None, K22=None, permc_spec: str = 'COLAMD', banded: bool = False) -> None:
+        """Factorizes the partitioned stiffness matrix.
+
+        :param K11: The partitioned stiffness matrix for the unknown degrees of freedom.
+        :type K11: NDArray[float64] or scipy sparse matrix
+        :param D1_indices: The global degree of freedom indices for each row/column of `K11`.
+        :type D1_indices: list
+        :param sparse: Indicates whether a sparse LU (`splu`) or dense LU factorization should be used. Defaults to True.
+        :type sparse: bool, optional
+        :param state: A key describing the stiffness state `K11` was built for (e.g. which tension/compression-only elements were active). It is used to decide whether the factorization can be reused. Defaults to None.
+        :type state: Hashable, optional
+        :param K12: The remaining partitions of the stiffness matrix. These are not factorized, but are kept with the factorization so that load vectors and reactions can be formed for the same stiffness state. Defaults to None.
+        :type K12: NDArray[float64] or scipy sparse matrix, optional
+        :param permc_spec: The column permutation used by the sparse LU factorization (see `scipy.sparse.linalg.splu`). Use 'NATURAL' when the degrees of freedom have already been ordered to reduce fill-in. Defaults to 'COLAMD'.
+        :type permc_spec: str, optional
+        :param banded: If True, `K11` is stored in symmetric band form (upper triangle only) and factorized with a banded Cholesky factorization. This is fastest when the degrees of freedom have been ordered to keep the bandwidth narrow (e.g. reverse Cuthill-McKee). If `K11` turns out not to be positive-definite, the factorization falls back to LU and `banded` is reset to False. Defaults to False.
+        :type banded: bool, optional
+        :raises Exception: Occurs when `K11` is singular, which implies rigid body motion.
+        """
+
+        self.D1_indices: List[int] = D1_indices  # The global DOF index of each row/column
+        self.sparse: bool = sparse               # Indicates a sparse or dense factorization
+        self.state: Hashable = state             # The stiffness state this factorization belongs to
+        self.banded: bool = banded               # Indicates a banded Cholesky factorization
+        self.n: int = K11.shape[0]               # The number of unknown degrees of freedom
+
+        # The stiffness partitions this factorization was built from
+        self.K11 = K11
+        self.K12 = K12
+        self.K21 = K21
+        self.K22 = K22
+
+        # There is nothing to factorize if all displacements are known
+        if self.n == 0:
+            self._lu = None
+            return
+
+        # Try the banded Cholesky factorization first. It only succeeds if `K11` is positive-definite, so models with negative or zero stiffness terms drop through to the LU factorization below.
+        if banded:
+            try:
+                self._lu = sp.linalg.cholesky_banded(_upper_band(K11), lower=False, check_finite=False)
+                return
+            except np.linalg.LinAlgError:
+                self.banded = False
+
+        try:
+            if sparse:
+                # `splu` requires the `csc` format
+                self._lu = sp.sparse.linalg.splu(sp.sparse.csc_matrix(K11), permc_spec=permc_spec)
+            else:
+                self._lu = sp.linalg.lu_factor(np.asarray(K11), check_finite=False)
+        except RuntimeError:
+            raise Exception('The stiffness matrix is singular, which implies rigid body motion. The structure is unstable. Aborting analysis.')
+
+        # The dense LU factorization only warns about zero pivots, so check for them here to keep the same behavior as `numpy.linalg.solve`
+        if not sparse and np.any(np.diag(self._lu[0]) == 0):
+            raise Exception('The stiffness matrix is singular, which implies rigid body motion. The structure is unstable. Aborting analysis.')
+
+    def solve(self, b: NDArray[float64]) -> NDArray[float64]:
+        """Solves `K11 @ x = b` using the stored factorization.
+
+        :param b: The right-hand side(s). This may be a single column or a matrix with one column per right-hand side, all of which are solved in a single call.
+        :type b: NDArray[float64]
+        :return: The solution, with the same shape as `b`.
+        :rtype: NDArray[float64]
+        """
+
+        b = np.asarray(b, dtype=float)
+
+        if self.n == 0:
+            return np.zeros(b.shape)
+
+        if self.banded:
+            x = sp.linalg.cho_solve_banded((self._lu, False), b, check_finite=False)
+        elif self.sparse:
+            x = self._lu.solve(b)
+        else:
+            x = sp.linalg.lu_solve(self._lu, b, check_finite=False)
+
+        return x.reshape(b.shape)
+
+    def matches(self, state: Hashable) -> bool:
+        """Returns True if this factorization was built for the given stiffness state.
+
+        :param state: The stiffness state to compare against.
+        :type state: Hashable
+        :rtype: bool
+        """
+        return self.state is not None and self.state == state
+
+
+def _upper_band(K) -> NDArray[float64]:
+    """Converts a symmetric matrix to the upper band storage used by `scipy.linalg.cholesky_banded`.
+
+    Only the upper triangle of `K` is read. Entry `K[i, j]` (with `i <= j`) is stored at `ab[u + i - j, j]`, where `u` is the number of super-diagonals.
+
+    The band is copied out of the already assembled and partitioned `K11`, rather than assembled directly from the element matrices into band storage. The global stiffness matrix is built once in sparse form and shared by every solver, and partitioning out the supported degrees of freedom is a sparse operation. The cost is that the sparse `K11`, a COO copy of its upper triangle (about half its nonzeros) and the `(u + 1, n)` band array are all held while converting. The band array includes the zeros inside the band, so it is only smaller than a dense `K11` while the bandwidth stays well below `n`. `cholesky_banded` then returns a factor of the same size as the band array.
+
+    :param K: The symmetric matrix (dense or sparse).
+    :type K: NDArray[float64] or scipy sparse matrix
+    :return: The band storage array, with shape `(u + 1, n)`.
+    :rtype: NDArray[float64]
+    """
+
+    # Work from the upper triangle's nonzero terms so the dense matrix never has to be formed
+    upper = sp.sparse.triu(sp.sparse.coo_matrix(K)).tocoo()
+    u = int((upper.col - upper.row).max()) if upper.nnz else 0
+
+    # Sum into the band in case the matrix still holds duplicate entries
+    ab = np.zeros((u + 1, K.shape[0]))
+    np.add.at(ab, (u + upper.row - upper.col, upper.col), upper.data)
+
+    return ab
+
+
+class ConvergenceError(Exception):
+    """Raised when the conjugate gradient solver can't solve a system, either because it didn't converge or because the matrix isn't positive-definite."""
+
+
+class IterativeStiffnessSolver():
+    """
+    A preconditioned conjugate gradient (PCG) solver for the partitioned stiffness matrix `K11`.
+
+    It can be used in place of `StiffnessFactorization` for models that are too large to factorize. Only `K11` and its preconditioner are stored, so memory use grows with the number of nonzero stiffness terms rather than with the fill-in of a factorization. Each solve is warm started from the most recent solution, which is usually a good first guess for the next load combination or P-Delta iteration.
+    """
+
+    PRECONDITIONERS = ('jacobi', 'block_jacobi', 'ilu')
+
+    def __init__(self, K11, D1_indices: List[int], state: Hashable = None, K12=None, K21=None, K22=None, preconditioner: str | StiffnessFactorization = 'jacobi', tolerance: float = 1e-8, max_iter: int | None = None, x0: NDArray[float64] | None = None) -> None:
+        """Builds the preconditioner for the partitioned stiffness matrix.
+
+        :param K11: The partitioned stiffness matrix for the unknown degrees of freedom. It must be symmetric and positive-definite.
+        :type K11: NDArray[float64] or scipy sparse matrix
+        :param D1_indices: The global degree of freedom indices for each row/column of `K11`.
+        :type D1_indices: list
+        :param state: A key describing the stiffness state `K11` was built for. It is used to decide whether the solver can be reused. Defaults to None.
+        :type state: Hashable, optional
+        :param K12: The remaining partitions of the stiffness matrix, kept alongside `K11` so that load vectors and reactions can be formed for the same stiffness state. Defaults to None.
+        :type K12: NDArray[float64] or scipy sparse matrix, optional
+        :param preconditioner: 'jacobi' scales by the diagonal of `K11`, 'block_jacobi' inverts the 6x6 block of each node and 'ilu' uses a symmetric incomplete factorization. An existing factorization of a nearby symmetric positive-definite matrix (anything with a `solve` method) may also be given, which makes a very strong preconditioner when `K11` is only a small change to it. Defaults to 'jacobi'.
+        :type preconditioner: str or StiffnessFactorization, optional
+        :param tolerance: The relative residual `||b - K11 @ x||/||b||` at which a solve is considered converged. Defaults to 1e-8.
+        :type tolerance: float, optional
+        :param max_iter: The maximum number of iterations per right-hand side. If `None`, ten times the number of unknowns is used. Defaults to None.
+        :type max_iter: int, optional
+        :param x0: The initial guess for the first solve. Defaults to None, which starts from zero.
+        :type x0: NDArray[float64], optional
+        :raises ValueError: Occurs when `preconditioner` is not recognized.
+        :raises Exception: Occurs when the preconditioner cannot be built because `K11` is singular.
+        """
+
+        if isinstance(preconditioner, str) and preconditioner not in self.PRECONDITIONERS:
+            raise ValueError(f"Unrecognized preconditioner '{preconditioner}'. Use 'jacobi', 'block_jacobi' or 'ilu'.")
+
+        self.D1_indices: List[int] = D1_indices  # The global DOF index of each row/column
+        self.sparse: bool = True                 # Kept for compatibility with `StiffnessFactorization`
+        self.banded: bool = False                # Kept for compatibility with `StiffnessFactorization`
+        self.state: Hashable = state             # The stiffness state this solver belongs to
+        self.n: int = K11.shape[0]               # The number of unknown degrees of freedom
+        self.preconditioner: str | StiffnessFactorization = preconditioner
+        self.tolerance: float = tolerance
+        self.max_iter: int = max_iter if max_iter is not None else 10*self.n
+
+        # The stiffness partitions this solver was built from
+        self.K11 = K11
+        self.K12 = K12
+        self.K21 = K21
+        self.K22 = K22
+
+        # The most recent solution, used as the starting point for the next solve
+        self.x0: NDArray[float64] | None = None if x0 is None else np.asarray(x0, dtype=float).reshape(-1)
+
+        # Iteration statistics for each right-hand side of the most recent call to `solve`
+        self.stats: List[Dict[str, float]] = []
+
+        # There is nothing to precondition if all displacements are known
+        if self.n == 0:
+            return
+
+        # Matrix-vector products are cheapest in `csr` format
+        self._A = sp.sparse.csr_matrix(K11)
+
+        singular = Exception('The stiffness matrix is singular, which implies rigid body motion. The structure is unstable. Aborting analysis.')
+
+        # A factorization used as the preconditioner is ready to use as is
+        if not isinstance(preconditioner, str):
+            return
+
+        # Every other preconditioner needs a positive diagonal
+        diagonal = self._A.diagonal()
+        if np.any(diagonal <= 0):
+            raise singular
+        self._inv_diagonal = 1/diagonal
+
+        if preconditioner == 'block_jacobi':
+
+            # Group the unknowns by node. Degrees of freedom that are supported are left as identity rows so every block is 6x6.
+            D1 = np.asarray(D1_indices)
+            self._block_of = np.unique(D1//6, return_inverse=True)[1].reshape(-1)
+            self._local = D1 % 6
+            blocks = np.tile(np.eye(6), (int(self._block_of.max()) + 1, 1, 1))
+            blocks[self._block_of, self._local, self._local] = 0
+
+            # Add the stiffness terms that couple degrees of freedom within the same node
+            A = self._A.tocoo()
+            same = self._block_of[A.row] == self._block_of[A.col]
+            np.add.at(blocks, (self._block_of[A.row[same]], self._local[A.row[same]], self._local[A.col[same]]), A.data[same])
+
+            try:
+                self._inv_blocks = np.linalg.inv(blocks)
+            except np.linalg.LinAlgError:
+                raise singular
+
+        elif preconditioner == 'ilu':
+            self._build_incomplete_factorization()
+
+    def _build_incomplete_factorization(self) -> None:
+        """Builds an incomplete `L @ D @ L.T` factorization of `K11` for the 'ilu' preconditioner.
+
+        `K11` is first scaled to a unit diagonal, which makes the drop tolerance independent of the model's units. SuperLU's incomplete LU factorization is then run without pivoting or reordering (the nodes have already been ordered by `FEModel3D.node_ordering`). Only its `L` factor and the diagonal of `U` are kept, so the preconditioner stays symmetric and positive-definite as conjugate gradients requires. Larger drop tolerances are tried if small pivots make `D` indefinite, and if none work the preconditioner falls back to Jacobi scaling.
+        """
+
+        self._scale = np.sqrt(self._inv_diagonal)
+        S = sp.sparse.diags(self._scale) @ self._A @ sp.sparse.diags(self._scale)
+
+        natural = np.arange(self.n)
+        for drop_tol in (1e-3, 1e-2, 1e-1):
+
+            try:
+                ilu = sp.sparse.linalg.spilu(S.tocsc(), drop_tol=drop_tol, fill_factor=10, permc_spec='NATURAL', diag_pivot_thresh=0.0, options={'SymmetricMode': True})
+            except RuntimeError:
+                continue
+
+            # SuperLU may still have pivoted, and the diagonal must be positive for the preconditioner to be positive-definite
+            D = ilu.U.diagonal()
+            if np.array_equal(ilu.perm_r, natural) and np.array_equal(ilu.perm_c, natural) and np.all(D > 0):
+                self._L = ilu.L.tocsr()
+                self._LT = self._L.T.tocsr()
+                self._D = D
+                return
+
+        self.preconditioner = 'jacobi'
+
+    def _apply_preconditioner(self, r: NDArray[float64]) -> NDArray[float64]:
+        """Returns the preconditioned residual `M^-1 @ r`."""
+
+        if not isinstance(self.preconditioner, str):
+            return self.preconditioner.solve(r)
+
+        elif self.preconditioner == 'jacobi':
+            return self._inv_diagonal*r
+
+        elif self.preconditioner == 'block_jacobi':
+            padded = np.zeros((self._inv_blocks.shape[0], 6))
+            padded[self._block_of, self._local] = r
+            return np.einsum('nij,nj->ni', self._inv_blocks, padded)[self._block_of, self._local]
+
+        else:
+            y = sp.sparse.linalg.spsolve_triangular(self._L, self._scale*r, lower=True, unit_diagonal=True)
+            y = sp.sparse.linalg.spsolve_triangular(self._LT, y/self._D, lower=False, unit_diagonal=True)
+            return self._scale*y
+
+    def _pcg(self, b: NDArray[float64], x: NDArray[float64]) -> Tuple[NDArray[float64], int, float]:
+        """Solves `K11 @ x = b` for a single right-hand side, starting from the initial guess `x`. Returns the solution, the number of iterations and the final relative residual."""
+
+        b_norm = np.linalg.norm(b)
+        if b_norm == 0:
+            return np.zeros(self.n), 0, 0.0
+
+        r = b - self._A @ x
+        residual = np.linalg.norm(r)/b_norm
+        z = self._apply_preconditioner(r)
+        p = z.copy()
+        rz = r @ z
+
+        iterations = 0
+        while residual > self.tolerance:
+
+            if iterations >= self.max_iter:
+                raise ConvergenceError(f'The conjugate gradient solver did not converge after {iterations} iterations (relative residual {residual:.3e}). Try a stronger preconditioner or a direct solver.')
+
+            Ap = self._A @ p
+            pAp = p @ Ap
+
+            # A stiffness matrix that isn't positive-definite can't be solved with conjugate gradients
+            if not pAp > 0:
+                raise ConvergenceError('The stiffness matrix is not positive-definite, so the conjugate gradient solver cannot be used. The structure may be unstable.')
+
+            alpha = rz/pAp
+            x = x + alpha*p
+            r = r - alpha*Ap
+            residual = np.linalg.norm(r)/b_norm
+
+            z = self._apply_preconditioner(r)
+            rz_new = r @ z
+            p = z + (rz_new/rz)*p
+            rz = rz_new
+            iterations += 1
+
+        return x, iterations, residual
+
+    def solve(self, b: NDArray[float64]) -> NDArray[float64]:
+        """Solves `K11 @ x = b` by preconditioned conjugate gradients.
+
+        Each column of `b` is solved in turn, starting from the solution of the previous column (or of the previous call to `solve` for the first column). The iteration count and final relative residual of each column are stored in `stats`.
+
+        :param b: The right-hand side(s). This may be a single column or a matrix with one column per right-hand side.
+        :type b: NDArray[float64]
+        :return: The solution, with the same shape as `b`.
+        :rtype: NDArray[float64]
+        :raises ConvergenceError: Occurs when a solve fails to converge.
+        """
+
+        b = np.asarray(b, dtype=float)
+        self.stats = []
+
+        if self.n == 0:
+            return np.zeros(b.shape)
+
+        B = b.reshape(self.n, -1)
+        X = np.zeros(B.shape)
+        for j in range(B.shape[1]):
+
+            # Warm start from the most recent solution
+            x0 = self.x0 if self.x0 is not None and self.x0.shape == (self.n,) else np.zeros(self.n)
+            X[:, j], iterations, residual = self._pcg(B[:, j], x0)
+
+            self.x0 = X[:, j].copy()
+            self.stats.append({'iterations': iterations, 'residual': float(residual)})
+
+        return X.reshape(b.shape)
+
+    def matches(self, state: Hashable) -> bool:
+        """Returns True if this solver was built for the given stiffness state.
+
+        :param state: The stiffness state to compare against.
+        :type state: Hashable
+        :rtype: bool
+        """
+        return self.state is not None and self.state == state
+
+
+class LowRankUpdate():
+    """
+    A solver for a partitioned stiffness matrix `K11` that differs from an already factorized one in only a few rows and columns.
+
+    When a handful of tension/compression-only elements switch on or off, `K11` changes by `U @ C @ U.T`, where `U` selects the few degrees of freedom attached to those elements and `C` is the (small, dense) change in stiffness at them. Rather than refactorizing, the Woodbury identity is applied to the existing factorization of the original matrix `A`:
+
+        (A + U C U^T)^-1 = A^-1 - A^-1 U C (I + U^T A^-1 U C)^-1 U^T A^-1
+
+    This form doesn't need `C` to be invertible, which matters because a member's stiffness matrix is singular. Building the update costs one solve per changed degree of freedom with the existing factorization, plus a small dense factorization.
+    """
+
+    def __init__(self, base: StiffnessFactorization, K11, delta, dofs: NDArray[np.int64], state: Hashable = None, K12=None, K21=None, K22=None) -> None:
+        """Builds the low-rank correction.
+
+        :param base: The factorization of the original stiffness matrix.
+        :type base: StiffnessFactorization
+        :param K11: The new partitioned stiffness matrix. It is kept for reference but isn't factorized.
+        :type K11: NDArray[float64] or scipy sparse matrix
+        :param delta: The change in stiffness, `K11 - base.K11`.
+        :type delta: NDArray[float64] or scipy sparse matrix
+        :param dofs: The rows (and columns) of `K11` where `delta` has nonzero terms.
+        :type dofs: NDArray[np.int64]
+        :param state: A key describing the stiffness state `K11` was built for. Defaults to None.
+        :type state: Hashable, optional
+        :param K12: The remaining partitions of the new stiffness matrix, kept so that load vectors and reactions can be formed for the same stiffness state. Defaults to None.
+        :type K12: NDArray[float64] or scipy sparse matrix, optional
+        :raises numpy.linalg.LinAlgError: Occurs when the updated stiffness matrix is singular.
+        """
+
+        self.base: StiffnessFactorization = base  # The factorization being corrected
+        self.D1_indices: List[int] = base.D1_indices
+        self.sparse: bool = base.sparse
+        self.banded: bool = base.banded
+        self.state: Hashable = state
+        self.n: int = base.n
+        self.dofs: NDArray[np.int64] = np.asarray(dofs, dtype=np.int64)
+        self.rank: int = len(self.dofs)
+
+        # The partitions of the new stiffness matrix
+        self.K11 = K11
+        self.K12 = K12
+        self.K21 = K21
+        self.K22 = K22
+
+        if self.rank == 0:
+            return
+
+        # The change in stiffness at the affected degrees of freedom
+        if hasattr(delta, 'tocsr'):
+            self._C = delta.tocsr()[self.dofs][:, self.dofs].toarray()
+        else:
+            self._C = np.asarray(delta)[np.ix_(self.dofs, self.dofs)]
+
+        # Solve for `A^-1 U` with the existing factorization, one column per affected degree of freedom
+        U = np.zeros((self.n, self.rank))
+        U[self.dofs, np.arange(self.rank)] = 1.0
+        self._Z = base.solve(U)
+
+        # Factorize the small capacitance matrix `I + U^T A^-1 U C`. It is singular exactly when the updated stiffness matrix is.
+        capacitance = np.eye(self.rank) + self._Z[self.dofs] @ self._C
+        self._capacitance = sp.linalg.lu_factor(capacitance, check_finite=False)
+        pivots = np.abs(np.diag(self._capacitance[0]))
+        if np.any(pivots <= 1e-12*max(1.0, pivots.max())):
+            raise np.linalg.LinAlgError('The updated stiffness matrix is singular.')
+
+    def solve(self, b: NDArray[float64]) -> NDArray[float64]:
+        """Solves `K11 @ x = b` for the updated stiffness matrix.
+
+        :param b: The right-hand side(s). This may be a single column or a matrix with one column per right-hand side.
+        :type b: NDArray[float64]
+        :return: The solution, with the same shape as `b`.
+        :rtype: NDArray[float64]
+        """
+
+        b = np.asarray(b, dtype=float)
+        y = self.base.solve(b)
+
+        if self.n == 0 or self.rank == 0:
+            return y
+
+        y = y.reshape(self.n, -1)
+        x = y - self._Z @ (self._C @ sp.linalg.lu_solve(self._capacitance, y[self.dofs], check_finite=False))
+
+        return x.reshape(b.shape)
+
+    def matches(self, state: Hashable) -> bool:
+        """Returns True if this update was built for the given stiffness state.
+
+        :param state: The stiffness state to compare against.
+        :type state: Hashable
+        :rtype: bool
+        """
+        return self.state is not None and self.state == state
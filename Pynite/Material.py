@@ -1,15 +1,21 @@
 from __future__ import annotations # Allows more recent type hints features
 from typing import TYPE_CHECKING
 
+from Pynite.VersionedAttributes import VersionedAttributes
+
 if TYPE_CHECKING:
     from Pynite.FEModel3D import FEModel3D
 
-class Material():
+class Material(VersionedAttributes):
     """
     A class representing a material assigned to a Member3D, Plate or Quad in a finite element model.
 
     This class stores all properties related to the physical material of the element
     """
+
+    # The elastic moduli that the stiffness of every element using the material depends on
+    _VERSIONED_ATTRIBUTES = frozenset(('E', 'G'))
+
     def __init__(self, model: FEModel3D, name: str, E: float, G: float, nu: float, rho: float, fy: float | None = None) -> None:
         """Initialize a material object.
 
@@ -35,4 +41,4 @@ class Material():
         self.G: float = G
         self.nu: float = nu
         self.rho: float = rho
-        self.fy: float | None = fy
\ No newline at end of file
+        self.fy: float | None = fy
@@ -9,10 +9,12 @@ from numpy.linalg import inv, pinv, norm
 import Pynite.FixedEndReactions
 from Pynite.BeamSegZ import BeamSegZ
 from Pynite.BeamSegY import BeamSegY
+from Pynite.MemberDiagrams import SegmentTable, QUANTITIES
+from Pynite.VersionedAttributes import VersionedAttributes
 
 if TYPE_CHECKING:
 
-    from typing import Dict, List, Tuple, Optional, Any, Literal
+    from typing import Dict, List, Tuple, Optional, Any, Literal, Sequence
 
     from numpy import float64
     from numpy.typing import NDArray
@@ -24,7 +26,7 @@ if TYPE_CHECKING:
     from Pynite.LoadCombo import LoadCombo
 
 
-class Member3D():
+class Member3D(VersionedAttributes):
     """
     A class representing a 3D frame element in a finite element model.
 
@@ -34,6 +36,9 @@ class Member3D():
     # '__plt' is used to store the 'pyplot' from matplotlib once it gets imported. Setting it to 'None' for now allows us to defer importing it until it's actually needed.
     __plt = None
 
+    # Attributes that the member's geometry and stiffness depend on
+    _VERSIONED_ATTRIBUTES = frozenset(('i_node', 'j_node', 'section', 'material', 'rotation'))
+
     def __init__(self, model: FEModel3D, name: str, i_node: Node3D,
                  j_node: Node3D, material_name: str, section_name: str,
                  rotation: float = 0.0, tension_only: bool = False,
@@ -101,12 +106,53 @@ class Member3D():
         # Members need to track whether they are active or not for any given load combination. They may become inactive for a load combination during a tension/compression-only analysis. This dictionary will be used when the model is solved.
         self.active: Dict[str, bool] = {}  # Key = load combo name, Value = True or False
 
-        # The 'Member3D' object will store results for one load combination at a time. To reduce repetative calculations the '_solved_combo' variable will be used to track whether the member needs to be resegmented before running calculations for any given load combination.
+        # The 'Member3D' object will store results for one load combination at a time. To reduce repetative calculations the '_solved_combo' variable will be used to track whether the member needs to be resegmented before running calculations for any given load combination. Segments for other load combinations are kept in the model's `segment_cache`.
         self._solved_combo: LoadCombo | None = None  # The current solved load combination
 
         # Members need a link to the model they belong to
         self.model: FEModel3D = model
 
+        # The length, transformation matrix and stiffness matrices only depend on the member's geometry, section, material and end releases. They are cached here to avoid rebuilding them for every load combination and every tension/compression-only iteration. The cache is valid as long as `_cache_key` matches the model's `_version` counter and the member's end releases.
+        self._cache: Dict[str, Any] = {}
+        self._cache_key: Tuple | None = None
+
+    def _cache_lookup(self, name: str) -> Any:
+        """Returns a cached value for the member, or `None` if it has not been calculated or the cache is stale.
+
+        :param name: The name of the cached quantity (e.g. 'T' or 'K').
+        :type name: str
+        :return: The cached value, or `None`.
+        :rtype: Any
+        """
+
+        # Discard the cache if the model's stiffness inputs or the member's end releases have changed since it was built
+        key = (self.model._version, tuple(self.Releases))
+        if key != self._cache_key:
+            self._cache = {}
+            self._cache_key = key
+
+        return self._cache.get(name)
+
+    def _cache_store(self, name: str, value: Any) -> Any:
+        """Stores a value in the member's cache and returns it. Arrays are made read-only so that callers can't accidentally modify the cached copy.
+
+        :param name: The name of the cached quantity (e.g. 'T' or 'K').
+        :type name: str
+        :param value: The value to cache.
+        :type value: Any
+        :return: The value that was cached.
+        :rtype: Any
+        """
+
+        # Make sure the cache key is current before storing anything in it
+        self._cache_lookup(name)
+
+        if hasattr(value, 'flags'):
+            value.flags.writeable = False
+
+        self._cache[name] = value
+        return value
+
 # %%
     def L(self) -> float:
         """
@@ -116,8 +162,14 @@ class Member3D():
         :rtype: float
         """
 
-        # Return the distance between the two nodes
-        return self.i_node.distance(self.j_node)
+        # Use the cached length if it's still valid
+        L = self._cache_lookup('L')
+        if L is None:
+
+            # Calculate the distance between the two nodes
+            L = self._cache_store('L', self.i_node.distance(self.j_node))
+
+        return L
 
 # %%
     def _partition_D(self) -> Tuple[List[int], List[int]]:
@@ -151,6 +203,11 @@ class Member3D():
         :rtype: ndarray
         """
 
+        # Use the cached matrix if it's still valid
+        k = self._cache_lookup('k')
+        if k is not None:
+            return k
+
         # Partition the local stiffness matrix as 4 submatrices in
         # preparation for static condensation
         k11, k12, k21, k22 = self._partition(self._k_unc())
@@ -168,8 +225,8 @@ class Member3D():
 
             i += 1
 
-        # Return the local stiffness matrix, with end releases applied
-        return k_Condensed
+        # Cache and return the local stiffness matrix, with end releases applied
+        return self._cache_store('k', k_Condensed)
 
 # %%
     def _k_unc(self) -> NDArray[float64]:
@@ -768,6 +825,10 @@ class Member3D():
         # Get the requested load combination
         combo = self.model.load_combos[combo_name]
 
+        # Get the member's length and direction cosines once for all the loads below
+        L = self.L()
+        dir_cos = self.T()[:3, :3]
+
         # Loop through each load case and factor in the load combination
         for case, factor in combo.factors.items():
 
@@ -778,35 +839,35 @@ class Member3D():
                 if ptLoad[3] == case:
 
                     if ptLoad[0] == 'Fx':
-                        fer = add(fer, Pynite.FixedEndReactions.FER_AxialPtLoad(factor*ptLoad[1], ptLoad[2], self.L()))
+                        fer = add(fer, Pynite.FixedEndReactions.FER_AxialPtLoad(factor*ptLoad[1], ptLoad[2], L))
                     elif ptLoad[0] == 'Fy':
-                        fer = add(fer, Pynite.FixedEndReactions.FER_PtLoad(factor*ptLoad[1], ptLoad[2], self.L(), 'Fy'))
+                        fer = add(fer, Pynite.FixedEndReactions.FER_PtLoad(factor*ptLoad[1], ptLoad[2], L, 'Fy'))
                     elif ptLoad[0] == 'Fz':
-                        fer = add(fer, Pynite.FixedEndReactions.FER_PtLoad(factor*ptLoad[1], ptLoad[2], self.L(), 'Fz'))
+                        fer = add(fer, Pynite.FixedEndReactions.FER_PtLoad(factor*ptLoad[1], ptLoad[2], L, 'Fz'))
                     elif ptLoad[0] == 'Mx':
-                        fer = add(fer, Pynite.FixedEndReactions.FER_Torque(factor*ptLoad[1], ptLoad[2], self.L()))
+                        fer = add(fer, Pynite.FixedEndReactions.FER_Torque(factor*ptLoad[1], ptLoad[2], L))
                     elif ptLoad[0] == 'My':
-                        fer = add(fer, Pynite.FixedEndReactions.FER_Moment(factor*ptLoad[1], ptLoad[2], self.L(), 'My'))
+                        fer = add(fer, Pynite.FixedEndReactions.FER_Moment(factor*ptLoad[1], ptLoad[2], L, 'My'))
                     elif ptLoad[0] == 'Mz':
-                        fer = add(fer, Pynite.FixedEndReactions.FER_Moment(factor*ptLoad[1], ptLoad[2], self.L(), 'Mz'))
+                        fer = add(fer, Pynite.FixedEndReactions.FER_Moment(factor*ptLoad[1], ptLoad[2], L, 'Mz'))
                     elif ptLoad[0] == 'FX' or ptLoad[0] == 'FY' or ptLoad[0] == 'FZ':
                         FX, FY, FZ = 0, 0, 0
                         if ptLoad[0] == 'FX': FX = 1
                         if ptLoad[0] == 'FY': FY = 1
                         if ptLoad[0] == 'FZ': FZ = 1
-                        f = self.T()[:3, :][:, :3] @ array([FX*ptLoad[1], FY*ptLoad[1], FZ*ptLoad[1]])
-                        fer = add(fer, Pynite.FixedEndReactions.FER_AxialPtLoad(factor*f[0], ptLoad[2], self.L()))
-                        fer = add(fer, Pynite.FixedEndReactions.FER_PtLoad(factor*f[1], ptLoad[2], self.L(), 'Fy'))
-                        fer = add(fer, Pynite.FixedEndReactions.FER_PtLoad(factor*f[2], ptLoad[2], self.L(), 'Fz'))
+                        f = dir_cos @ array([FX*ptLoad[1], FY*ptLoad[1], FZ*ptLoad[1]])
+                        fer = add(fer, Pynite.FixedEndReactions.FER_AxialPtLoad(factor*f[0], ptLoad[2], L))
+                        fer = add(fer, Pynite.FixedEndReactions.FER_PtLoad(factor*f[1], ptLoad[2], L, 'Fy'))
+                        fer = add(fer, Pynite.FixedEndReactions.FER_PtLoad(factor*f[2], ptLoad[2], L, 'Fz'))
                     elif ptLoad[0] == 'MX' or ptLoad[0] == 'MY' or ptLoad[0] == 'MZ':
                         MX, MY, MZ = 0, 0, 0
                         if ptLoad[0] == 'MX': MX = 1
                         if ptLoad[0] == 'MY': MY = 1
                         if ptLoad[0] == 'MZ': MZ = 1
-                        f = self.T()[:3, :][:, :3] @ array([MX*ptLoad[1], MY*ptLoad[1], MZ*ptLoad[1]])
-                        fer = add(fer, Pynite.FixedEndReactions.FER_Torque(factor*f[0], ptLoad[2], self.L()))
-                        fer = add(fer, Pynite.FixedEndReactions.FER_Moment(factor*f[1], ptLoad[2], self.L(), 'My'))
-                        fer = add(fer, Pynite.FixedEndReactions.FER_Moment(factor*f[2], ptLoad[2], self.L(), 'Mz'))
+                        f = dir_cos @ array([MX*ptLoad[1], MY*ptLoad[1], MZ*ptLoad[1]])
+                        fer = add(fer, Pynite.FixedEndReactions.FER_Torque(factor*f[0], ptLoad[2], L))
+                        fer = add(fer, Pynite.FixedEndReactions.FER_Moment(factor*f[1], ptLoad[2], L, 'My'))
+                        fer = add(fer, Pynite.FixedEndReactions.FER_Moment(factor*f[2], ptLoad[2], L, 'Mz'))
                     else:
                         raise Exception('Invalid member point load direction specified.')
 
@@ -817,19 +878,19 @@ class Member3D():
                 if distLoad[5] == case:
 
                     if distLoad[0] == 'Fx':
-                        fer = add(fer, Pynite.FixedEndReactions.FER_AxialLinLoad(factor*distLoad[1], factor*distLoad[2], distLoad[3], distLoad[4], self.L()))
+                        fer = add(fer, Pynite.FixedEndReactions.FER_AxialLinLoad(factor*distLoad[1], factor*distLoad[2], distLoad[3], distLoad[4], L))
                     elif distLoad[0] == 'Fy' or distLoad[0] == 'Fz':
-                        fer = add(fer, Pynite.FixedEndReactions.FER_LinLoad(factor*distLoad[1], factor*distLoad[2], distLoad[3], distLoad[4], self.L(), distLoad[0]))
+                        fer = add(fer, Pynite.FixedEndReactions.FER_LinLoad(factor*distLoad[1], factor*distLoad[2], distLoad[3], distLoad[4], L, distLoad[0]))
                     elif distLoad[0] == 'FX' or distLoad[0] == 'FY' or distLoad[0] == 'FZ':
                         FX, FY, FZ = 0, 0, 0
                         if distLoad[0] == 'FX': FX = 1
                         if distLoad[0] == 'FY': FY = 1
                         if distLoad[0] == 'FZ': FZ = 1
-                        w1 = self.T()[:3, :][:, :3] @ array([FX*distLoad[1], FY*distLoad[1], FZ*distLoad[1]])
-                        w2 = self.T()[:3, :][:, :3] @ array([FX*distLoad[2], FY*distLoad[2], FZ*distLoad[2]])
-                        fer = add(fer, Pynite.FixedEndReactions.FER_AxialLinLoad(factor*w1[0], factor*w2[0], distLoad[3], distLoad[4], self.L()))
-                        fer = add(fer, Pynite.FixedEndReactions.FER_LinLoad(factor*w1[1], factor*w2[1], distLoad[3], distLoad[4], self.L(), 'Fy'))
-                        fer = add(fer, Pynite.FixedEndReactions.FER_LinLoad(factor*w1[2], factor*w2[2], distLoad[3], distLoad[4], self.L(), 'Fz'))
+                        w1 = dir_cos @ array([FX*distLoad[1], FY*distLoad[1], FZ*distLoad[1]])
+                        w2 = dir_cos @ array([FX*distLoad[2], FY*distLoad[2], FZ*distLoad[2]])
+                        fer = add(fer, Pynite.FixedEndReactions.FER_AxialLinLoad(factor*w1[0], factor*w2[0], distLoad[3], distLoad[4], L))
+                        fer = add(fer, Pynite.FixedEndReactions.FER_LinLoad(factor*w1[1], factor*w2[1], distLoad[3], distLoad[4], L, 'Fy'))
+                        fer = add(fer, Pynite.FixedEndReactions.FER_LinLoad(factor*w1[2], factor*w2[2], distLoad[3], distLoad[4], L, 'Fz'))
 
         # Return the fixed end reaction vector, uncondensed
         return fer
@@ -909,6 +970,11 @@ class Member3D():
         Returns the transformation matrix for the member.
         """
 
+        # Use the cached matrix if it's still valid
+        T = self._cache_lookup('T')
+        if T is not None:
+            return T
+
         # Get the global coordinates for the two ends
         Xi = self.i_node.X
         Xj = self.j_node.X
@@ -1007,7 +1073,7 @@ class Member3D():
         transMatrix[6:9, 6:9] = dirCos
         transMatrix[9:12, 9:12] = dirCos
 
-        return transMatrix
+        return self._cache_store('T', transMatrix)
 
     # Member global stiffness matrix
     def K(self) -> NDArray[float64]:
@@ -1017,8 +1083,15 @@ class Member3D():
         :rtype: array
         """
 
-        # Calculate and return the stiffness matrix in global coordinates
-        return matmul(matmul(inv(self.T()), self.k()), self.T())
+        # Use the cached matrix if it's still valid
+        K = self._cache_lookup('K')
+        if K is not None:
+            return K
+
+        # Calculate the stiffness matrix in global coordinates. The transformation matrix is
+        # orthogonal, so its transpose is used in place of its inverse.
+        T = self.T()
+        return self._cache_store('K', matmul(matmul(T.T, self.k()), T))
 
     def Kg(self, P: float=0.0):
         """Returns the global geometric stiffness matrix for the member. Used for P-Delta analysis.
@@ -1030,7 +1103,8 @@ class Member3D():
         """
 
         # Calculate and return the geometric stiffness matrix in global coordinates
-        return matmul(matmul(inv(self.T()), self.kg(P)), self.T())
+        T = self.T()
+        return matmul(matmul(T.T, self.kg(P)), T)
 
     def Km(self, combo_name: str) -> NDArray[float64]:
         """Returns the global plastic reduction matrix for the member. Used to modify member behavior for plastic hinges at the ends.
@@ -1042,7 +1116,8 @@ class Member3D():
         """
 
         # Calculate and return the plastic reduction matrix in global coordinates
-        return matmul(matmul(inv(self.T()), self.km(combo_name)), self.T())
+        T = self.T()
+        return matmul(matmul(T.T, self.km(combo_name)), T)
 
     def F(self, combo_name: str='Combo 1') -> NDArray[float64]:
         """
@@ -1050,7 +1125,7 @@ class Member3D():
         """
 
         # Calculate and return the global force vector
-        return matmul(inv(self.T()), self.f(combo_name))
+        return matmul(self.T().T, self.f(combo_name))
 
     def FER(self, combo_name: str = 'Combo 1') -> NDArray[float64]:
         """
@@ -1063,7 +1138,7 @@ class Member3D():
         """
 
         # Calculate and return the fixed end reaction vector
-        return matmul(inv(self.T()), self.fer(combo_name))
+        return matmul(self.T().T, self.fer(combo_name))
 
     def D(self, combo_name: str = 'Combo 1') -> NDArray[float64]:
         """
@@ -1076,27 +1151,16 @@ class Member3D():
             displacement vector for (not the load combination itelf).
         """
 
-        # Initialize the displacement vector
-        D = zeros((12, 1))
+        # Read both nodes' global displacements straight from the load combination's column of the model's displacement matrix
+        D_global = self.model.node_displacements(combo_name)
+        i, j = self.i_node.ID*6, self.j_node.ID*6
+        D = concatenate((D_global[i:i + 6], D_global[j:j + 6]))
 
         # TODO: I'm not sure this next block is the best way to handle inactive members - need to review
-        # Read in the global displacements from the nodes
         # Apply axial displacements only if the member is active
-        if self.active[combo_name] == True:
-            D[0, 0] = self.i_node.DX[combo_name]
-            D[6, 0] = self.j_node.DX[combo_name]
-
-        # Apply the remaining displacements
-        D[1, 0] = self.i_node.DY[combo_name]
-        D[2, 0] = self.i_node.DZ[combo_name]
-        D[3, 0] = self.i_node.RX[combo_name]
-        D[4, 0] = self.i_node.RY[combo_name]
-        D[5, 0] = self.i_node.RZ[combo_name]
-        D[7, 0] = self.j_node.DY[combo_name]
-        D[8, 0] = self.j_node.DZ[combo_name]
-        D[9, 0] = self.j_node.RX[combo_name]
-        D[10, 0] = self.j_node.RY[combo_name]
-        D[11, 0] = self.j_node.RZ[combo_name]
+        if self.active[combo_name] != True:
+            D[0, 0] = 0
+            D[6, 0] = 0
 
         # Return the global displacement vector
         return D
@@ -1121,9 +1185,7 @@ class Member3D():
         if self.active[combo_name]:
 
             # Segment the member if necessary
-            if self._solved_combo is None or combo_name != self._solved_combo.name:
-                self._segment_member(combo_name)
-                self._solved_combo = self.model.load_combos[combo_name]
+            self._segment(combo_name)
 
             # Check which direction is of interest
             if Direction == 'Fy':
@@ -1203,9 +1265,7 @@ class Member3D():
                 continue
 
             # If member not yet segmented for this combo, do it
-            if self._solved_combo is None or combo_name != self._solved_combo.name:
-                self._segment_member(combo_name)
-                self._solved_combo = self.model.load_combos[combo_name]
+            self._segment(combo_name)
 
             # Select the correct segment list
             segments = self.SegmentsZ if Direction == 'Fy' else self.SegmentsY
@@ -1272,9 +1332,7 @@ class Member3D():
                 continue
 
             # If member not yet segmented for this combo, do it
-            if self._solved_combo is None or combo_name != self._solved_combo.name:
-                self._segment_member(combo_name)
-                self._solved_combo = self.model.load_combos[combo_name]
+            self._segment(combo_name)
 
             # Select the correct segment list
             segments = self.SegmentsZ if Direction == 'Fy' else self.SegmentsY
@@ -1309,9 +1367,7 @@ class Member3D():
         """
 
         # Segment the member if necessary
-        if self._solved_combo is None or combo_name != self._solved_combo.name:
-            self._segment_member(combo_name)
-            self._solved_combo = self.model.load_combos[combo_name]
+        self._segment(combo_name)
 
         # Import 'pyplot' if not already done
         if Member3D.__plt is None:
@@ -1350,9 +1406,7 @@ class Member3D():
         """
 
         # Segment the member into segments with mathematically continuous loads if not already done
-        if self._solved_combo is None or combo_name != self._solved_combo.name:
-            self._segment_member(combo_name)
-            self._solved_combo = self.model.load_combos[combo_name]
+        self._segment(combo_name)
 
         L = self.L()
         if x_array is None:
@@ -1391,9 +1445,7 @@ class Member3D():
         if self.active[combo_name]:
 
             # Segment the member if necessary
-            if self._solved_combo is None or combo_name != self._solved_combo.name:
-                self._segment_member(combo_name)
-                self._solved_combo = self.model.load_combos[combo_name]
+            self._segment(combo_name)
 
             # Determine if a P-Delta analysis has been run
             if self.model.solution == 'P-Delta' or self.model.solution == 'Pushover':
@@ -1488,9 +1540,7 @@ class Member3D():
             P_delta = self.model.solution in ('P-Delta', 'Pushover')
 
             # If member not yet segmented for this combo, do it
-            if self._solved_combo is None or combo_name != self._solved_combo.name:
-                self._segment_member(combo_name)
-                self._solved_combo = self.model.load_combos[combo_name]
+            self._segment(combo_name)
 
             # Select the correct segment list
             segments = self.SegmentsY if Direction == 'My' else self.SegmentsZ
@@ -1560,9 +1610,7 @@ class Member3D():
             P_delta = self.model.solution in ('P-Delta', 'Pushover')
 
             # If member not yet segmented for this combo, do it
-            if self._solved_combo is None or combo_name != self._solved_combo.name:
-                self._segment_member(combo_name)
-                self._solved_combo = self.model.load_combos[combo_name]
+            self._segment(combo_name)
 
             # Select the correct segment list
             segments = self.SegmentsY if Direction == 'My' else self.SegmentsZ
@@ -1598,9 +1646,7 @@ class Member3D():
         """
 
         # Segment the member if necessary
-        if self._solved_combo is None or combo_name != self._solved_combo.name:
-            self._segment_member(combo_name)
-            self._solved_combo = self.model.load_combos[combo_name]
+        self._segment(combo_name)
 
         # Import 'pyplot' if not already done
         if Member3D.__plt is None:
@@ -1639,9 +1685,7 @@ class Member3D():
             Values must be provided in local member coordinates (between 0 and L) and be in ascending order.
         """
         # Segment the member if necessary
-        if self._solved_combo is None or combo_name != self._solved_combo.name:
-            self._segment_member(combo_name)
-            self._solved_combo = self.model.load_combos[combo_name]
+        self._segment(combo_name)
 
         # Determine if a P-Delta analysis has been run
         if self.model.solution == 'P-Delta' or self.model.solution == 'Pushover':
@@ -1691,9 +1735,7 @@ class Member3D():
         if self.active[combo_name]:
 
             # Segment the member if necessary
-            if self._solved_combo is None or combo_name != self._solved_combo.name:
-                self._segment_member(combo_name)
-                self._solved_combo = self.model.load_combos[combo_name]
+            self._segment(combo_name)
 
             # Check which segment 'x' falls on
             for segment in self.SegmentsX:
@@ -1748,9 +1790,7 @@ class Member3D():
                 continue
 
             # Re-segment the member if necessary
-            if self._solved_combo is None or combo_name != self._solved_combo.name:
-                self._segment_member(combo_name)
-                self._solved_combo = self.model.load_combos[combo_name]
+            self._segment(combo_name)
 
             # Skip if no segments exist
             if not self.SegmentsX:
@@ -1807,9 +1847,7 @@ class Member3D():
                 continue
 
             # Re-segment the member if necessary
-            if self._solved_combo is None or combo_name != self._solved_combo.name:
-                self._segment_member(combo_name)
-                self._solved_combo = self.model.load_combos[combo_name]
+            self._segment(combo_name)
 
             # Skip if no segments exist
             if not self.SegmentsX:
@@ -1838,9 +1876,7 @@ class Member3D():
         """
 
         # Segment the member if necessary
-        if self._solved_combo is None or combo_name != self._solved_combo.name:
-            self._segment_member(combo_name)
-            self._solved_combo = self.model.load_combos[combo_name]
+        self._segment(combo_name)
 
         # Import 'pyplot' if not already done
         if Member3D.__plt is None:
@@ -1874,9 +1910,7 @@ class Member3D():
             Values must be provided in local member coordinates (between 0 and L) and be in ascending order.
         """
         # Segment the member if necessary
-        if self._solved_combo is None or combo_name != self._solved_combo.name:
-            self._segment_member(combo_name)
-            self._solved_combo = self.model.load_combos[combo_name]
+        self._segment(combo_name)
 
         L = self.L()
 
@@ -1886,7 +1920,63 @@ class Member3D():
             if any(x_array < 0) or any(x_array > L):
                 raise ValueError(f"All x values must be in the range 0 to {L}")
 
-        return self._extract_vector_results(self.SegmentsZ, x_array, 'torque')
+        # The torsional moments are held by the torsion segments (`SegmentsX`)
+        return self._extract_vector_results(self.SegmentsX, x_array, 'torque')
+
+    def results_array(self, quantities: Sequence[str] = QUANTITIES, x_array: Optional[NDArray[float64]] = None, combo_names: Union[str, List[str]] = 'Combo 1', n_points: int = 20) -> Dict[str, NDArray[float64]]:
+        """
+        Returns arrays of several results in the member at once. Each point is located on its segment only once, and every requested result is evaluated there from the packed segment coefficients (see `MemberDiagrams.SegmentTable`).
+
+        Parameters
+        ----------
+        quantities : list of str, optional
+            The results to return. Any of the following (default: all of them):
+                'axial' = Axial force.
+                'Fy', 'Fz' = Shear in the local y and z directions.
+                'My', 'Mz' = Moment about the local y and z axes.
+                'torque' = Torsional moment.
+                'dx', 'dy', 'dz' = Deflection in the local x, y and z directions.
+        x_array : array = None
+            A custom array of x values that may be provided by the user, otherwise `n_points` evenly spaced values are generated.
+            Values must be provided in local member coordinates (between 0 and L).
+        combo_names : str or list of str, optional
+            The name of the load combination to get the results for, or a list of names (default: 'Combo 1').
+        n_points : int, optional
+            The number of points to generate over the full length of the member when `x_array` is not provided (default: 20).
+
+        Returns
+        -------
+        dict
+            The x values under the key 'x', and an array of values for each requested result. When `combo_names` is a list, each result array has one row per load combination.
+        """
+
+        L = self.L()
+
+        if x_array is None:
+            x_array = linspace(0, L, n_points)
+        else:
+            x_array = array(x_array, dtype=float)
+            if any(x_array < 0) or any(x_array > L):
+                raise ValueError(f"All x values must be in the range 0 to {L}")
+
+        # Determine if P-little-delta effects should be included in the moment results
+        P_delta = self.model.solution == 'P-Delta' or self.model.solution == 'Pushover'
+
+        names = [combo_names] if isinstance(combo_names, str) else list(combo_names)
+        member_index = zeros(len(x_array), dtype=int)
+
+        results = {quantity: [] for quantity in quantities}
+        for combo_name in names:
+            values = SegmentTable([self], combo_name).evaluate(member_index, x_array, quantities, P_delta)
+            for quantity in quantities:
+                results[quantity].append(values[quantity])
+
+        if isinstance(combo_names, str):
+            results = {quantity: rows[0] for quantity, rows in results.items()}
+        else:
+            results = {quantity: array(rows).reshape(len(names), len(x_array)) for quantity, rows in results.items()}
+
+        return {'x': x_array, **results}
 
     def axial(self, x: float, combo_name: str = 'Combo 1') -> float:
         """
@@ -1904,9 +1994,7 @@ class Member3D():
         if self.active[combo_name]:
 
             # Segment the member if necessary
-            if self._solved_combo is None or combo_name != self._solved_combo.name:
-                self._segment_member(combo_name)
-                self._solved_combo = self.model.load_combos[combo_name]
+            self._segment(combo_name)
 
             # Check which segment 'x' falls on
             for segment in self.SegmentsZ:
@@ -1962,9 +2050,7 @@ class Member3D():
                 continue
 
             # Re-segment the member if this combo hasn’t been solved yet
-            if self._solved_combo is None or combo_name != self._solved_combo.name:
-                self._segment_member(combo_name)
-                self._solved_combo = self.model.load_combos[combo_name]
+            self._segment(combo_name)
 
             # Skip if no segments are available
             if not self.SegmentsZ:
@@ -2021,9 +2107,7 @@ class Member3D():
                 continue
 
             # Re-segment the member if this combo hasn’t been solved yet
-            if self._solved_combo is None or combo_name != self._solved_combo.name:
-                self._segment_member(combo_name)
-                self._solved_combo = self.model.load_combos[combo_name]
+            self._segment(combo_name)
 
             # Skip if no segments are available
             if not self.SegmentsZ:
@@ -2052,9 +2136,7 @@ class Member3D():
         """
 
         # Segment the member if necessary
-        if self._solved_combo is None or combo_name != self._solved_combo.name:
-            self._segment_member(combo_name)
-            self._solved_combo = self.model.load_combos[combo_name]
+        self._segment(combo_name)
 
         # Import 'pyplot' if not already done
         if Member3D.__plt is None:
@@ -2089,9 +2171,7 @@ class Member3D():
         """
 
         # Segment the member if necessary
-        if self._solved_combo is None or combo_name != self._solved_combo.name:
-            self._segment_member(combo_name)
-            self._solved_combo = self.model.load_combos[combo_name]
+        self._segment(combo_name)
 
         L = self.L()
         if x_array is None:
@@ -2124,9 +2204,7 @@ class Member3D():
         if self.active[combo_name]:
 
             # Segment the member if necessary
-            if self._solved_combo is None or combo_name != self._solved_combo.name:
-                self._segment_member(combo_name)
-                self._solved_combo = self.model.load_combos[combo_name]
+            self._segment(combo_name)
 
             if self.model.solution == 'P-Delta' or self.model.solution == 'Pushover':
                 P_delta = True
@@ -2223,9 +2301,7 @@ class Member3D():
                 continue
 
             # Re-segment the member if necessary
-            if self._solved_combo is None or combo_name != self._solved_combo.name:
-                self._segment_member(combo_name)
-                self._solved_combo = self.model.load_combos[combo_name]
+            self._segment(combo_name)
 
             # Initialize the maximum deflection for this combo (at start)
             dmax = self.deflection(Direction, 0, combo_name)
@@ -2289,9 +2365,7 @@ class Member3D():
                 continue
 
             # Re-segment the member if necessary
-            if self._solved_combo is None or combo_name != self._solved_combo.name:
-                self._segment_member(combo_name)
-                self._solved_combo = self.model.load_combos[combo_name]
+            self._segment(combo_name)
 
             # Initialize the minimum deflection for this combo (at start)
             dmin = self.deflection(Direction, 0, combo_name)
@@ -2327,9 +2401,7 @@ class Member3D():
         """
 
         # Segment the member if necessary
-        if self._solved_combo is None or combo_name != self._solved_combo.name:
-            self._segment_member(combo_name)
-            self._solved_combo = self.model.load_combos[combo_name]
+        self._segment(combo_name)
 
         # Import 'pyplot' if not already done
         if Member3D.__plt is None:
@@ -2368,9 +2440,7 @@ class Member3D():
             Values must be provided in local member coordinates (between 0 and L) and be in ascending order.
         """
         # Segment the member if necessary
-        if self._solved_combo is None or combo_name != self._solved_combo.name:
-            self._segment_member(combo_name)
-            self._solved_combo = self.model.load_combos[combo_name]
+        self._segment(combo_name)
 
         # Determine if a P-Delta analysis has been run
         if self.model.solution == 'P-Delta' or self.model.solution == 'Pushover':
@@ -2428,9 +2498,7 @@ class Member3D():
         if self.active[combo_name]:
 
             # Segment the member if necessary
-            if self._solved_combo is None or combo_name != self._solved_combo.name:
-                self._segment_member(combo_name)
-                self._solved_combo = self.model.load_combos[combo_name]
+            self._segment(combo_name)
 
             d = self.d(combo_name)
             dyi = d[1,0]
@@ -2487,9 +2555,7 @@ class Member3D():
         """
 
         # Segment the member if necessary
-        if self._solved_combo is None or combo_name != self._solved_combo.name:
-            self._segment_member(combo_name)
-            self._solved_combo = self.model.load_combos[combo_name]
+        self._segment(combo_name)
 
         # Import 'pyplot' if not already done
         if Member3D.__plt is None:
@@ -2528,9 +2594,7 @@ class Member3D():
             Values must be provided in local member coordinates (between 0 and L) and be in ascending order.
         """
         # Segment the member if necessary
-        if self._solved_combo is None or combo_name != self._solved_combo.name:
-            self._segment_member(combo_name)
-            self._solved_combo = self.model.load_combos[combo_name]
+        self._segment(combo_name)
 
         d = self.d(combo_name)
         dyi = d[1, 0]
@@ -2554,6 +2618,36 @@ class Member3D():
             deflections = self._extract_vector_results(self.SegmentsY, x_array, 'deflection')[1]
             return vstack((x_array, deflections - (dzi + (dzj-dzi)/L*x_array)))
 
+    def _segment(self, combo_name: str = 'Combo 1') -> None:
+        """
+        Makes `SegmentsZ`, `SegmentsY` and `SegmentsX` hold the member's segments for the given load combination. The segments are taken from the model's segment cache when possible, and only calculated by `_segment_member` when they aren't cached.
+
+        :param combo_name: The name of the load combination.
+        :type combo_name: str
+        """
+
+        # Nothing to do if the member is already segmented for this load combination
+        if self._solved_combo is not None and combo_name == self._solved_combo.name:
+            return
+
+        cache = self.model.segment_cache
+        segments = cache.get(self, combo_name)
+        if segments is None:
+            self._segment_member(combo_name)
+            cache.put(self, combo_name, (self.SegmentsZ, self.SegmentsY, self.SegmentsX))
+        else:
+            self.SegmentsZ, self.SegmentsY, self.SegmentsX = segments
+
+        self._solved_combo = self.model.load_combos[combo_name]
+
+    def _reset_segments(self) -> None:
+        """
+        Flags the member as unsegmented and discards its cached segments. This is needed whenever the member's results change.
+        """
+
+        self._solved_combo = None
+        self.model.segment_cache.discard(self)
+
     def _segment_member(self, combo_name='Combo 1'):
         """
         Divides the element up into mathematically continuous segments along each axis
@@ -2565,9 +2659,11 @@ class Member3D():
         A = self.section.A
         Iz = self.section.Iz
         Iy = self.section.Iy
-        SegmentsZ = self.SegmentsZ
-        SegmentsY = self.SegmentsY
-        SegmentsX = self.SegmentsX
+
+        # Start new lists of segments. Segments from previous load combinations may still be held by the model's segment cache, so they are replaced rather than cleared.
+        SegmentsZ = self.SegmentsZ = []
+        SegmentsY = self.SegmentsY = []
+        SegmentsX = self.SegmentsX = []
 
         # Get the load combination to segment the member for
         combo = self.model.load_combos[combo_name]
@@ -2585,11 +2681,6 @@ class Member3D():
         # Sort the list and eliminate duplicate values
         disconts = sorted(set(disconts))
 
-        # Clear out old data from any previous analyses
-        SegmentsZ.clear()
-        SegmentsY.clear()
-        SegmentsX.clear()
-
         # Create a list of mathematically continuous segments for each direction
         for index in range(len(disconts) - 1):
 
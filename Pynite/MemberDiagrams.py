@@ -0,0 +1,479 @@
+"""
+Vectorized evaluation of member internal force and deflection diagrams.
+
+`Member3D._segment_member` divides each member into mathematically continuous segments
+(`BeamSegZ`, `BeamSegY` and the torsion segments), and the `*_array` methods evaluate those
+segments one member and one quantity at a time. A `SegmentTable` instead packs the polynomial
+coefficients of every segment of a group of members into flat arrays, so that any quantity can be
+evaluated for every member and every sample point with a handful of NumPy operations. The formulas
+are the same ones used by `BeamSegZ` and `BeamSegY`.
+
+Each segment's diagrams are polynomials of degree 5 or less, so their exact extrema can also be
+found directly (`SegmentTable.extrema` and `member_extrema`) instead of by dense sampling, and
+sample points can be placed where the diagrams need them (`adaptive_sample_points`).
+"""
+
+from __future__ import annotations  # Allows more recent type hints features
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from typing import Dict, Sequence, Tuple
+    from numpy import float64
+    from numpy.typing import NDArray
+    from Pynite.Member3D import Member3D
+
+# The quantities a `SegmentTable` can evaluate. The names follow the direction labels used by the `Member3D` result methods.
+QUANTITIES = ('axial', 'Fy', 'Fz', 'My', 'Mz', 'torque', 'dx', 'dy', 'dz')
+
+# The segment properties packed into a `SegmentTable`, in column order. Properties ending in 'z' come from `SegmentsZ` (bending about the local z-axis), those ending in 'y' come from `SegmentsY`, and 'T1' comes from `SegmentsX`. The axial properties come from `SegmentsZ`, as they do for the `Member3D` result methods.
+_FIELDS = ('offset', 'x1', 'x2', 'P1', 'p1', 'p2', 'delta_x1', 'EA', 'T1',
+           'V1z', 'M1z', 'w1z', 'w2z', 'theta1z', 'delta1z', 'EIz',
+           'P1y', 'V1y', 'M1y', 'w1y', 'w2y', 'theta1y', 'delta1y', 'EIy')
+
+
+class SegmentTable():
+    """
+    The segments of a group of members for one load combination, packed into flat arrays.
+
+    Members are numbered by their position in the sequence passed in. Physical members are packed sub-member by sub-member, so positions are measured along the full physical member, as they are for the `PhysMember` result methods.
+    """
+
+    def __init__(self, members: Sequence[Member3D], combo_name: str) -> None:
+        """Segments each member for the load combination (if it hasn't been already) and packs the segments.
+
+        :param members: The members to pack. Physical members are expanded into their sub-members.
+        :type members: Sequence[Member3D]
+        :param combo_name: The name of the load combination.
+        :type combo_name: str
+        """
+
+        self.combo_name: str = combo_name
+        self.n_members: int = len(members)
+
+        member_index, rows = [], []
+        for i, member in enumerate(members):
+
+            # Physical members are made up of sub-members. Plain members are their own only sub-member.
+            sub_members = member.sub_members.values() if hasattr(member, 'sub_members') else (member,)
+
+            x_o = 0
+            for sub_member in sub_members:
+
+                # Segment the sub-member into segments with mathematically continuous loads if not already done
+                sub_member._segment(combo_name)
+
+                for seg_z, seg_y, seg_x in zip(sub_member.SegmentsZ, sub_member.SegmentsY, sub_member.SegmentsX):
+                    member_index.append(i)
+                    rows.append((x_o, seg_z.x1, seg_z.x2, seg_z.P1, seg_z.p1, seg_z.p2, seg_z.delta_x1, seg_z.EA, seg_x.T1,
+                                 seg_z.V1, seg_z.M1, seg_z.w1, seg_z.w2, seg_z.theta1, seg_z.delta1, seg_z.EI,
+                                 seg_y.P1, seg_y.V1, seg_y.M1, seg_y.w1, seg_y.w2, seg_y.theta1, seg_y.delta1, seg_y.EI))
+
+                # Get the starting position of the next sub-member
+                x_o += sub_member.L()
+
+        self.member: NDArray[np.int64] = np.array(member_index, dtype=np.int64)   # The member each segment belongs to
+        data = np.array(rows, dtype=float).reshape(-1, len(_FIELDS))
+        self.fields: Dict[str, NDArray[float64]] = {name: data[:, j] for j, name in enumerate(_FIELDS)}
+
+        # The start of each segment measured along its member
+        self.start: NDArray[float64] = self.fields['offset'] + self.fields['x1']
+
+    def locate(self, member_index: NDArray[np.int64], x: NDArray[float64], side: str | NDArray[np.bool_] = 'right') -> NDArray[np.int64]:
+        """Finds the segment each point lies on.
+
+        A point at the boundary between two segments belongs to the later segment, except at the end of a member where it belongs to the last segment. With `side='left'` it belongs to the earlier segment instead, except at the start of a member where it belongs to the first segment.
+
+        :param member_index: The member each point lies on.
+        :type member_index: NDArray[np.int64]
+        :param x: The location of each point along its member.
+        :type x: NDArray[float64]
+        :param side: Which segment points on a boundary belong to: 'right' (the later one) or 'left' (the earlier one), or a boolean array flagging the points that belong to the earlier one. Defaults to 'right'.
+        :type side: str | NDArray[np.bool_], optional
+        :return: The index of each point's segment, or -1 for points on members without any segments (e.g. zero-length members).
+        :rtype: NDArray[np.int64]
+        """
+
+        # Locate each point on its own side
+        if not isinstance(side, str):
+            return np.where(side, self.locate(member_index, x, 'left'), self.locate(member_index, x, 'right'))
+
+        # Sort the segment starts and the points together by member, then by location. Segment starts sort ahead of points at the same location (behind them for `side='left'`), so counting the segment starts up to each point gives the segment it lies on.
+        n_segments = len(self.member)
+        members = np.concatenate((self.member, member_index))
+        locations = np.concatenate((self.start, x))
+        is_point = np.concatenate((np.zeros(n_segments, dtype=np.int8), np.ones(len(x), dtype=np.int8)))
+        order = np.lexsort((is_point if side == 'right' else 1 - is_point, locations, members))
+        segment = np.cumsum(is_point[order] == 0) - 1
+
+        points = order >= n_segments
+        located = np.empty(len(x), dtype=np.int64)
+        located[order[points] - n_segments] = segment[points]
+
+        # Points at the start of a member sort ahead of its first segment for `side='left'`
+        if side == 'left' and n_segments:
+            ahead = np.minimum(located + 1, n_segments - 1)
+            at_start = ((located < 0) | (self.member[np.maximum(located, 0)] != member_index)) & (self.member[ahead] == member_index) & (x <= self.start[ahead])
+            located[at_start] = ahead[at_start]
+
+        # Points that sorted ahead of their member's first segment lie on a member without any segments
+        if n_segments:
+            outside = (located < 0) | (self.member[np.maximum(located, 0)] != member_index)
+        else:
+            outside = np.ones(len(x), dtype=bool)
+        located[outside] = -1
+
+        return located
+
+    def evaluate(self, member_index: NDArray[np.int64], x: NDArray[float64], quantities: Sequence[str] = QUANTITIES, P_delta: bool = False, side: str | NDArray[np.bool_] = 'right') -> Dict[str, NDArray[float64]]:
+        """Evaluates internal forces and deflections at any number of points on any of the members.
+
+        :param member_index: The member each point lies on (its position in the sequence of members the table was built from).
+        :type member_index: NDArray[np.int64]
+        :param x: The location of each point along its member.
+        :type x: NDArray[float64]
+        :param quantities: The quantities to evaluate: 'axial', 'Fy', 'Fz', 'My', 'Mz', 'torque', 'dx', 'dy' and/or 'dz'. Defaults to all of them.
+        :type quantities: Sequence[str], optional
+        :param P_delta: Indicates whether P-little-delta effects should be included in the moments. Defaults to False.
+        :type P_delta: bool, optional
+        :param side: Which side of a discontinuity (e.g. the shear under a point load) to evaluate points on segment boundaries at: 'right' or 'left', or a boolean array flagging the points to evaluate on the left. Defaults to 'right'.
+        :type side: str | NDArray[np.bool_], optional
+        :raises ValueError: Occurs when an unknown quantity is requested.
+        :return: A dictionary with an array of values for each requested quantity, in the same order as the points. Points on members without any segments are NaN.
+        :rtype: dict
+        """
+
+        for quantity in quantities:
+            if quantity not in QUANTITIES:
+                raise ValueError(f"Unsupported quantity: {quantity}. Must be one of {', '.join(QUANTITIES)}.")
+
+        member_index = np.asarray(member_index, dtype=np.int64)
+        x = np.asarray(x, dtype=float)
+        segment = self.locate(member_index, x, side)
+        valid = segment >= 0
+        segment = segment[valid]
+
+        # Gather the coefficients of each point's segment, and convert each point to the segment's local coordinates
+        f = {name: values[segment] for name, values in self.fields.items()}
+        u = (x[valid] - f['offset']) - f['x1']
+
+        results = {}
+        for quantity in quantities:
+            values = np.full(len(x), np.nan)
+            values[valid] = _horner(_coefficients(f, quantity, P_delta), u)
+            results[quantity] = values
+
+        return results
+
+    def extrema(self, quantities: Sequence[str] = QUANTITIES, P_delta: bool = False) -> Dict[str, Dict[str, NDArray[float64]]]:
+        """Finds the exact maximum and minimum of internal forces and deflections on each member, and where they occur.
+
+        Each segment's diagram is a polynomial of degree 5 or less, so its extrema lie either at the ends of the segment or where the derivative of the polynomial is zero. The derivative's real roots are found for every segment at once (in closed form for linear derivatives and from the eigenvalues of batched companion matrices otherwise), and the polynomial is evaluated at those candidates only.
+
+        At a discontinuity (e.g. the shear under a point load) the values just before and just after the discontinuity are both candidates.
+
+        :param quantities: The quantities to find the extrema of: 'axial', 'Fy', 'Fz', 'My', 'Mz', 'torque', 'dx', 'dy' and/or 'dz'. Defaults to all of them.
+        :type quantities: Sequence[str], optional
+        :param P_delta: Indicates whether P-little-delta effects should be included in the moments. Defaults to False.
+        :type P_delta: bool, optional
+        :raises ValueError: Occurs when an unknown quantity is requested.
+        :return: A dictionary with an entry for each requested quantity. Each entry is a dictionary of arrays with one value per member: 'max', 'x_max', 'min' and 'x_min'. Members without any segments are NaN.
+        :rtype: dict
+        """
+
+        for quantity in quantities:
+            if quantity not in QUANTITIES:
+                raise ValueError(f"Unsupported quantity: {quantity}. Must be one of {', '.join(QUANTITIES)}.")
+
+        f = self.fields
+        L = f['x2'] - f['x1']
+
+        results = {}
+        for quantity in quantities:
+
+            # Candidate locations on each segment: both ends and the real roots of the derivative that lie inside the segment
+            coefficients = _coefficients(f, quantity, P_delta)
+            roots = _real_roots(coefficients[:, 1:]*np.arange(1, 6), L)
+            roots[~((roots > 0) & (roots < L[:, None]))] = np.nan
+            u = np.column_stack((np.zeros(len(L)), L, roots))
+            values = _horner(coefficients, u.T).T
+
+            # Each segment's extrema
+            finite = ~np.isnan(values)
+            i_max = np.argmax(np.where(finite, values, -np.inf), axis=1)
+            i_min = np.argmin(np.where(finite, values, np.inf), axis=1)
+            rows = np.arange(len(L))
+            start = self.start
+
+            results[quantity] = {}
+            for key, i in (('max', i_max), ('min', i_min)):
+                segment_value = values[rows, i]
+                segment_x = start + u[rows, i]
+
+                # Keep the most extreme segment of each member. Ties go to the segment nearest the start of the member.
+                order = np.lexsort((segment_x, -segment_value if key == 'max' else segment_value, self.member))
+                members, first = np.unique(self.member[order], return_index=True)
+                best = order[first]
+
+                value, location = np.full(self.n_members, np.nan), np.full(self.n_members, np.nan)
+                value[members] = segment_value[best]
+                location[members] = segment_x[best]
+                results[quantity][key] = value
+                results[quantity]['x_' + key] = location
+
+        return results
+
+
+def _coefficients(f: Dict[str, NDArray[float64]], quantity: str, P_delta: bool) -> NDArray[float64]:
+    """Returns the polynomial coefficients of a quantity for each segment.
+
+    :param f: The segment properties, as stored in `SegmentTable.fields` (or a selection of its rows).
+    :type f: dict
+    :param quantity: The quantity.
+    :type quantity: str
+    :param P_delta: Indicates whether P-little-delta effects should be included in the moments.
+    :type P_delta: bool
+    :return: An (n_segments, 6) array. Column k holds the coefficient of u**k, where u is measured from the start of the segment.
+    :rtype: NDArray[float64]
+    """
+
+    L = f['x2'] - f['x1']
+    c = np.zeros((len(L), 6))
+
+    # Guard against zero-length segments. Points never lie on them, but their terms are still evaluated.
+    with np.errstate(divide='ignore', invalid='ignore'):
+        inv_L = np.where(L != 0, 1/np.where(L != 0, L, 1), 0)
+
+        def deflection(V1, M1, w1, w2, theta1, delta1, EI, sign):
+            # `sign` is +1 for `BeamSegZ` and -1 for `BeamSegY`, which measures slopes and moments about the local y-axis the other way
+            return np.column_stack((delta1, sign*theta1, -sign*M1/(2*EI), V1/(6*EI), w1/(24*EI), (w2 - w1)*inv_L/(120*EI)))
+
+        def moment(P1, V1, M1, w1, w2, theta1, delta1, EI, sign):
+            c[:, 0], c[:, 1], c[:, 2], c[:, 3] = sign*M1, -V1, -w1/2, -(w2 - w1)*inv_L/6
+            if P_delta:
+                c[:, 1:] += P1[:, None]*deflection(V1, M1, w1, w2, theta1, delta1, EI, sign)[:, 1:]
+            return c
+
+        z = (f['V1z'], f['M1z'], f['w1z'], f['w2z'], f['theta1z'], f['delta1z'], f['EIz'], 1)
+        y = (f['V1y'], f['M1y'], f['w1y'], f['w2y'], f['theta1y'], f['delta1y'], f['EIy'], -1)
+
+        if quantity == 'axial':
+            c[:, 0], c[:, 1], c[:, 2] = f['P1'], f['p1'], (f['p2'] - f['p1'])*inv_L/2
+        elif quantity == 'Fy':
+            c[:, 0], c[:, 1], c[:, 2] = f['V1z'], f['w1z'], (f['w2z'] - f['w1z'])*inv_L/2
+        elif quantity == 'Fz':
+            c[:, 0], c[:, 1], c[:, 2] = f['V1y'], f['w1y'], (f['w2y'] - f['w1y'])*inv_L/2
+        elif quantity == 'My':
+            moment(f['P1y'], *y)
+        elif quantity == 'Mz':
+            moment(f['P1'], *z)
+        elif quantity == 'torque':
+            c[:, 0] = f['T1']
+        elif quantity == 'dx':
+            c[:, 0], c[:, 1], c[:, 2], c[:, 3] = f['delta_x1'], -f['P1']/f['EA'], -f['p1']/(2*f['EA']), -(f['p2'] - f['p1'])*inv_L/(6*f['EA'])
+        elif quantity == 'dy':
+            c = deflection(*z)
+        elif quantity == 'dz':
+            c = deflection(*y)
+
+    return c
+
+
+def _horner(coefficients: NDArray[float64], u: NDArray[float64]) -> NDArray[float64]:
+    """Evaluates polynomials with ascending coefficients (stored along the second axis) at `u` using Horner's method."""
+    values = coefficients[:, -1]
+    for k in range(coefficients.shape[1] - 2, -1, -1):
+        values = values*u + coefficients[:, k]
+    return values
+
+
+def _real_roots(coefficients: NDArray[float64], L: NDArray[float64]) -> NDArray[float64]:
+    """Finds the real roots of a batch of polynomials.
+
+    :param coefficients: An (n, m) array of ascending polynomial coefficients, one polynomial per row.
+    :type coefficients: NDArray[float64]
+    :param L: The length of the interval each polynomial is used over. Leading coefficients whose terms are negligible over that interval are dropped, so nearly degenerate polynomials don't produce inaccurate roots.
+    :type L: NDArray[float64]
+    :return: An (n, m - 1) array of real roots, padded with NaN.
+    :rtype: NDArray[float64]
+    """
+
+    n, m = coefficients.shape
+    roots = np.full((n, m - 1), np.nan)
+
+    # Find each polynomial's effective degree, ignoring leading terms that are negligible compared to the largest term over the interval
+    terms = np.abs(coefficients)*np.maximum(L, 1e-12)[:, None]**np.arange(m)
+    significant = terms > 1e-12*terms.max(axis=1, initial=0)[:, None]
+    degree = np.where(significant.any(axis=1), m - 1 - np.argmax(significant[:, ::-1], axis=1), 0)
+
+    # Linear polynomials have one root
+    rows = np.flatnonzero(degree == 1)
+    roots[rows, 0] = -coefficients[rows, 0]/coefficients[rows, 1]
+
+    # Higher degree polynomials' roots are the eigenvalues of their companion matrices, which are batched by degree
+    for d in range(2, m):
+        rows = np.flatnonzero(degree == d)
+        if not len(rows):
+            continue
+        monic = coefficients[rows, :d]/coefficients[rows, d:d + 1]
+        companion = np.zeros((len(rows), d, d))
+        companion[:, 0, :] = -monic[:, ::-1]
+        companion[:, np.arange(1, d), np.arange(d - 1)] = 1
+        eigenvalues = np.linalg.eigvals(companion)
+
+        # Keep the real roots. Nearly real roots (e.g. double roots split by round-off) are kept too, as the candidates are only evaluated, never trusted.
+        real = np.abs(eigenvalues.imag) <= 1e-7*np.maximum(np.abs(eigenvalues), L[rows, None])
+        roots[rows, :d] = np.where(real, eigenvalues.real, np.nan)
+
+    return roots
+
+
+def member_extrema(members: Sequence[Member3D], combo_names: Sequence[str], quantities: Sequence[str] = QUANTITIES, P_delta: bool = False) -> Dict[str, Dict[str, NDArray[float64]]]:
+    """Finds the exact maximum and minimum of internal forces and deflections on each member for several load combinations, and where they occur.
+
+    :param members: The members. Physical members are measured along their full length.
+    :type members: Sequence[Member3D]
+    :param combo_names: The load combination names.
+    :type combo_names: Sequence[str]
+    :param quantities: The quantities to find the extrema of. Defaults to all of them.
+    :type quantities: Sequence[str], optional
+    :param P_delta: Indicates whether P-little-delta effects should be included in the moments. Defaults to False.
+    :type P_delta: bool, optional
+    :return: A dictionary with an entry for each requested quantity. Each entry is a dictionary of (n_combos, n_members) arrays: 'max', 'x_max', 'min' and 'x_min'.
+    :rtype: dict
+    """
+
+    tables = [SegmentTable(members, combo_name).extrema(quantities, P_delta) for combo_name in combo_names]
+    return {quantity: {key: np.array([table[quantity][key] for table in tables]).reshape(len(tables), len(members))
+                       for key in ('max', 'x_max', 'min', 'x_min')}
+            for quantity in quantities}
+
+
+def sample_points(lengths: NDArray[float64], n_points: int) -> Tuple[NDArray[np.int64], NDArray[float64]]:
+    """Returns `n_points` evenly spaced sample points along each member, matching `numpy.linspace(0, L, n_points)`.
+
+    :param lengths: The length of each member.
+    :type lengths: NDArray[float64]
+    :param n_points: The number of points per member.
+    :type n_points: int
+    :return: The member index and the location of every point, member by member.
+    :rtype: tuple
+    """
+
+    lengths = np.asarray(lengths, dtype=float)
+    x = np.arange(n_points)[None, :]*(lengths[:, None]/max(n_points - 1, 1))
+    if n_points > 1:
+        x[:, -1] = lengths
+    member_index = np.repeat(np.arange(len(lengths)), n_points)
+    return member_index, x.reshape(-1)
+
+
+def adaptive_sample_points(tables: Sequence[SegmentTable], lengths: NDArray[float64], n_uniform: int, budget: int,
+                           quantities: Sequence[str] = ('axial', 'Fy', 'Fz', 'My', 'Mz', 'torque', 'dy', 'dz'),
+                           P_delta: bool = False, tolerance: float = 1e-3, max_rounds: int = 16) -> Tuple[NDArray[np.int64], NDArray[float64], NDArray[np.bool_]]:
+    """Chooses sample points along each member that follow the shape of its diagrams.
+
+    Every member gets `n_uniform` evenly spaced points, plus both sides of every segment boundary (where loads start, stop or are applied), so jumps and kinks in the diagrams are drawn exactly. Intervals where the diagrams curve away from a straight line between their end points are then bisected, worst first, until the diagrams are followed to within `tolerance` or the whole model reaches `budget` points.
+
+    The same points are used for every load combination, so results for different load combinations can be compared point by point (e.g. to envelope them).
+
+    :param tables: The segments of the members for each load combination. Every table must be built from the same members.
+    :type tables: Sequence[SegmentTable]
+    :param lengths: The length of each member.
+    :type lengths: NDArray[float64]
+    :param n_uniform: The number of evenly spaced points on each member.
+    :type n_uniform: int
+    :param budget: The maximum number of points for the whole model. Segment boundaries and evenly spaced points are always included, even when they exceed it.
+    :type budget: int
+    :param quantities: The quantities whose diagrams the points should follow. Defaults to the internal forces and the transverse deflections.
+    :type quantities: Sequence[str], optional
+    :param P_delta: Indicates whether P-little-delta effects should be included in the moments. Defaults to False.
+    :type P_delta: bool, optional
+    :param tolerance: The largest acceptable distance between a diagram and the straight line between two points, as a fraction of the diagram's largest value in the model. Defaults to 1e-3.
+    :type tolerance: float, optional
+    :param max_rounds: The maximum number of times an interval can be bisected. Defaults to 16.
+    :type max_rounds: int, optional
+    :return: The member index and the location of every point, member by member in increasing order, and a flag for the points that must be evaluated on the left side of a segment boundary (see `SegmentTable.evaluate`).
+    :rtype: tuple
+    """
+
+    lengths = np.asarray(lengths, dtype=float)
+    n_members = len(lengths)
+
+    # Evenly spaced points
+    member_index, x = sample_points(lengths, n_uniform)
+    left = np.zeros(len(x), dtype=bool)
+
+    # Segment boundaries inside each member, found in any of the load combinations. Both sides are sampled, and evenly spaced points that (nearly) coincide with a boundary are dropped.
+    snap = 1e-9*np.maximum(lengths, 1e-12)
+    if tables:
+        boundary_member = np.concatenate([table.member for table in tables])
+        boundary_x = np.concatenate([table.start for table in tables])
+        inside = (boundary_x > snap[boundary_member]) & (boundary_x < lengths[boundary_member] - snap[boundary_member])
+        boundaries = np.unique(np.column_stack((boundary_member[inside], boundary_x[inside])), axis=0)
+        boundary_member, boundary_x = boundaries[:, 0].astype(np.int64), boundaries[:, 1]
+
+        # Drop evenly spaced points (and repeated boundaries) within `snap` of a boundary
+        if len(boundary_x):
+            near = np.searchsorted(boundary_member*(lengths.max() + 1) + boundary_x, member_index*(lengths.max() + 1) + x)
+            keep = np.ones(len(x), dtype=bool)
+            for candidate in (near - 1, near):
+                candidate = np.clip(candidate, 0, len(boundary_x) - 1)
+                keep &= ~((boundary_member[candidate] == member_index) & (np.abs(boundary_x[candidate] - x) <= snap[member_index]))
+            member_index, x, left = member_index[keep], x[keep], left[keep]
+
+            repeated = np.concatenate(([False], (np.diff(boundary_x) <= snap[boundary_member[1:]]) & (np.diff(boundary_member) == 0)))
+            boundary_member, boundary_x = boundary_member[~repeated], boundary_x[~repeated]
+
+        member_index = np.concatenate((member_index, boundary_member, boundary_member))
+        x = np.concatenate((x, boundary_x, boundary_x))
+        left = np.concatenate((left, np.ones(len(boundary_x), dtype=bool), np.zeros(len(boundary_x), dtype=bool)))
+
+    def sort(member_index, x, left):
+        # Left sides sort ahead of right sides at the same location
+        order = np.lexsort((~left, x, member_index))
+        return member_index[order], x[order], left[order]
+
+    member_index, x, left = sort(member_index, x, left)
+    if not tables or len(x) >= budget:
+        return member_index, x, left
+
+    # The scale of each diagram across the model, used to compare the deviation of different quantities and load combinations
+    scale = {}
+    for table in tables:
+        values = table.evaluate(member_index, x, quantities, P_delta, side=left)
+        for quantity in quantities:
+            scale[quantity] = max(scale.get(quantity, 0), np.nanmax(np.abs(values[quantity]), initial=0))
+
+    for _ in range(max_rounds):
+
+        # Intervals between consecutive points on the same member, other than the two sides of a boundary
+        start = np.flatnonzero((member_index[:-1] == member_index[1:]) & ~left[:-1] & (x[1:] > x[:-1]))
+        a, b = x[start], x[start + 1]
+        mid = (a + b)/2
+
+        # Measure how far each diagram strays from the straight line between each interval's end points at its middle
+        deviation = np.zeros(len(start))
+        for table in tables:
+            end_values = table.evaluate(np.concatenate((member_index[start], member_index[start])), np.concatenate((a, b)),
+                                        quantities, P_delta, side=np.concatenate((np.zeros(len(start), dtype=bool), left[start + 1])))
+            mid_values = table.evaluate(member_index[start], mid, quantities, P_delta)
+            for quantity in quantities:
+                if scale[quantity] > 0:
+                    chord = (end_values[quantity][:len(start)] + end_values[quantity][len(start):])/2
+                    deviation = np.fmax(deviation, np.abs(mid_values[quantity] - chord)/scale[quantity])
+
+        # Bisect the worst intervals, as far as the budget allows
+        worst = np.flatnonzero(deviation > tolerance)
+        worst = worst[np.argsort(-deviation[worst], kind='stable')][:budget - len(x)]
+        if not len(worst):
+            break
+
+        member_index, x, left = sort(np.concatenate((member_index, member_index[start[worst]])),
+                                     np.concatenate((x, mid[worst])),
+                                     np.concatenate((left, np.zeros(len(worst), dtype=bool))))
+        if len(x) >= budget:
+            break
+
+    return member_index, x, left
@@ -0,0 +1,415 @@
+"""
+Batched (vectorized) kernels for `Member3D` objects.
+
+Each function takes a sequence of members and returns stacked NumPy arrays with the member as the
+leading axis, e.g. an (n_members, 12, 12) array of global stiffness matrices. The math is identical
+to the per-member methods in `Member3D` (`L`, `T`, `_k_unc`, `k`, `K`), but it is evaluated for all
+members at once, which removes the Python overhead of building each 12x12 matrix individually.
+"""
+
+from __future__ import annotations  # Allows more recent type hints features
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from typing import Sequence, Tuple
+    from numpy import float64
+    from numpy.typing import NDArray
+    from Pynite.Member3D import Member3D
+
+
+def _isclose(a: NDArray[float64], b: NDArray[float64]) -> NDArray[np.bool_]:
+    """Element-wise equivalent of `math.isclose` with its default tolerances, which is what `Member3D.T` uses."""
+    return np.abs(a - b) <= 1e-9*np.maximum(np.abs(a), np.abs(b))
+
+
+def _unit(v: NDArray[float64]) -> NDArray[float64]:
+    """Normalizes each row of an (n, 3) array of vectors."""
+    return v/np.sqrt(np.sum(v**2, axis=1))[:, None]
+
+
+def node_coordinates(members: Sequence[Member3D]) -> Tuple[NDArray[float64], NDArray[float64]]:
+    """Returns the i-node and j-node coordinates of each member.
+
+    :param members: The members to evaluate.
+    :type members: Sequence[Member3D]
+    :return: Two (n, 3) arrays of i-node and j-node coordinates.
+    :rtype: tuple
+    """
+
+    XYZi = np.array([(m.i_node.X, m.i_node.Y, m.i_node.Z) for m in members], dtype=float).reshape(-1, 3)
+    XYZj = np.array([(m.j_node.X, m.j_node.Y, m.j_node.Z) for m in members], dtype=float).reshape(-1, 3)
+    return XYZi, XYZj
+
+
+def lengths(members: Sequence[Member3D]) -> NDArray[float64]:
+    """Returns the length of each member.
+
+    :param members: The members to evaluate.
+    :type members: Sequence[Member3D]
+    :return: An (n,) array of member lengths.
+    :rtype: NDArray[float64]
+    """
+
+    XYZi, XYZj = node_coordinates(members)
+    return np.sqrt(np.sum((XYZj - XYZi)**2, axis=1))
+
+
+def direction_cosines(members: Sequence[Member3D]) -> NDArray[float64]:
+    """Returns the 3x3 direction cosine matrix of each member. Rows are the local x, y and z axes, following the same conventions as `Member3D.T`.
+
+    :param members: The members to evaluate.
+    :type members: Sequence[Member3D]
+    :return: An (n, 3, 3) array of direction cosine matrices.
+    :rtype: NDArray[float64]
+    """
+
+    XYZi, XYZj = node_coordinates(members)
+    n = XYZi.shape[0]
+    delta = XYZj - XYZi
+    L = np.sqrt(np.sum(delta**2, axis=1))
+
+    # Direction cosines for the local x-axis
+    x = delta/L[:, None]
+    y = np.zeros((n, 3))
+    z = np.zeros((n, 3))
+
+    Xi, Yi, Zi = XYZi.T
+    Xj, Yj, Zj = XYZj.T
+    up = Yj > Yi
+
+    # Vertical members: keep the local y-axis in the XY plane
+    vertical = _isclose(Xi, Xj) & _isclose(Zi, Zj)
+    y[vertical, 0] = np.where(up[vertical], -1.0, 1.0)
+    z[vertical, 2] = 1.0
+
+    # Horizontal members: local y-axis is the global Y-axis
+    horizontal = ~vertical & _isclose(Yi, Yj)
+    if np.any(horizontal):
+        y[horizontal, 1] = 1.0
+        z[horizontal] = _unit(np.cross(x[horizontal], y[horizontal]))
+
+    # Members neither vertical or horizontal: local z-axis is perpendicular to the local x-axis
+    # and its projection on the XZ plane, ordered so the local y-axis points upward
+    other = ~vertical & ~horizontal
+    if np.any(other):
+        proj = delta[other].copy()
+        proj[:, 1] = 0.0
+        xo = x[other]
+        zo = np.where(up[other][:, None], np.cross(proj, xo), np.cross(xo, proj))
+        z[other] = _unit(zo)
+        y[other] = _unit(np.cross(z[other], xo))
+
+    # Apply member rotations using the Rodrigues formula
+    theta = np.radians(np.array([m.rotation for m in members], dtype=float).reshape(-1))
+    rotated = theta != 0.0
+    if np.any(rotated):
+        u = x[rotated]
+        c = np.cos(theta[rotated])[:, None]
+        s = np.sin(theta[rotated])[:, None]
+        for axis in (y, z):
+            v = axis[rotated]
+            v = v*c + np.cross(u, v)*s + u*np.sum(u*v, axis=1)[:, None]*(1 - c)
+            axis[rotated] = _unit(v)
+
+    return np.stack((x, y, z), axis=1)
+
+
+def local_stiffness_uncondensed(members: Sequence[Member3D]) -> NDArray[float64]:
+    """Returns the uncondensed local stiffness matrix of each member (see `Member3D._k_unc`).
+
+    :param members: The members to evaluate.
+    :type members: Sequence[Member3D]
+    :return: An (n, 12, 12) array of local stiffness matrices.
+    :rtype: NDArray[float64]
+    """
+
+    E = np.array([m.material.E for m in members], dtype=float)
+    G = np.array([m.material.G for m in members], dtype=float)
+    Iy = np.array([m.section.Iy for m in members], dtype=float)
+    Iz = np.array([m.section.Iz for m in members], dtype=float)
+    J = np.array([m.section.J for m in members], dtype=float)
+    A = np.array([m.section.A for m in members], dtype=float)
+    L = lengths(members)
+
+    k = np.zeros((len(members), 12, 12))
+
+    # Axial and torsional terms
+    for i, j, term in ((0, 6, A*E/L), (3, 9, G*J/L)):
+        k[:, i, i] = k[:, j, j] = term
+        k[:, i, j] = k[:, j, i] = -term
+
+    # Bending about the local z-axis (DOFs 1, 5, 7, 11) and local y-axis (DOFs 2, 4, 8, 10). The
+    # y-axis terms have the opposite sign on the rotation coupling terms.
+    for v1, r1, v2, r2, EI, sign in ((1, 5, 7, 11, E*Iz, 1.0), (2, 4, 8, 10, E*Iy, -1.0)):
+        a = 12*EI/L**3
+        b = sign*6*EI/L**2
+        c = 4*EI/L
+        d = 2*EI/L
+        k[:, v1, v1] = k[:, v2, v2] = a
+        k[:, v1, v2] = k[:, v2, v1] = -a
+        k[:, v1, r1] = k[:, r1, v1] = b
+        k[:, v1, r2] = k[:, r2, v1] = b
+        k[:, v2, r1] = k[:, r1, v2] = -b
+        k[:, v2, r2] = k[:, r2, v2] = -b
+        k[:, r1, r1] = k[:, r2, r2] = c
+        k[:, r1, r2] = k[:, r2, r1] = d
+
+    return k
+
+
+def condense(k: NDArray[float64], members: Sequence[Member3D]) -> NDArray[float64]:
+    """Applies each member's end releases to a stack of local matrices by static condensation, then expands the result back to 12x12 with zeros at the released DOFs (see `Member3D.k`).
+
+    :param k: An (n, 12, 12) array of uncondensed local matrices.
+    :type k: NDArray[float64]
+    :param members: The members the matrices belong to, in the same order.
+    :type members: Sequence[Member3D]
+    :return: An (n, 12, 12) array of condensed local matrices.
+    :rtype: NDArray[float64]
+    """
+
+    releases = np.array([m.Releases for m in members], dtype=bool).reshape(-1, 12)
+    k = k.copy()
+
+    # Members sharing a release pattern are condensed together in one batched solve
+    patterns, groups = np.unique(releases, axis=0, return_inverse=True)
+    groups = groups.reshape(-1)
+    for p, pattern in enumerate(patterns):
+
+        # Nothing to condense for fully fixed members
+        if not pattern.any():
+            continue
+
+        idx = np.nonzero(groups == p)[0]
+        R1 = np.nonzero(~pattern)[0]
+        R2 = np.nonzero(pattern)[0]
+        kg = k[idx]
+        k11 = kg[:, R1[:, None], R1]
+        k12 = kg[:, R1[:, None], R2]
+        k21 = kg[:, R2[:, None], R1]
+        k22 = kg[:, R2[:, None], R2]
+
+        # k11 - k12*inv(k22)*k21, using a batched solve rather than an explicit inverse
+        condensed = np.zeros((idx.size, 12, 12))
+        condensed[:, R1[:, None], R1] = k11 - k12 @ np.linalg.solve(k22, k21)
+        k[idx] = condensed
+
+    return k
+
+
+def local_stiffness(members: Sequence[Member3D]) -> NDArray[float64]:
+    """Returns the condensed local stiffness matrix of each member (see `Member3D.k`).
+
+    :param members: The members to evaluate.
+    :type members: Sequence[Member3D]
+    :return: An (n, 12, 12) array of local stiffness matrices.
+    :rtype: NDArray[float64]
+    """
+    return condense(local_stiffness_uncondensed(members), members)
+
+
+def to_global(k: NDArray[float64], dir_cos: NDArray[float64]) -> NDArray[float64]:
+    """Transforms a stack of local 12x12 matrices to global coordinates, `T.T @ k @ T`. The transformation matrix is block diagonal, so the transformation is applied to the 3x3 blocks directly.
+
+    :param k: An (n, 12, 12) array of local matrices.
+    :type k: NDArray[float64]
+    :param dir_cos: An (n, 3, 3) array of direction cosine matrices.
+    :type dir_cos: NDArray[float64]
+    :return: An (n, 12, 12) array of global matrices.
+    :rtype: NDArray[float64]
+    """
+
+    n = k.shape[0]
+    blocks = k.reshape(n, 4, 3, 4, 3)
+    K = np.einsum('nia,nIiJj,njb->nIaJb', dir_cos, blocks, dir_cos, optimize=True)
+    return K.reshape(n, 12, 12)
+
+
+def global_stiffness(members: Sequence[Member3D]) -> NDArray[float64]:
+    """Returns the global elastic stiffness matrix of each member (see `Member3D.K`).
+
+    :param members: The members to evaluate.
+    :type members: Sequence[Member3D]
+    :return: An (n, 12, 12) array of global stiffness matrices.
+    :rtype: NDArray[float64]
+    """
+    return to_global(local_stiffness(members), direction_cosines(members))
+
+
+def cached_global_stiffness(members: Sequence[Member3D]) -> NDArray[float64]:
+    """Returns the global elastic stiffness matrix of each member, reusing each member's cached `K` where it is still valid. Only the members without a valid cached matrix are evaluated (in one batch), and their results are stored back in the members' caches.
+
+    :param members: The members to evaluate.
+    :type members: Sequence[Member3D]
+    :return: An (n, 12, 12) array of global stiffness matrices.
+    :rtype: NDArray[float64]
+    """
+
+    K = np.empty((len(members), 12, 12))
+
+    # Copy over the cached matrices and collect the members that still need to be calculated
+    missing = []
+    for i, member in enumerate(members):
+        member_K = member._cache_lookup('K')
+        if member_K is None:
+            missing.append(i)
+        else:
+            K[i] = member_K
+
+    if missing:
+        new_K = global_stiffness([members[i] for i in missing])
+        K[missing] = new_K
+
+        # Cache a copy of each new matrix on its member so later assemblies can skip it
+        for i, member_K in zip(missing, new_K.copy()):
+            members[i]._cache_store('K', member_K)
+
+    return K
+
+
+def local_geometric_stiffness_unit(members: Sequence[Member3D]) -> NDArray[float64]:
+    """Returns the condensed local geometric stiffness matrix of each member for a unit axial force (see `Member3D.kg`). The geometric stiffness is proportional to the axial force, including after static condensation, so the matrix for any force `P` is `P` times this one.
+
+    :param members: The members to evaluate.
+    :type members: Sequence[Member3D]
+    :return: An (n, 12, 12) array of local geometric stiffness matrices.
+    :rtype: NDArray[float64]
+    """
+
+    A = np.array([m.section.A for m in members], dtype=float)
+    Ip = np.array([m.section.Iy + m.section.Iz for m in members], dtype=float)
+    L = lengths(members)
+
+    kg = np.zeros((len(members), 12, 12))
+
+    # Axial and torsional terms
+    for i, j, term in ((0, 6, np.ones(len(members))), (3, 9, Ip/A)):
+        kg[:, i, i] = kg[:, j, j] = term
+        kg[:, i, j] = kg[:, j, i] = -term
+
+    # Bending about the local z-axis (DOFs 1, 5, 7, 11) and local y-axis (DOFs 2, 4, 8, 10). The
+    # y-axis terms have the opposite sign on the rotation coupling terms.
+    for v1, r1, v2, r2, sign in ((1, 5, 7, 11, 1.0), (2, 4, 8, 10, -1.0)):
+        b = sign*L/10
+        kg[:, v1, v1] = kg[:, v2, v2] = 6/5
+        kg[:, v1, v2] = kg[:, v2, v1] = -6/5
+        kg[:, v1, r1] = kg[:, r1, v1] = b
+        kg[:, v1, r2] = kg[:, r2, v1] = b
+        kg[:, v2, r1] = kg[:, r1, v2] = -b
+        kg[:, v2, r2] = kg[:, r2, v2] = -b
+        kg[:, r1, r1] = kg[:, r2, r2] = 2*L**2/15
+        kg[:, r1, r2] = kg[:, r2, r1] = -L**2/30
+
+    return condense(kg/L[:, None, None], members)
+
+
+def cached_unit_geometric_stiffness(members: Sequence[Member3D]) -> NDArray[float64]:
+    """Returns the global geometric stiffness matrix of each member for a unit axial force, reusing each member's cached matrix where it is still valid. Only the members without a valid cached matrix are evaluated (in one batch).
+
+    :param members: The members to evaluate.
+    :type members: Sequence[Member3D]
+    :return: An (n, 12, 12) array of global geometric stiffness matrices.
+    :rtype: NDArray[float64]
+    """
+
+    Kg = np.empty((len(members), 12, 12))
+
+    # Copy over the cached matrices and collect the members that still need to be calculated
+    missing = []
+    for i, member in enumerate(members):
+        member_Kg = member._cache_lookup('Kg_unit')
+        if member_Kg is None:
+            missing.append(i)
+        else:
+            Kg[i] = member_Kg
+
+    if missing:
+        subset = [members[i] for i in missing]
+        new_Kg = to_global(local_geometric_stiffness_unit(subset), direction_cosines(subset))
+        Kg[missing] = new_Kg
+
+        # Cache a copy of each new matrix on its member so later P-Delta steps can skip it
+        for i, member_Kg in zip(missing, new_Kg.copy()):
+            members[i]._cache_store('Kg_unit', member_Kg)
+
+    return Kg
+
+
+def axial_forces(members: Sequence[Member3D], D: NDArray[float64]) -> NDArray[float64]:
+    """Returns the axial force in each member due to axial strain, `E*A/L*(d[6] - d[0])`, calculated from a global displacement vector (see `FEModel3D.Kg`).
+
+    :param members: The members to evaluate.
+    :type members: Sequence[Member3D]
+    :param D: The model's global displacement vector for a load combination.
+    :type D: NDArray[float64]
+    :return: An (n,) array of axial forces (tension positive).
+    :rtype: NDArray[float64]
+    """
+
+    E = np.array([m.material.E for m in members], dtype=float)
+    A = np.array([m.section.A for m in members], dtype=float)
+    L = lengths(members)
+
+    # The axial displacement at each end is the translation projected onto the member's local x-axis
+    member_D = np.asarray(D).reshape(-1)[dofs(members)]
+    x = direction_cosines(members)[:, 0, :]
+    elongation = np.sum(x*(member_D[:, 6:9] - member_D[:, 0:3]), axis=1)
+
+    return E*A/L*elongation
+
+
+def geometric_stiffness(members: Sequence[Member3D], P: NDArray[float64]) -> NDArray[float64]:
+    """Returns the global geometric stiffness matrix of each member for the given axial forces (see `Member3D.Kg`).
+
+    :param members: The members to evaluate.
+    :type members: Sequence[Member3D]
+    :param P: An (n,) array of member axial forces.
+    :type P: NDArray[float64]
+    :return: An (n, 12, 12) array of global geometric stiffness matrices.
+    :rtype: NDArray[float64]
+    """
+    return np.asarray(P, dtype=float)[:, None, None]*cached_unit_geometric_stiffness(members)
+
+
+def dofs(members: Sequence[Member3D]) -> NDArray[np.int64]:
+    """Returns the 12 global degree of freedom indices of each member (see `FEModel3D._build_dof_vector`).
+
+    :param members: The members to evaluate.
+    :type members: Sequence[Member3D]
+    :return: An (n, 12) array of DOF indices.
+    :rtype: NDArray[np.int64]
+    """
+
+    IDs = np.array([(m.i_node.ID, m.j_node.ID) for m in members], dtype=np.int64).reshape(-1, 2)
+    local = np.arange(6, dtype=np.int64)
+    return (IDs[:, :, None]*6 + local).reshape(-1, 12)
+
+
+def coo_entries(blocks: NDArray[float64], member_dofs: NDArray[np.int64], scale: NDArray[float64] | None = None, drop_zeros: bool = True) -> Tuple[NDArray[np.int64], NDArray[np.int64], NDArray[float64]]:
+    """Flattens a stack of 12x12 global member matrices into COO row/column/data vectors, dropping zero terms.
+
+    :param blocks: An (n, 12, 12) array of global matrices.
+    :type blocks: NDArray[float64]
+    :param member_dofs: An (n, 12) array of DOF indices from `dofs`.
+    :type member_dofs: NDArray[np.int64]
+    :param scale: An optional (n,) array of factors applied to each member's terms. Zero terms are dropped before scaling, so a member scaled by zero (e.g. an inactive member) keeps its entries. Defaults to None.
+    :type scale: NDArray[float64], optional
+    :param drop_zeros: Set to False to keep every term, so the entries don't depend on the values at all (e.g. geometric stiffness matrices, which are all zero when there is no axial force). Defaults to True.
+    :type drop_zeros: bool, optional
+    :return: The row, column and data vectors.
+    :rtype: tuple
+    """
+
+    rows = np.broadcast_to(member_dofs[:, :, None], blocks.shape).reshape(-1)
+    cols = np.broadcast_to(member_dofs[:, None, :], blocks.shape).reshape(-1)
+    data = blocks.reshape(-1)
+    if scale is not None:
+        data_scaled = (blocks*scale[:, None, None]).reshape(-1)
+    else:
+        data_scaled = data
+    if not drop_zeros:
+        return rows.copy(), cols.copy(), data_scaled.copy()
+    nonzero = data != 0.0
+    return rows[nonzero], cols[nonzero], data_scaled[nonzero]
@@ -61,43 +61,18 @@ class Mesh():
                 del self.model.plates[element_name]
             elif element.type == 'Quad' and element_name in self.model.quads:
                 del self.model.quads[element_name]
+            self.model._unlink_element(element)
 
-        # Build a set of nodes that are shared between this mesh and elements outside the mesh
-        # (i.e., nodes that exist in both the mesh and external elements)
-        shared_nodes = set()
-        
-        # Check quads and plates - only add nodes that are actually in BOTH the mesh and the external element
-        for element in list(self.model.quads.values()) + list(self.model.plates.values()):
-            # Check if this element is not in the current mesh
-            if element.name not in self.elements:
-                # Add only the nodes of this element that are also in the mesh
-                if element.i_node.name in self.nodes:
-                    shared_nodes.add(element.i_node.name)
-                if element.j_node.name in self.nodes:
-                    shared_nodes.add(element.j_node.name)
-                if element.m_node.name in self.nodes:
-                    shared_nodes.add(element.m_node.name)
-                if element.n_node.name in self.nodes:
-                    shared_nodes.add(element.n_node.name)
-        
-        # Check members - only add nodes that are actually in BOTH the mesh and the member
-        for member in list(self.model.members.values()):
-            if member.i_node.name in self.nodes:
-                shared_nodes.add(member.i_node.name)
-            if member.j_node.name in self.nodes:
-                shared_nodes.add(member.j_node.name)
-        
-        # Check springs - only add nodes that are actually in BOTH the mesh and the spring
-        for spring in list(self.model.springs.values()):
-            if spring.i_node.name in self.nodes:
-                shared_nodes.add(spring.i_node.name)
-            if spring.j_node.name in self.nodes:
-                shared_nodes.add(spring.j_node.name)
-
-        # Remove nodes from the model only if they're not shared with other elements
+        # The elements' loads have been removed, so discard the model's cached load vectors
+        self.model._case_loads = {}
+
+        # Remove nodes from the model only if they're not shared with other elements. Any element
+        # still attached to a mesh node in the model's adjacency index lies outside the mesh.
         for node_name in list(self.nodes.keys()):
-            if node_name in self.model.nodes and node_name not in shared_nodes:
+            node = self.model.nodes.get(node_name)
+            if node is not None and not self.model._attached_elements(node):
                 del self.model.nodes[node_name]
+                self.model._node_elements.pop(node, None)
 
         # Clear the mesh's internal dictionaries
         self.nodes.clear()
@@ -140,6 +115,7 @@ class Mesh():
 
                 # Save the element to the model
                 self.model.plates[element.name] = element
+                self.model._link_element('plates', element)
 
             elif element.type == 'Quad':
 
@@ -151,6 +127,7 @@ class Mesh():
 
                 # Save the element to the model
                 self.model.quads[element.name] = element
+                self.model._link_element('quads', element)
 
             # Add this element to the mesh's new/replacement `elements` dictionary
             revised_elements[element.name] = element
@@ -1028,8 +1005,10 @@ class RectangleMesh(Mesh):
         for key, element in self.elements.items():
             if element.type == 'Quad':
                 self.model.quads[key] = element
+                self.model._link_element('quads', element)
             elif element.type == 'Rect':
                 self.model.plates[key] = element
+                self.model._link_element('plates', element)
 
         # Flag the mesh as generated
         self.is_generated = True
@@ -1228,8 +1207,10 @@ class AnnulusMesh(Mesh):
         for element in self.elements.values():
             if element.type.upper() == 'QUAD':
                 self.model.quads[element.name] = element
+                self.model._link_element('quads', element)
             elif element.type.upper() == 'RECT':
                 self.model.plates[element.name] = element
+                self.model._link_element('plates', element)
         
         # Flag the mesh as generated
         self.is_generated = True
@@ -1385,8 +1366,10 @@ class AnnulusRingMesh(Mesh):
         for element in self.elements.values():
             if element.type.upper() == 'QUAD':
                 self.model.quads[element.name] = element
+                self.model._link_element('quads', element)
             if element.type.upper() == 'RECT':
                 self.model.plates[element.name] = element
+                self.model._link_element('plates', element)
         
         # Flag the mesh as generated
         self.is_generated = True
@@ -1584,8 +1567,10 @@ class AnnulusTransRingMesh(Mesh):
         for element in self.elements.values():
             if element.type == 'Quad':
                 self.model.quads[element.name] = element
+                self.model._link_element('quads', element)
             else:
                 self.model.plates[element.name] = element
+                self.model._link_element('plates', element)
         
         # Flag the mesh as generated
         self.is_generated = True
@@ -1801,8 +1786,10 @@ class CylinderMesh(Mesh):
         for element in self.elements.values():
             if element.type == 'Quad':
                 self.model.quads[element.name] = element
+                self.model._link_element('quads', element)
             else:
                 self.model.plates[element.name] = element
+                self.model._link_element('plates', element)
         
         # Flag the mesh as generated
         self.is_generated = True
@@ -1989,8 +1976,10 @@ class CylinderRingMesh(Mesh):
         for element in self.elements.values():
             if element.type == 'Quad':
                 self.model.quads[element.name] = element
+                self.model._link_element('quads', element)
             else:
                 self.model.plates[element.name] = element
+                self.model._link_element('plates', element)
             
         # Flag the mesh as generated
         self.is_generated = True
@@ -8,6 +8,9 @@ from __future__ import annotations  # Allows more recent type hints features
 # %%
 from numpy import array, zeros
 
+from Pynite.NodeResults import result_property
+from Pynite.VersionedAttributes import VersionedAttributes
+
 from typing import List, Tuple, Dict, Optional,TYPE_CHECKING
 if TYPE_CHECKING:
 
@@ -20,11 +23,14 @@ if TYPE_CHECKING:
     from Pynite.LoadCombo import LoadCombo
 
 
-class Node3D():
+class Node3D(VersionedAttributes):
     """
     A class representing a node in a 3D finite element model.
     """
 
+    # Moving a node changes the geometry of every element attached to it
+    _VERSIONED_ATTRIBUTES = frozenset(('X', 'Y', 'Z'))
+
     def __init__(self, model: FEModel3D, name: str, X: float, Y: float, Z: float):
 
         self.name = name                 # A unique name for the node assigned by the user
@@ -36,21 +42,7 @@ class Node3D():
 
         self.NodeLoads: List[Tuple[str, float, str]] = []  # A list of loads applied to the node (Direction, P, case) or (Direction, M, case)
 
-        # Initialize the dictionaries of calculated node displacements
-        self.DX: Dict[str, float] = {}
-        self.DY: Dict[str, float] = {}
-        self.DZ: Dict[str, float] = {}
-        self.RX: Dict[str, float] = {}
-        self.RY: Dict[str, float] = {}
-        self.RZ: Dict[str, float] = {}
-
-        # Initialize the dictionaries of calculated node reactions
-        self.RxnFX: Dict[str, float] = {}
-        self.RxnFY: Dict[str, float] = {}
-        self.RxnFZ: Dict[str, float] = {}
-        self.RxnMX: Dict[str, float] = {}
-        self.RxnMY: Dict[str, float] = {}
-        self.RxnMZ: Dict[str, float] = {}
+        # The calculated displacements (`DX`, `DY`...) and reactions (`RxnFX`, `RxnFY`...) are stored in the model's result matrices. The class properties below present them as dictionaries keyed by load combination name.
 
         # Initialize all support conditions to `False`
         self.support_DX: bool = False
@@ -84,6 +76,22 @@ class Node3D():
         # Adding a link to the model that Nodes belong to 
         self.model: FEModel3D = model
 
+    # Calculated node displacements, as views into the model's displacement matrix
+    DX = result_property('_D', 0)
+    DY = result_property('_D', 1)
+    DZ = result_property('_D', 2)
+    RX = result_property('_D', 3)
+    RY = result_property('_D', 4)
+    RZ = result_property('_D', 5)
+
+    # Calculated node reactions, as views into the model's reaction matrix
+    RxnFX = result_property('_reactions', 0)
+    RxnFY = result_property('_reactions', 1)
+    RxnFZ = result_property('_reactions', 2)
+    RxnMX = result_property('_reactions', 3)
+    RxnMY = result_property('_reactions', 4)
+    RxnMZ = result_property('_reactions', 5)
+
     def distance(self, other: 'Node3D') -> float:
         """
         Returns the distance to another node.
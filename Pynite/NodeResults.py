@@ -0,0 +1,220 @@
+"""
+Column-store containers for nodal results.
+
+A model's nodal displacements and reactions are each held in one dense (n_dofs x n_combos) NumPy
+array with a map from load combination name to column (`ResultMatrix`). Bulk consumers, such as
+the analysis routines and result extraction, read and write whole columns. The familiar per-node
+dictionaries (`node.DX[combo_name]`, `node.RxnFY[combo_name]`...) are lightweight `NodeResult`
+views into those arrays, so they no longer hold any data of their own.
+"""
+
+from __future__ import annotations  # Allows more recent type hints features
+from typing import TYPE_CHECKING
+from collections.abc import MutableMapping
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from typing import Dict, Iterator, List, Mapping
+    from numpy import float64
+    from numpy.typing import NDArray
+    from Pynite.Node3D import Node3D
+
+
+class ResultMatrix():
+    """
+    Nodal results for every load combination, stored as the columns of a single (n_dofs x n_combos) array.
+
+    Columns are looked up by load combination name, like the dictionary of global displacement vectors it replaces: ``results[combo_name]`` returns the load combination's (n_dofs, 1) column, and assigning to it stores a new column. Entries that have not been calculated are NaN.
+    """
+
+    def __init__(self) -> None:
+
+        self.values: NDArray[float64] = np.full((0, 0), np.nan)  # The stored results. Columns beyond `len(self.columns)` are spare capacity.
+        self.columns: Dict[str, int] = {}                        # The column of each load combination
+
+    def clear(self, n_dofs: int = 0) -> None:
+        """Removes every stored result.
+
+        :param n_dofs: The number of rows (degrees of freedom) to keep room for. Defaults to 0.
+        :type n_dofs: int, optional
+        """
+        self.values = np.full((n_dofs, 0), np.nan)
+        self.columns = {}
+
+    def column(self, combo_name: str, n_dofs: int = 0) -> int:
+        """Returns the column for a load combination, adding an empty (NaN) column if it doesn't have one yet.
+
+        :param combo_name: The name of the load combination.
+        :type combo_name: str
+        :param n_dofs: The number of rows the matrix needs. The matrix is extended with NaN rows if it is shorter. Defaults to 0.
+        :type n_dofs: int, optional
+        :return: The column index.
+        :rtype: int
+        """
+
+        # Add rows if the model has grown since the matrix was created
+        if n_dofs > self.values.shape[0]:
+            self.values = np.vstack((self.values, np.full((n_dofs - self.values.shape[0], self.values.shape[1]), np.nan)))
+
+        j = self.columns.get(combo_name)
+        if j is None:
+            j = len(self.columns)
+
+            # Grow the spare capacity geometrically so that adding load combinations one at a time doesn't copy the matrix each time
+            if j >= self.values.shape[1]:
+                spare = np.full((self.values.shape[0], max(j, 4)), np.nan)
+                self.values = np.hstack((self.values, spare))
+
+            self.columns[combo_name] = j
+
+        return j
+
+    def set_columns(self, combo_names: List[str], values: NDArray[float64]) -> None:
+        """Stores the results for several load combinations at once.
+
+        :param combo_names: The load combination names, one per column of `values`.
+        :type combo_names: list
+        :param values: An (n_dofs, len(combo_names)) array of results.
+        :type values: NDArray[float64]
+        """
+
+        values = np.asarray(values, dtype=float).reshape(-1, len(combo_names))
+        columns = [self.column(name, values.shape[0]) for name in combo_names]
+        self.values[:values.shape[0], columns] = values
+
+    def matrix(self, combo_names: List[str]) -> NDArray[float64]:
+        """Returns the results for several load combinations as the columns of a new array.
+
+        :param combo_names: The load combination names.
+        :type combo_names: list
+        :raises KeyError: Occurs when a load combination has no results.
+        :return: An (n_dofs, len(combo_names)) array.
+        :rtype: NDArray[float64]
+        """
+        return self.values[:, [self.columns[name] for name in combo_names]]
+
+    def __getitem__(self, combo_name: str) -> NDArray[float64]:
+        """Returns a load combination's results as an (n_dofs, 1) view into the matrix."""
+        j = self.columns[combo_name]
+        return self.values[:, j:j + 1]
+
+    def __setitem__(self, combo_name: str, vector: NDArray[float64]) -> None:
+        """Stores a load combination's results from an (n_dofs, 1) or (n_dofs,) vector."""
+        vector = np.asarray(vector, dtype=float).reshape(-1)
+        j = self.column(combo_name, len(vector))
+        self.values[:len(vector), j] = vector
+
+    def __contains__(self, combo_name: object) -> bool:
+        return combo_name in self.columns
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.columns)
+
+    def __len__(self) -> int:
+        return len(self.columns)
+
+    def keys(self):
+        return self.columns.keys()
+
+    def get(self, combo_name: str, default=None):
+        return self[combo_name] if combo_name in self.columns else default
+
+    def pop(self, combo_name: str, default=None):
+        """Removes a load combination's column and returns a copy of it (or `default` if it has none). The remaining columns are compacted so no capacity is lost."""
+
+        j = self.columns.pop(combo_name, None)
+        if j is None:
+            return default
+        removed = self.values[:, j:j + 1].copy()
+
+        # Move the later columns down by one
+        n = len(self.columns)
+        self.values[:, j:n] = self.values[:, j + 1:n + 1]
+        self.values[:, n] = np.nan
+        for name, k in self.columns.items():
+            if k > j:
+                self.columns[name] = k - 1
+
+        return removed
+
+
+class NodeResult(MutableMapping):
+    """
+    A view of one degree of freedom of a node in a `ResultMatrix`, which behaves like a dictionary of results keyed by load combination name (e.g. `node.DX`).
+
+    Reading a load combination that has no result raises `KeyError`, as it would for a dictionary.
+    """
+
+    __slots__ = ('_results', '_node', '_dof')
+
+    def __init__(self, results: ResultMatrix, node: Node3D, dof: int) -> None:
+
+        self._results = results
+        self._node = node
+        self._dof = dof
+
+    def _row(self) -> int | None:
+        """The node's row in the result matrix, or None if the node hasn't been numbered or has no row yet."""
+        if self._node.ID is None:
+            return None
+        return self._node.ID*6 + self._dof
+
+    def __getitem__(self, combo_name: str) -> float64:
+        row, j = self._row(), self._results.columns.get(combo_name)
+        if row is None or j is None or row >= self._results.values.shape[0]:
+            raise KeyError(combo_name)
+        value = self._results.values[row, j]
+        if np.isnan(value):
+            raise KeyError(combo_name)
+        return value
+
+    def __setitem__(self, combo_name: str, value: float) -> None:
+        row = self._row()
+        if row is None:
+            raise KeyError(f"Node '{self._node.name}' has not been numbered for analysis")
+        j = self._results.column(combo_name, len(self._node.model.nodes)*6)
+        self._results.values[row, j] = value
+
+    def __delitem__(self, combo_name: str) -> None:
+        self[combo_name]  # Raises KeyError if there is nothing to delete
+        self._results.values[self._row(), self._results.columns[combo_name]] = np.nan
+
+    def __iter__(self) -> Iterator[str]:
+        row = self._row()
+        if row is None or row >= self._results.values.shape[0]:
+            return iter(())
+        values = self._results.values[row]
+        return iter([name for name, j in self._results.columns.items() if not np.isnan(values[j])])
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def replace(self, values: Mapping[str, float]) -> None:
+        """Replaces every result for this degree of freedom with the contents of a dictionary."""
+        for combo_name in list(self):
+            del self[combo_name]
+        for combo_name, value in values.items():
+            self[combo_name] = value
+
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
+
+
+def result_property(store: str, dof: int) -> property:
+    """Builds a `Node3D` property that returns a `NodeResult` view of one of the model's result matrices. Assigning a dictionary to the property replaces the node's results for that degree of freedom.
+
+    :param store: The name of the `FEModel3D` attribute holding the `ResultMatrix` ('_D' or '_reactions').
+    :type store: str
+    :param dof: The degree of freedom at the node (0 to 5).
+    :type dof: int
+    :rtype: property
+    """
+
+    def getter(node: Node3D) -> NodeResult:
+        return NodeResult(getattr(node.model, store), node, dof)
+
+    def setter(node: Node3D, values: Mapping[str, float]) -> None:
+        getter(node).replace(values)
+
+    return property(getter, setter)
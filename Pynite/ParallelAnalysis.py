@@ -0,0 +1,435 @@
+"""
+Parallel solution of independent load combinations for `FEModel3D.analyze` and `FEModel3D.analyze_PDelta`.
+
+Once the model has been numbered and partitioned, each load combination's tension/compression-only
+iteration (and P-Delta solution) only depends on the model's stiffness terms and that combination's
+load vectors. `ModelSnapshot` collects those into plain NumPy arrays, which is all a worker process
+receives: the object graph (nodes, members, load cases...) stays in the parent process. Each worker
+solves whole load combinations and returns the displacements and final tension/compression-only
+states, which are stored back on the model in load combination order so the results don't depend
+on which worker finished first.
+"""
+
+from __future__ import annotations  # Allows more recent type hints features
+from typing import TYPE_CHECKING
+
+import os
+import sys
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import scipy as sp
+
+from Pynite import Analysis, MemberKernels
+from Pynite.SparseAssembly import SparsePattern
+
+if TYPE_CHECKING:
+    from typing import Dict, List, Tuple
+    from numpy import float64
+    from numpy.typing import NDArray
+    from Pynite.FEModel3D import FEModel3D
+    from Pynite.LoadCombo import LoadCombo
+    from Pynite.Factorization import StiffnessFactorization, LowRankUpdate
+
+
+class ModelSnapshot():
+    """
+    A compact, array-only copy of everything needed to solve a model's load combinations in another process.
+
+    The global stiffness matrix is stored as the terms of the elements that never switch (`K_rest`) plus the 12x12 blocks of the tension/compression-only springs and members, which are summed in or left out according to each load combination's state. Node support springs are diagonal terms. For P-Delta analysis the unit geometric stiffness matrix of every member is stored as well.
+    """
+
+    def __init__(self, model: FEModel3D, combo_list: List[LoadCombo], D1_indices: List[int], D2_indices: List[int], D2: NDArray[float64], sparse: bool = True, pdelta: bool = False) -> None:
+        """Collects the arrays for a model that has been prepared, numbered and partitioned for analysis. Use `ModelSnapshot.supported` first to check the model can be represented.
+
+        :param model: The model being analyzed.
+        :type model: FEModel3D
+        :param combo_list: The load combinations to be solved.
+        :type combo_list: list
+        :param D1_indices: The global degree of freedom indices of the unknown displacements.
+        :type D1_indices: list
+        :param D2_indices: The global degree of freedom indices of the enforced displacements.
+        :type D2_indices: list
+        :param D2: The enforced displacements.
+        :type D2: NDArray[float64]
+        :param sparse: Indicates whether sparse matrices and factorizations should be used. Defaults to True.
+        :type sparse: bool, optional
+        :param pdelta: Set to True to also collect the member geometric stiffness. Defaults to False.
+        :type pdelta: bool, optional
+        """
+
+        self.n: int = len(model.nodes)*6
+        self.D1_indices: NDArray[np.int64] = np.asarray(D1_indices, dtype=np.int64)
+        self.D2_indices: NDArray[np.int64] = np.asarray(D2_indices, dtype=np.int64)
+        self.D2: NDArray[float64] = np.asarray(D2, dtype=float).reshape(-1, 1)
+        self.sparse: bool = sparse
+        self.pdelta: bool = pdelta
+        self.node_ordering = model.node_ordering
+        self.permc_spec: str = Analysis._permc_spec(model)
+        self.combo_names: List[str] = [combo.name for combo in combo_list]
+
+        # The factorization a worker process last built, kept here so `Analysis._update_factorization` reuses and updates it as it would on a model
+        self.K11_factorization: StiffnessFactorization | LowRankUpdate | None = None
+
+        # The partitioned load vectors for each load combination, one column per combination
+        P, FER = model._load_vectors(self.combo_names)
+        self.P1: NDArray[float64] = P[self.D1_indices, :]
+        self.FER1: NDArray[float64] = FER[self.D1_indices, :]
+
+        # Tension/compression-only node support springs: one diagonal term each. `+1` springs act for positive displacements and `-1` springs for negative ones.
+        ns_dofs, ns_k, ns_sign, ns_active = [], [], [], []
+        for node in model.nodes.values():
+            for dof, spring in enumerate((node.spring_DX, node.spring_DY, node.spring_DZ, node.spring_RX, node.spring_RY, node.spring_RZ)):
+                if spring[0] is not None and spring[1] is not None:
+                    ns_dofs.append(node.ID*6 + dof)
+                    ns_k.append(float(spring[0]))
+                    ns_sign.append(1.0 if spring[1] == '+' else -1.0)
+                    ns_active.append(bool(spring[2]))
+        self.node_spring_dofs: NDArray[np.int64] = np.array(ns_dofs, dtype=np.int64)
+        self.node_spring_k: NDArray[float64] = np.array(ns_k, dtype=float)
+        self.node_spring_sign: NDArray[float64] = np.array(ns_sign, dtype=float)
+        self.node_spring_active: NDArray[np.bool_] = np.array(ns_active, dtype=bool)
+
+        # Tension/compression-only springs: the global stiffness block, and the row giving the spring's axial force from its global end displacements
+        springs = [spring for spring in model.springs.values() if spring.tension_only or spring.comp_only]
+        self.springs: List[str] = [spring.name for spring in springs]
+        self.spring_dofs: NDArray[np.int64] = np.array([model._build_dof_vector(s.i_node, s.j_node) for s in springs], dtype=np.int64).reshape(-1, 12)
+        self.spring_K: NDArray[float64] = np.array([s.K() for s in springs], dtype=float).reshape(-1, 12, 12)
+        self.spring_axial: NDArray[float64] = np.array([(s.k() @ s.T())[0] for s in springs], dtype=float).reshape(-1, 12)
+        self.spring_tension_only: NDArray[np.bool_] = np.array([s.tension_only for s in springs], dtype=bool)
+
+        # Tension/compression-only members, and the index of the physical member each sub-member belongs to
+        phys_members = [m for m in model.members.values() if m.tension_only or m.comp_only]
+        self.members: List[str] = [m.name for m in phys_members]
+        self.member_tension_only: NDArray[np.bool_] = np.array([m.tension_only for m in phys_members], dtype=bool)
+        tc_members = [sub for m in phys_members for sub in m.sub_members.values()]
+        self.tc_owner: NDArray[np.int64] = np.array([i for i, m in enumerate(phys_members) for _ in m.sub_members], dtype=np.int64)
+        self.tc_dofs: NDArray[np.int64] = MemberKernels.dofs(tc_members) if tc_members else np.zeros((0, 12), dtype=np.int64)
+        self.tc_K: NDArray[float64] = MemberKernels.cached_global_stiffness(tc_members) if tc_members else np.zeros((0, 12, 12))
+
+        # The axial force in an unloaded member is the first term of its local end force vector, `k[0, :] @ T @ D`. With P-Delta the geometric stiffness adds `P*kg[0, :] @ T @ D`.
+        if tc_members:
+            dir_cos = MemberKernels.direction_cosines(tc_members)
+            self.tc_axial: NDArray[float64] = _global_rows(MemberKernels.local_stiffness(tc_members)[:, 0, :], dir_cos)
+            self.tc_axial_geometric: NDArray[float64] = _global_rows(MemberKernels.local_geometric_stiffness_unit(tc_members)[:, 0, :], dir_cos)
+        else:
+            self.tc_axial = np.zeros((0, 12))
+            self.tc_axial_geometric = np.zeros((0, 12))
+
+        # The stiffness terms of every other element. The switching elements are temporarily removed from the model so that `FEModel3D.K` assembles the rest.
+        first = self.combo_names[0]
+        saved_members = [m.active[first] for m in phys_members]
+        saved_springs = [s.active[first] for s in springs]
+        node_springs = Analysis._TC_node_springs(model)
+        saved_node_springs = [spring[2] for spring in node_springs]
+        try:
+            for m in phys_members:
+                m.active[first] = False
+            for s in springs:
+                s.active[first] = False
+            for spring in node_springs:
+                spring[2] = False
+            self.K_rest: sp.sparse.csr_matrix = sp.sparse.csr_matrix(model.K(first, False, False, True))
+        finally:
+            for m, active in zip(phys_members, saved_members):
+                m.active[first] = active
+            for s, active in zip(springs, saved_springs):
+                s.active[first] = active
+            for spring, active in zip(node_springs, saved_node_springs):
+                spring[2] = active
+
+        # The geometric stiffness of every member for a unit axial force, and the row giving each member's axial force from its global end displacements
+        if pdelta:
+            members, owner = [], []
+            tc_index = {name: i for i, name in enumerate(self.members)}
+            for phys_member in model.members.values():
+                for member in phys_member.sub_members.values():
+                    members.append(member)
+                    owner.append(tc_index.get(phys_member.name, -1))
+            self.kg_owner: NDArray[np.int64] = np.array(owner, dtype=np.int64)
+            self.kg_dofs: NDArray[np.int64] = MemberKernels.dofs(members) if members else np.zeros((0, 12), dtype=np.int64)
+            self.kg_unit: NDArray[float64] = MemberKernels.cached_unit_geometric_stiffness(members) if members else np.zeros((0, 12, 12))
+            self.kg_axial: NDArray[float64] = np.zeros((len(members), 12))
+            if members:
+                E = np.array([m.material.E for m in members], dtype=float)
+                A = np.array([m.section.A for m in members], dtype=float)
+                x = MemberKernels.direction_cosines(members)[:, 0, :]
+                EA_L = (E*A/MemberKernels.lengths(members))[:, None]
+                self.kg_axial[:, 0:3] = -EA_L*x
+                self.kg_axial[:, 6:9] = EA_L*x
+
+    @staticmethod
+    def supported(model: FEModel3D) -> str | None:
+        """Checks whether a model's load combinations can be solved from a snapshot.
+
+        Member axial forces are recovered from the end displacements alone, which is only exact for tension/compression-only members without member loads.
+
+        :param model: The model being analyzed.
+        :type model: FEModel3D
+        :return: None if the model can be represented, otherwise the reason it can't.
+        :rtype: str or None
+        """
+
+        for phys_member in model.members.values():
+            if phys_member.tension_only or phys_member.comp_only:
+                loaded = phys_member.DistLoads or phys_member.PtLoads or any(sub.DistLoads or sub.PtLoads for sub in phys_member.sub_members.values())
+                if loaded:
+                    return f'tension/compression-only member {phys_member.name} has member loads'
+        return None
+
+
+def solve_combos(model: FEModel3D, snapshot: ModelSnapshot, workers: int, max_iter: int = 30, spring_tolerance: float = 0, member_tolerance: float = 0, num_steps: int = 1, solver: str | None = None, max_update_rank: int = 96, log: bool = False) -> None:
+    """Solves each of the snapshot's load combinations in a pool of worker processes and stores the results on the model.
+
+    Every load combination starts from the node support spring states at the start of the analysis, so the results don't depend on how the load combinations are shared among the workers. After the analysis the node support springs are left in the final state of the last load combination, as they would be after a sequential analysis.
+
+    :param model: The model the snapshot was taken from.
+    :type model: FEModel3D
+    :param snapshot: The snapshot to be solved.
+    :type snapshot: ModelSnapshot
+    :param workers: The number of worker processes.
+    :type workers: int
+    :param max_iter: The maximum number of tension/compression-only iterations. Defaults to 30.
+    :type max_iter: int, optional
+    :param spring_tolerance: Convergence tolerance for tension/compression-only springs. Defaults to 0.
+    :type spring_tolerance: float, optional
+    :param member_tolerance: Convergence tolerance for tension/compression-only members. Defaults to 0.
+    :type member_tolerance: float, optional
+    :param num_steps: The number of load steps (not used for P-Delta analysis). Defaults to 1.
+    :type num_steps: int, optional
+    :param solver: None or 'banded', as for `FEModel3D.analyze`. Defaults to None.
+    :type solver: str, optional
+    :param max_update_rank: The largest number of changed degrees of freedom handled with a low-rank correction. Defaults to 96.
+    :type max_update_rank: int, optional
+    :param log: Prints updates to the console if set to True. Defaults to False.
+    :type log: bool, optional
+    :raises Exception: Occurs when a load combination diverges, or fails in a worker.
+    """
+
+    if log:
+        print(f'- Solving {len(snapshot.combo_names)} load combinations with {workers} worker processes')
+
+    # Workers are forked on Linux, so the snapshot is inherited rather than sent to each of them. Other platforms use their default start method, since forking isn't safe on macOS.
+    context = multiprocessing.get_context('fork') if sys.platform.startswith('linux') else None
+    settings = (max_iter, spring_tolerance, member_tolerance, num_steps, solver, max_update_rank)
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=_initialize_worker, initargs=(snapshot, settings)) as executor:
+        # `map` returns the results in load combination order
+        results = list(executor.map(_solve_combo, range(len(snapshot.combo_names))))
+
+    # Store the results on the model in load combination order
+    node_springs = Analysis._TC_node_springs(model)
+    for combo_name, (D, node_spring_active, spring_active, member_active) in zip(snapshot.combo_names, results):
+
+        Analysis._store_displacements(model, D[snapshot.D1_indices], snapshot.D2, snapshot.D1_indices, snapshot.D2_indices, model.load_combos[combo_name])
+
+        for name, active in zip(snapshot.springs, spring_active):
+            model.springs[name].active[combo_name] = bool(active)
+
+        for name, active in zip(snapshot.members, member_active):
+            phys_member = model.members[name]
+            phys_member.active[combo_name] = bool(active)
+            for sub_member in phys_member.sub_members.values():
+                sub_member.active[combo_name] = bool(active)
+
+    if results:
+        for spring, active in zip(node_springs, results[-1][1]):
+            spring[2] = bool(active)
+
+    # Member results will be resegmented from the new displacements
+    for phys_member in model.members.values():
+        for sub_member in phys_member.sub_members.values():
+            sub_member._reset_segments()
+
+    # Member end forces and reactions include the geometric stiffness once the model is flagged as a P-Delta solution
+    if snapshot.pdelta:
+        model.solution = 'P-Delta'
+
+
+def default_workers() -> int:
+    """Returns the number of worker processes used when none is given: one per CPU.
+
+    :rtype: int
+    """
+    return os.cpu_count() or 1
+
+
+def _global_rows(rows: NDArray[float64], dir_cos: NDArray[float64]) -> NDArray[float64]:
+    """Transforms a row of each member's local matrix into global coordinates, `row @ T`, where `T` is block diagonal with the member's direction cosines.
+
+    :param rows: An (n, 12) array of local rows.
+    :type rows: NDArray[float64]
+    :param dir_cos: The (n, 3, 3) direction cosines of each member.
+    :type dir_cos: NDArray[float64]
+    :rtype: NDArray[float64]
+    """
+    return np.einsum('nbi,nij->nbj', rows.reshape(-1, 4, 3), dir_cos).reshape(-1, 12)
+
+
+# The snapshot and solver settings held by each worker process, and the sparse patterns used to assemble its matrices
+_worker: Dict = {}
+
+
+def _initialize_worker(snapshot: ModelSnapshot, settings: Tuple) -> None:
+    """Stores the snapshot in a worker process, and builds the sparse patterns used to assemble its matrices."""
+
+    _worker.clear()
+    _worker['snapshot'] = snapshot
+    _worker['settings'] = settings
+    snapshot.K11_factorization = None
+
+    # The positions of the switching terms are summed into the same pattern as the fixed terms, so each state only changes the data
+    K_rest = snapshot.K_rest.tocoo()
+    rows = np.concatenate((K_rest.row, snapshot.node_spring_dofs, np.repeat(snapshot.spring_dofs, 12, axis=1).ravel(), np.repeat(snapshot.tc_dofs, 12, axis=1).ravel()))
+    cols = np.concatenate((K_rest.col, snapshot.node_spring_dofs, np.tile(snapshot.spring_dofs, (1, 12)).ravel(), np.tile(snapshot.tc_dofs, (1, 12)).ravel()))
+    _worker['K_rest_data'] = K_rest.data
+    _worker['K_pattern'] = SparsePattern(rows, cols, (snapshot.n, snapshot.n))
+
+    if snapshot.pdelta:
+        rows, cols, _ = MemberKernels.coo_entries(snapshot.kg_unit, snapshot.kg_dofs, drop_zeros=False)
+        _worker['Kg_pattern'] = SparsePattern(rows, cols, (snapshot.n, snapshot.n))
+
+    # The free-first permutation used to partition the global matrices
+    _worker['permutation'] = np.concatenate((snapshot.D1_indices, snapshot.D2_indices))
+
+
+def _partition(K) -> Tuple:
+    """Partitions a global `csr` matrix into `K11` and `K12`, in the storage the snapshot asks for."""
+
+    n1 = len(_worker['snapshot'].D1_indices)
+    permutation = _worker['permutation']
+    K = K[permutation][:, permutation]
+    K11, K12 = K[:n1, :n1], K[:n1, n1:]
+    if _worker['snapshot'].sparse:
+        return K11.tocsr(), K12.tocsr()
+    return K11.toarray(), K12.toarray()
+
+
+def _K(node_spring_active: NDArray[np.bool_], spring_active: NDArray[np.bool_], member_active: NDArray[np.bool_]) -> sp.sparse.csr_matrix:
+    """Assembles the global stiffness matrix for a tension/compression-only state."""
+
+    s = _worker['snapshot']
+    data = np.concatenate((_worker['K_rest_data'],
+                           s.node_spring_k*node_spring_active,
+                           (s.spring_K*spring_active[:, None, None]).ravel(),
+                           (s.tc_K*member_active[s.tc_owner][:, None, None]).ravel()))
+    return _worker['K_pattern'].assemble(data)
+
+
+class _SnapshotCombo():
+    """
+    One load combination being solved in a worker process, with its displacements and tension/compression-only states held in arrays.
+
+    It provides the same interface as `Analysis._ModelCombo`, so the worker runs the same load stepping and P-Delta drivers as a sequential analysis.
+    """
+
+    def __init__(self) -> None:
+
+        s = _worker['snapshot']
+        self.snapshot: ModelSnapshot = s
+        self.D1_indices: List[int] = list(s.D1_indices)
+        self.sparse: bool = s.sparse
+        self.permc_spec: str = s.permc_spec
+        self.log: bool = False
+
+        # Every load combination starts from the node support spring states at the start of the analysis, with all springs and members active
+        self.node_spring_active: NDArray[np.bool_] = s.node_spring_active.copy()
+        self.spring_active: NDArray[np.bool_] = np.ones(len(s.springs), dtype=bool)
+        self.member_active: NDArray[np.bool_] = np.ones(len(s.members), dtype=bool)
+
+        # The global displacement vector
+        self.D: NDArray[float64] = np.zeros((s.n, 1))
+
+    def factorization(self, solver: str | None = None, max_rank: int = 96, preconditioner: str = 'jacobi', tolerance: float = 1e-8):
+        """Returns the solver for the current tension/compression-only state. The stiffness matrix is only assembled when the state differs from the one the worker last factorized."""
+
+        s = self.snapshot
+        state = np.concatenate((self.node_spring_active, self.spring_active, self.member_active)).tobytes()
+        if s.K11_factorization is None or not s.K11_factorization.matches(state):
+            K11, K12 = _partition(_K(self.node_spring_active, self.spring_active, self.member_active))
+            Analysis._update_factorization(s, K11, self.D1_indices, s.sparse, state, K12, solver=solver, max_rank=max_rank, preconditioner=preconditioner, tolerance=tolerance)
+        return s.K11_factorization
+
+    def store(self, D1: NDArray[float64], D2: NDArray[float64], add: bool = False) -> None:
+        """Stores the displacements, or adds them to the stored ones if `add` is True."""
+
+        s = self.snapshot
+        D = np.zeros((s.n, 1))
+        D[s.D1_indices] = D1
+        D[s.D2_indices] = D2
+        self.D = self.D + D if add else D
+
+    def check_TC(self, spring_tolerance: float = 0, member_tolerance: float = 0) -> bool:
+        """Updates the tension/compression-only states from the displacements with the same rules as `Analysis._check_TC_convergence`, and returns True if none of them changed."""
+
+        s = self.snapshot
+        D = self.D.reshape(-1)
+        convergence = True
+
+        # Node support springs switch on and off with the displacement
+        should_be_active = Analysis._node_springs_active(D[s.node_spring_dofs], s.node_spring_sign, spring_tolerance)
+        if np.any(should_be_active != self.node_spring_active):
+            self.node_spring_active[:] = should_be_active
+            convergence = False
+
+        # Springs are only ever switched off
+        axial = np.sum(s.spring_axial*D[s.spring_dofs], axis=1)
+        switch = self.spring_active & Analysis._TC_deactivated(s.spring_tension_only, axial, axial, spring_tolerance)
+        if np.any(switch):
+            self.spring_active[switch] = False
+            convergence = False
+
+        # Members are only ever switched off, using the largest/smallest axial force of their sub-members
+        if len(s.members):
+            d = D[s.tc_dofs]
+            axial = np.sum(s.tc_axial*d, axis=1)
+            if s.pdelta:
+                P = np.sum(s.kg_axial[s.kg_owner >= 0]*d, axis=1)
+                axial += P*np.sum(s.tc_axial_geometric*d, axis=1)
+            P_max = np.full(len(s.members), -np.inf)
+            P_min = np.full(len(s.members), np.inf)
+            np.maximum.at(P_max, s.tc_owner, axial)
+            np.minimum.at(P_min, s.tc_owner, axial)
+            switch = self.member_active & Analysis._TC_deactivated(s.member_tension_only, P_max, P_min, member_tolerance)
+            if np.any(switch):
+                self.member_active[switch] = False
+                convergence = False
+
+        return convergence
+
+    def geometric_stiffness(self) -> Tuple:
+        """Returns the partitioned geometric stiffness matrices `Kg11` and `Kg12` for the member axial forces from the stored displacements. Inactive members carry no axial force."""
+
+        s = self.snapshot
+        scale = np.ones(len(s.kg_owner))
+        scale[s.kg_owner >= 0] = self.member_active[s.kg_owner[s.kg_owner >= 0]]
+        P = np.sum(s.kg_axial*self.D.reshape(-1)[s.kg_dofs], axis=1)*scale
+        return _partition(_worker['Kg_pattern'].assemble((s.kg_unit*P[:, None, None]).ravel()))
+
+    def record_stats(self, stats: List[Dict[str, float]]) -> None:
+        """Iterative solver statistics are not recorded for load combinations solved in worker processes."""
+        pass
+
+
+def _solve_combo(index: int) -> Tuple:
+    """Solves one load combination in a worker process.
+
+    :param index: The load combination's position in the snapshot.
+    :type index: int
+    :return: The global displacement vector and the final node support spring, spring and member states.
+    :rtype: tuple
+    """
+
+    s = _worker['snapshot']
+    max_iter, spring_tolerance, member_tolerance, num_steps, solver, max_rank = _worker['settings']
+
+    P1 = s.P1[:, index:index + 1]
+    FER1 = s.FER1[:, index:index + 1]
+
+    combo = _SnapshotCombo()
+    if s.pdelta:
+        Analysis._solve_PDelta(combo, P1, FER1, s.D2, max_iter, solver)
+    else:
+        Analysis._solve_load_steps(combo, P1, FER1, s.D2, num_steps, max_iter, spring_tolerance, member_tolerance, solver, max_rank)
+
+    return combo.D, combo.node_spring_active, combo.spring_active, combo.member_active
@@ -1,6 +1,7 @@
 from __future__ import annotations # Allows more recent type hints features
 from typing import Dict, List, Literal, Tuple, TYPE_CHECKING
 from Pynite.Member3D import Member3D
+from Pynite.SpatialIndex import NodeGrid
 
 if TYPE_CHECKING:
 
@@ -10,7 +11,7 @@ if TYPE_CHECKING:
     from numpy import float64
     from numpy.typing import NDArray
 
-from numpy import array, dot, linspace, hstack, empty
+from numpy import array, dot, linspace, hstack, empty, sort
 from numpy.linalg import norm
 from math import isclose, acos
 
@@ -36,7 +37,10 @@ class PhysMember(Member3D):
         Subdivides the physical member into sub-members at each node along the physical member
         """
 
-        # Clear out any old sub_members
+        # Clear out any old sub_members, along with their segments and the physical member's own segments
+        for sub_member in self.sub_members.values():
+            sub_member._reset_segments()
+        self._reset_segments()
         self.sub_members = {}
 
         # Start a new list of nodes along the member
@@ -72,42 +76,43 @@ class PhysMember(Member3D):
         zmin = min(Zi, Zj) - bb_tol
         zmax = max(Zi, Zj) + bb_tol
 
-        # Step through each node in the model
-        for node in self.model.nodes.values():
+        # Get the candidate nodes inside the bounding box from the model's spatial index. The index is built once per analysis by `Analysis._renumber`. If it isn't available, index the model's nodes now.
+        grid = self.model._node_grid
+        if grid is None:
+            grid = NodeGrid(self.model.nodes.values())
+        candidates = sort(grid.query_box(array([xmin, ymin, zmin]), array([xmax, ymax, zmax])))
+
+        # Bounding-box reject for all the candidates at once
+        XYZ = grid.coords[candidates]
+        in_box = ((XYZ[:, 0] >= xmin) & (XYZ[:, 0] <= xmax) &
+                  (XYZ[:, 1] >= ymin) & (XYZ[:, 1] <= ymax) &
+                  (XYZ[:, 2] >= zmin) & (XYZ[:, 2] <= zmax))
+        candidates, XYZ = candidates[in_box], XYZ[in_box]
+
+        # Vectors from the i-node to each candidate node
+        dx = XYZ[:, 0] - Xi
+        dy = XYZ[:, 1] - Yi
+        dz = XYZ[:, 2] - Zi
+
+        # Parametric location along the member (projection onto axis)
+        t = dx * u[0] + dy * u[1] + dz * u[2]
+
+        # Perpendicular distance from the member line
+        px = dx - t * u[0]
+        py = dy - t * u[1]
+        pz = dz - t * u[2]
+        d_perp = (px**2 + py**2 + pz**2) ** 0.5
+
+        # Consider a node on the member if it lies within the i-j segment and its perpendicular distance is negligible
+        on_member = (t > 0.0) & (t < L) & (d_perp <= tol)
+        for index, t_node in zip(candidates[on_member].tolist(), t[on_member].tolist()):
 
             # Skip the end nodes
+            node = grid.nodes[index]
             if node is self.i_node or node is self.j_node:
                 continue
 
-            # Bounding-box reject (very fast)
-            if (
-                node.X < xmin or node.X > xmax or
-                node.Y < ymin or node.Y > ymax or
-                node.Z < zmin or node.Z > zmax
-            ):
-                continue
-
-            # Vector from i-node to this node
-            dx = node.X - Xi
-            dy = node.Y - Yi
-            dz = node.Z - Zi
-
-            # Parametric location along the member (projection onto axis)
-            t = dx * u[0] + dy * u[1] + dz * u[2]
-
-            # Quickly reject nodes outside the i-j segment
-            if t <= 0.0 or t >= L:
-                continue
-
-            # Perpendicular distance from the member line
-            px = dx - t * u[0]
-            py = dy - t * u[1]
-            pz = dz - t * u[2]
-            d_perp = (px**2 + py**2 + pz**2) ** 0.5
-
-            # Consider node on member if perpendicular distance is negligible
-            if d_perp <= tol:
-                int_nodes.append((node, t))
+            int_nodes.append((node, t_node))
 
         # Create a list of sorted intermediate nodes by distance from the i-node
         int_nodes = sorted(int_nodes, key=lambda x: x[1])
@@ -327,9 +332,7 @@ class PhysMember(Member3D):
         for i, submember in enumerate(self.sub_members.values()):
 
             # Segment the submember into segments with mathematically continuous loads if not already done
-            if submember._solved_combo is None or combo_name != submember._solved_combo.name:
-                submember._segment_member(combo_name)
-                submember._solved_combo = self.model.load_combos[combo_name]
+            submember._segment(combo_name)
 
             # Check if this is the last submember
             if i == len(self.sub_members.values()) - 1:
@@ -501,9 +504,7 @@ class PhysMember(Member3D):
         for i, submember in enumerate(self.sub_members.values()):
 
             # Segment the submember into segments with mathematically continuous loads if not already done
-            if submember._solved_combo is None or combo_name != submember._solved_combo.name:
-                submember._segment_member(combo_name)
-                submember._solved_combo = self.model.load_combos[combo_name]
+            submember._segment(combo_name)
 
             # Check if this is the last submember
             if i == len(self.sub_members.values()) - 1:
@@ -651,9 +652,7 @@ class PhysMember(Member3D):
         for i, submember in enumerate(self.sub_members.values()):
 
             # Segment the submember into segments with mathematically continuous loads if not already done
-            if submember._solved_combo is None or combo_name != submember._solved_combo.name:
-                submember._segment_member(combo_name)
-                submember._solved_combo = self.model.load_combos[combo_name]
+            submember._segment(combo_name)
 
             # Check if this is the last submember
             if i == len(self.sub_members.values()) - 1:
@@ -783,9 +782,7 @@ class PhysMember(Member3D):
         for i, submember in enumerate(self.sub_members.values()):
 
             # Segment the submember into segments with mathematically continuous loads if not already done
-            if submember._solved_combo is None or combo_name != submember._solved_combo.name:
-                submember._segment_member(combo_name)
-                submember._solved_combo = self.model.load_combos[combo_name]
+            submember._segment(combo_name)
 
             # Check if this is the last submember
             if i == len(self.sub_members.values()) - 1:
@@ -969,9 +966,7 @@ class PhysMember(Member3D):
         for i, submember in enumerate(self.sub_members.values()):
 
             # Segment the submember into segments with mathematically continuous loads if not already done
-            if submember._solved_combo is None or combo_name != submember._solved_combo.name:
-                submember._segment_member(combo_name)
-                submember._solved_combo = self.model.load_combos[combo_name]
+            submember._segment(combo_name)
 
             # Check if this is the last submember
             if i == len(self.sub_members.values()) - 1:
@@ -3,17 +3,23 @@ from __future__ import annotations # Allows more recent type hints features
 import numpy as np
 from typing import TYPE_CHECKING
 
+from Pynite.VersionedAttributes import VersionedAttributes
+
 if TYPE_CHECKING:
     from numpy import float64
     from numpy.typing import NDArray
     from Pynite.FEModel3D import FEModel3D
 
-class Section():
+class Section(VersionedAttributes):
     """
     A class representing a section assigned to a Member3D element in a finite element model.
 
     This class stores all properties related to the geometry of the member
     """
+
+    # The section properties that the stiffness of every member using the section depends on
+    _VERSIONED_ATTRIBUTES = frozenset(('A', 'Iy', 'Iz', 'J'))
+
     def __init__(self, model: 'FEModel3D', name: str, A: float, Iy: float, Iz: float, J: float) -> None:
         """
         :param model: The finite element model to which this section belongs
@@ -0,0 +1,135 @@
+"""
+A bounded cache of member segmentations.
+
+`Member3D._segment_member` rebuilds a member's mathematically continuous segments each time
+results are requested for a different load combination. Without a cache, extracting results for
+many load combinations re-segments every member once per load combination (and again each time
+the load combinations are revisited, e.g. by `max_moment(combo_tags=[...])`). The cache keeps the
+most recently used segmentations of every member in the model, keyed by member and load
+combination name, and evicts the least recently used ones once an estimated memory budget is
+exceeded.
+"""
+
+from __future__ import annotations  # Allows more recent type hints features
+from typing import TYPE_CHECKING
+from collections import OrderedDict
+import sys
+
+if TYPE_CHECKING:
+    from typing import Dict, List, Set, Tuple
+    from Pynite.Member3D import Member3D
+    from Pynite.BeamSegZ import BeamSegZ
+    from Pynite.BeamSegY import BeamSegY
+
+    Segments = Tuple[List[BeamSegZ], List[BeamSegY], List[BeamSegZ]]
+
+
+def _object_bytes(obj: object) -> int:
+    """Estimates the memory used by a segment object: the object, its attribute dictionary and the attribute values."""
+    attributes = getattr(obj, '__dict__', {})
+    return sys.getsizeof(obj) + sys.getsizeof(attributes) + sum(sys.getsizeof(value) for value in attributes.values())
+
+
+class SegmentCache():
+    """
+    A least recently used cache of member segmentations (`SegmentsZ`, `SegmentsY` and `SegmentsX`), shared by all the members in a model.
+    """
+
+    def __init__(self, max_bytes: int = 256*2**20) -> None:
+        """Creates an empty cache.
+
+        :param max_bytes: The approximate memory budget for the cached segments, in bytes. Defaults to 256 MB. Set it to 0 to disable caching.
+        :type max_bytes: int, optional
+        """
+
+        self.max_bytes: int = max_bytes  # The memory budget for the cached segments
+        self.n_bytes: int = 0            # The estimated memory used by the cached segments
+        self.hits: int = 0               # The number of segmentations that were found in the cache
+        self.misses: int = 0             # The number of segmentations that had to be calculated
+
+        self._entries: OrderedDict[Tuple[Member3D, str], Tuple[Segments, int]] = OrderedDict()  # Key = (member, load combination name), Value = (segments, estimated size in bytes). The most recently used entries are at the end.
+        self._combos: Dict[Member3D, Set[str]] = {}                                              # The cached load combinations of each member
+        self._row_bytes: int | None = None                                                       # The estimated memory used by one segment in each direction, measured from the first entry
+
+    def get(self, member: Member3D, combo_name: str) -> Segments | None:
+        """Returns a member's cached segments for a load combination, or `None` if they aren't cached.
+
+        :param member: The member.
+        :type member: Member3D
+        :param combo_name: The name of the load combination.
+        :type combo_name: str
+        :return: The `SegmentsZ`, `SegmentsY` and `SegmentsX` lists, or `None`.
+        :rtype: tuple | None
+        """
+
+        entry = self._entries.get((member, combo_name))
+        if entry is None:
+            self.misses += 1
+            return None
+
+        # Flag the entry as the most recently used one
+        self._entries.move_to_end((member, combo_name))
+        self.hits += 1
+        return entry[0]
+
+    def put(self, member: Member3D, combo_name: str, segments: Segments) -> None:
+        """Stores a member's segments for a load combination, evicting the least recently used entries if the memory budget is exceeded.
+
+        :param member: The member.
+        :type member: Member3D
+        :param combo_name: The name of the load combination.
+        :type combo_name: str
+        :param segments: The `SegmentsZ`, `SegmentsY` and `SegmentsX` lists. They must not be modified after they are cached.
+        :type segments: tuple
+        """
+
+        self._pop(member, combo_name)
+
+        # Estimate the size of the segments. Every segment has the same attributes, so the size of the first one is measured once and reused.
+        n_rows = len(segments[0])
+        if self._row_bytes is None and n_rows:
+            self._row_bytes = sum(_object_bytes(segment_list[0]) for segment_list in segments if segment_list)
+        n_bytes = sum(sys.getsizeof(segment_list) for segment_list in segments) + n_rows*(self._row_bytes or 0)
+
+        # Don't cache anything larger than the whole budget
+        if n_bytes > self.max_bytes:
+            return
+
+        self._entries[(member, combo_name)] = (segments, n_bytes)
+        self._combos.setdefault(member, set()).add(combo_name)
+        self.n_bytes += n_bytes
+
+        # Evict the least recently used entries until the cache fits in its budget again
+        while self.n_bytes > self.max_bytes:
+            (old_member, old_combo), _ = next(iter(self._entries.items()))
+            self._pop(old_member, old_combo)
+
+    def discard(self, member: Member3D) -> None:
+        """Removes all of a member's cached segments. This is used whenever the member's results change.
+
+        :param member: The member.
+        :type member: Member3D
+        """
+        for combo_name in list(self._combos.get(member, ())):
+            self._pop(member, combo_name)
+
+    def clear(self) -> None:
+        """Removes every cached segment."""
+        self._entries.clear()
+        self._combos.clear()
+        self.n_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _pop(self, member: Member3D, combo_name: str) -> None:
+        """Removes one entry from the cache, if it is there."""
+
+        entry = self._entries.pop((member, combo_name), None)
+        if entry is None:
+            return
+        self.n_bytes -= entry[1]
+        combos = self._combos[member]
+        combos.discard(combo_name)
+        if not combos:
+            del self._combos[member]
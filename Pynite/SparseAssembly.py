@@ -0,0 +1,64 @@
+from __future__ import annotations  # Allows more recent type hints features
+from typing import TYPE_CHECKING
+
+import numpy as np
+import scipy as sp
+
+if TYPE_CHECKING:
+    from typing import Tuple
+    from numpy import float64
+    from numpy.typing import NDArray
+
+
+class SparsePattern():
+    """
+    The symbolic structure of a sparse global matrix, built once from the (row, column) position of every element term.
+
+    Building a `csr_matrix` from COO vectors sorts and merges all of the terms, which is repeated every time a global matrix is assembled. The positions of the terms don't change between tension/compression-only iterations or P-Delta steps (inactive elements still contribute their positions, with zero values), so the sorting is done once here. Each later assembly only has to sum the element values into the `csr` data array.
+    """
+
+    def __init__(self, rows: NDArray[np.int64], cols: NDArray[np.int64], shape: Tuple[int, int]) -> None:
+        """Builds the `csr` structure and the map from each element term to its slot in the data array.
+
+        :param rows: The global row of each element term.
+        :type rows: NDArray[np.int64]
+        :param cols: The global column of each element term.
+        :type cols: NDArray[np.int64]
+        :param shape: The shape of the global matrix.
+        :type shape: tuple
+        """
+
+        self.rows: NDArray[np.int64] = np.asarray(rows, dtype=np.int64)
+        self.cols: NDArray[np.int64] = np.asarray(cols, dtype=np.int64)
+        self.shape: Tuple[int, int] = (int(shape[0]), int(shape[1]))
+
+        # Sort the terms by (row, column). Each unique position becomes one stored entry, and `slots` gives the entry each term is summed into.
+        keys, self.slots = np.unique(self.rows*self.shape[1] + self.cols, return_inverse=True)
+        self.slots = self.slots.reshape(-1)
+        self.indices: NDArray[np.int64] = keys % self.shape[1]
+        self.indptr: NDArray[np.int64] = np.concatenate(([0], np.cumsum(np.bincount(keys//self.shape[1], minlength=self.shape[0]))))
+
+    def matches(self, rows: NDArray[np.int64], cols: NDArray[np.int64], shape: Tuple[int, int]) -> bool:
+        """Returns True if this pattern was built from the same term positions.
+
+        :param rows: The global row of each element term.
+        :type rows: NDArray[np.int64]
+        :param cols: The global column of each element term.
+        :type cols: NDArray[np.int64]
+        :param shape: The shape of the global matrix.
+        :type shape: tuple
+        :rtype: bool
+        """
+        return tuple(shape) == self.shape and np.array_equal(rows, self.rows) and np.array_equal(cols, self.cols)
+
+    def assemble(self, data: NDArray[float64]) -> sp.sparse.csr_matrix:
+        """Sums the element terms into a `csr` matrix with this pattern.
+
+        :param data: The value of each element term, in the same order as the rows and columns the pattern was built from.
+        :type data: NDArray[float64]
+        :return: The assembled global matrix.
+        :rtype: scipy.sparse.csr_matrix
+        """
+
+        values = np.bincount(self.slots, weights=data, minlength=len(self.indices))
+        return sp.sparse.csr_matrix((values, self.indices, self.indptr), shape=self.shape)
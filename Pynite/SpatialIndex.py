@@ -0,0 +1,87 @@
+from __future__ import annotations  # Allows more recent type hints features
+from typing import TYPE_CHECKING
+from itertools import product
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from typing import Dict, Iterable, List, Tuple
+    from numpy import float64
+    from numpy.typing import NDArray
+    from Pynite.Node3D import Node3D
+
+
+class NodeGrid():
+    """
+    A uniform grid of buckets used to quickly find the nodes inside an axis-aligned box.
+
+    Each node is placed in the cubic cell containing it. A box query only visits the cells the box overlaps, so finding the nodes near a member costs roughly the same regardless of how many nodes are in the model. The grid is a snapshot: it must be rebuilt if nodes are added, removed or moved.
+    """
+
+    def __init__(self, nodes: Iterable[Node3D], cell_size: float | None = None) -> None:
+        """Builds the grid.
+
+        :param nodes: The nodes to index.
+        :type nodes: Iterable[Node3D]
+        :param cell_size: The length of each side of a grid cell. Cells about the size of a typical member work well. If `None`, a size giving roughly one node per cell is chosen from the extents of the nodes. Defaults to None.
+        :type cell_size: float, optional
+        """
+
+        self.nodes: List[Node3D] = list(nodes)
+        self.coords: NDArray[float64] = np.array([[node.X, node.Y, node.Z] for node in self.nodes], dtype=float).reshape(-1, 3)
+
+        # Nothing else to set up for an empty grid
+        self.cells: Dict[Tuple[int, int, int], NDArray[np.int64]] = {}
+        self.origin: NDArray[float64] = self.coords.min(axis=0) if self.nodes else np.zeros(3)
+        if not self.nodes:
+            self.cell_size: float = 1.0
+            return
+
+        # Choose a default cell size from the extents of the nodes
+        extents = self.coords.max(axis=0) - self.origin
+        if cell_size is None or not cell_size > 0:
+            cell_size = float(extents.max())/max(1.0, len(self.nodes)**(1/3))
+        if not cell_size > 0:
+            cell_size = 1.0
+        self.cell_size = cell_size
+
+        # Find the cell each node belongs to, then group the node indices by cell
+        keys = self._cell_of(self.coords)
+        order = np.lexsort(keys.T[::-1])
+        keys = keys[order]
+        starts = np.flatnonzero(np.any(np.diff(keys, axis=0) != 0, axis=1)) + 1
+        for group in np.split(np.arange(len(order)), starts):
+            self.cells[tuple(keys[group[0]].tolist())] = order[group]
+
+    def _cell_of(self, points: NDArray[float64]) -> NDArray[np.int64]:
+        """Returns the (i, j, k) cell indices containing each of an (n, 3) array of points."""
+        return np.floor((points - self.origin)/self.cell_size).astype(np.int64)
+
+    def query_box(self, lower: NDArray[float64], upper: NDArray[float64]) -> NDArray[np.int64]:
+        """Returns the indices (into `nodes` and `coords`) of the nodes in the cells overlapping a box. The result may include nodes slightly outside the box, so callers should still apply their own exact test.
+
+        :param lower: The (x, y, z) coordinates of the box's lower corner.
+        :type lower: NDArray[float64]
+        :param upper: The (x, y, z) coordinates of the box's upper corner.
+        :type upper: NDArray[float64]
+        :return: The candidate node indices.
+        :rtype: NDArray[np.int64]
+        """
+
+        if not self.cells:
+            return np.zeros(0, dtype=np.int64)
+
+        lo, hi = self._cell_of(np.array([lower, upper], dtype=float))
+        n_box_cells = int(np.prod(hi - lo + 1))
+
+        # Visit each cell in the box, unless the box covers more cells than are occupied, in which case it's cheaper to filter the occupied cells
+        if n_box_cells <= len(self.cells):
+            groups = [self.cells[key] for key in product(*(range(a, b + 1) for a, b in zip(lo.tolist(), hi.tolist()))) if key in self.cells]
+        else:
+            groups = [indices for key, indices in self.cells.items()
+                      if all(a <= k <= b for a, k, b in zip(lo.tolist(), key, hi.tolist()))]
+
+        if not groups:
+            return np.zeros(0, dtype=np.int64)
+
+        return np.concatenate(groups)
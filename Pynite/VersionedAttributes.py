@@ -0,0 +1,18 @@
+class VersionedAttributes():
+    """
+    A mixin for model objects whose attributes feed the member stiffness matrices and fixed end reactions.
+
+    Assigning any attribute named in `_VERSIONED_ATTRIBUTES` increments the owning model's `_version` counter, which tells the members that their cached matrices are stale. Classes using the mixin declare only the names they watch. The object must store its model as `self.model`; assignments made before the model is set (i.e. early in `__init__`) are not counted.
+    """
+
+    # The attribute names that invalidate the model's cached matrices when assigned
+    _VERSIONED_ATTRIBUTES: frozenset = frozenset()
+
+    def __setattr__(self, name, value):
+
+        if name in self._VERSIONED_ATTRIBUTES:
+            model = self.__dict__.get('model')
+            if model is not None:
+                model._version += 1
+
+        super().__setattr__(name, value)
@@ -124,7 +124,7 @@ class CodeCheckFeature:
                         'values': [clean_positions, uc_vals],
                         'raw_values': clean_raw,
                         'min': App.Units.Quantity(float(np.min(res['values'])), ""),
-                        'max': App.Units.Quantity(float(np.max(res['values'])), "")
+                        'max': App.Units.Quantity(float(res['max_uc']), "")
                     }
                     fem_results.load_cases[case_name]['members'][beam_name]['unity_check'] = result_entry
 
@@ -244,6 +244,9 @@ class CodeCheckFeature:
         def get_raw(key):
             return res_data.get(key, {}).get('raw_values', [])
 
+        def get_critical(key):
+            return res_data.get(key, {}).get('raw_critical_values', [])
+
         forces = {
             'x': res_data.get('axial', {}).get('raw_positions', []),
             'P': get_raw('axial'),
@@ -251,7 +254,18 @@ class CodeCheckFeature:
             'Mz': get_raw('moment_z'),
             'Vy': get_raw('shear_y'),
             'Vz': get_raw('shear_z'),
-            'Tx': get_raw('moment_x')
+            'Tx': get_raw('moment_x'),
+
+            # Forces at the exact extrema of each internal force, checked on top of the sample points
+            'critical': {
+                'x': res_data.get('axial', {}).get('raw_critical_positions', []),
+                'P': get_critical('axial'),
+                'My': get_critical('moment_y'),
+                'Mz': get_critical('moment_z'),
+                'Vy': get_critical('shear_y'),
+                'Vz': get_critical('shear_z'),
+                'Tx': get_critical('moment_x')
+            }
         }
 
         # --- 5. Parameter Overrides (Using Beam BucklingLength Properties) ---
@@ -302,7 +316,8 @@ class CodeCheckFeature:
             max_vals = np.max(np.vstack(valid_arrays), axis=0)
             positions = results_list[valid_indices[0]]['positions']
 
-            max_uc_overall = float(np.max(max_vals))
+            # The governing unity check may lie between the sample points, at an exact internal force extremum
+            max_uc_overall = max(float(np.max(max_vals)), max(r['max_uc'] for r in results_list))
             best_log = "Envelope Log"
             for i in valid_indices:
                 r = results_list[i]
@@ -331,7 +346,7 @@ class CodeCheckFeature:
                 'values': [clean_positions, uc_vals],
                 'raw_values': clean_raw,
                 'min': App.Units.Quantity(float(np.min(max_vals)), ""),
-                'max': App.Units.Quantity(float(np.max(max_vals)), "")
+                'max': App.Units.Quantity(max_uc_overall, "")
             }
 
     def _find_solver(self, obj):
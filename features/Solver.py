@@ -2,7 +2,7 @@ import FreeCAD as App
 import FreeCADGui as Gui
 import os
 
-from solvers.PyNiteSolver import PyNiteSolverEngine, MEMBER_RESULT_KEYS
+from solvers.PyNiteSolver import PyNiteSolverEngine, MEMBER_RESULT_KEYS, SOLVER_PATHS, MATRIX_STORAGES, NODE_ORDERINGS
 from features.SolverEngine import FEMResult
 from features.nodes import make_result_nodes_group
 from features.beams import make_result_beams_group
@@ -31,6 +31,7 @@ class Solver():
                                                                                                       "Modal",
                                                                                                       "Buckling"]
         obj.addProperty("App::PropertyBool", "RunAnalysis", "Solver", "Run analysis").RunAnalysis = False
+        self._add_solver_options(obj)
 
         # Stores the full results dict
         obj.addProperty("App::PropertyPythonObject", "Results", "Results", "Full Analysis Results", 4)
@@ -49,6 +50,24 @@ class Solver():
 
         self._create_result_groups(obj)
 
+    def _add_solver_options(self, obj):
+        """Adds the solver path options (also used to upgrade documents saved without them)"""
+        if not hasattr(obj, "SolverPath"):
+            obj.addProperty("App::PropertyEnumeration", "SolverPath", "Solver",
+                            "Analysis path, Automatic picks the cheapest valid one").SolverPath = SOLVER_PATHS
+        if not hasattr(obj, "MatrixStorage"):
+            obj.addProperty("App::PropertyEnumeration", "MatrixStorage", "Solver",
+                            "Stiffness matrix storage, Automatic picks dense or sparse from model size").MatrixStorage = MATRIX_STORAGES
+        if not hasattr(obj, "NodeOrdering"):
+            obj.addProperty("App::PropertyEnumeration", "NodeOrdering", "Solver",
+                            "Node numbering, RCM reduces bandwidth and AMD (minimum degree) reduces sparse fill-in but is slow to compute for large plate meshes").NodeOrdering = NODE_ORDERINGS
+        if not hasattr(obj, "Workers"):
+            obj.addProperty("App::PropertyInteger", "Workers", "Solver",
+                            "Worker processes solving nonlinear load combinations in parallel, 0 uses one per CPU").Workers = 1
+        if not hasattr(obj, "ResultPoints"):
+            obj.addProperty("App::PropertyInteger", "ResultPoints", "Solver",
+                            "Sampling points for the member diagrams of the whole model, 0 picks a budget from the number of members").ResultPoints = 0
+
     def _create_result_groups(self, obj):
         solver_group = make_solver()
         if not App.ActiveDocument.getObject("NodesResult"):
@@ -68,7 +87,12 @@ class Solver():
         # self._clear_result_objects(obj)  # REMOVE THIS LINE
 
         if obj.SolverEngine == "PyNite":
-            self.solver_engine = PyNiteSolverEngine(App.ActiveDocument)
+            self.solver_engine = PyNiteSolverEngine(App.ActiveDocument,
+                                                    getattr(obj, "SolverPath", "Automatic"),
+                                                    getattr(obj, "MatrixStorage", "Automatic"),
+                                                    getattr(obj, "NodeOrdering", "RCM"),
+                                                    getattr(obj, "Workers", 1),
+                                                    getattr(obj, "ResultPoints", 0))
         else:
             App.Console.PrintError(f"Solver {obj.SolverEngine} not implemented.\n")
             return
@@ -414,6 +438,7 @@ class Solver():
         """
         self.Object = obj
         obj.Proxy = self
+        self._add_solver_options(obj)
         self.flagInit = False  # allow change
 
 class SolverViewProvider:
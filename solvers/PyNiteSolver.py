@@ -1,10 +1,69 @@
 import FreeCAD as App
 from features.SolverEngine import BaseSolverEngine, FEMResult
 from Pynite.FEModel3D import FEModel3D
+from Pynite import MemberDiagrams
 import numpy as np
+import scipy as sp
+import time
+import os
+import sys
 from FreeCAD import Units
 
-N_POINTS = 5  # number of sampling points  - To be added to solver option later
+N_POINTS = 5  # number of evenly spaced sampling points per member
+# Default budget of extra sampling points per member, placed where the member diagrams curve the most
+REFINE_POINTS = 10
+
+# Solver path options (exposed on the Solver object)
+SOLVER_PATHS = ["Automatic", "Superposition", "Linear", "Nonlinear"]
+MATRIX_STORAGES = ["Automatic", "Dense", "Sparse", "Banded"]
+# Node numbering used by PyNite to reduce stiffness matrix bandwidth/fill-in
+NODE_ORDERINGS = ["RCM", "AMD", "Natural"]
+
+# Sparse storage is only chosen when the estimated stiffness matrix density is below this value
+SPARSE_DENSITY_LIMIT = 0.05
+# Bounds for the calibrated dense/sparse crossover (in DOFs)
+SPARSE_MIN_DOFS = 60
+SPARSE_MAX_DOFS = 3000
+# Size of the timing probe matrix (in DOFs)
+PROBE_DOFS = 240
+
+_sparse_threshold = None  # Calibrated once per session by _calibrate_sparse_threshold()
+
+
+def _calibrate_sparse_threshold():
+    """
+    Time a dense and a sparse factorization of a small frame-like stiffness matrix and
+    estimate the DOF count above which the sparse solver is faster on this machine.
+    Dense factorization scales with n^3 and sparse factorization of a low-bandwidth
+    matrix roughly with n, so the crossover is where both estimates meet.
+    """
+    global _sparse_threshold
+    if _sparse_threshold is not None:
+        return _sparse_threshold
+
+    # Block tridiagonal SPD matrix: a chain of nodes with 6x6 blocks, like a continuous beam
+    n = PROBE_DOFS
+    band = sp.sparse.diags([-1.0, -1.0, 4.0, -1.0, -1.0], [-6, -1, 0, 1, 6], shape=(n, n), format='csc')
+    dense = band.toarray()
+
+    def best_time(func):
+        times = []
+        for _ in range(3):
+            t0 = time.perf_counter()
+            func()
+            times.append(time.perf_counter() - t0)
+        return max(min(times), 1e-7)
+
+    t_dense = best_time(lambda: sp.linalg.lu_factor(dense, check_finite=False))
+    t_sparse = best_time(lambda: sp.sparse.linalg.splu(band))
+
+    # t_dense = c_d*n^3 and t_sparse = c_s*n  ->  crossover at n* = sqrt(c_s/c_d)
+    c_d = t_dense / n**3
+    c_s = t_sparse / n
+    threshold = int(np.sqrt(c_s / c_d))
+    _sparse_threshold = min(max(threshold, SPARSE_MIN_DOFS), SPARSE_MAX_DOFS)
+    return _sparse_threshold
+
 
 # --- LOCAL IMPORT OF PRETTYTABLE (Re-imported here for the solver) ---
 try:
@@ -36,15 +95,24 @@ PRINT_MODEL = True
 class PyNiteSolverEngine(BaseSolverEngine):
     """Concrete implementation for the PyNite FEA solver."""
 
-    def __init__(self, document):
+    def __init__(self, document, solver_path="Automatic", matrix_storage="Automatic", node_ordering="RCM", workers=1,
+                 result_points=0):
         super().__init__(document)
         self.pynite_model = None
+        self.solver_path = solver_path        # One of SOLVER_PATHS
+        self.matrix_storage = matrix_storage  # One of MATRIX_STORAGES
+        self.node_ordering = node_ordering    # One of NODE_ORDERINGS
+        self.workers = workers                # Worker processes for nonlinear combinations, 0 for one per CPU
+        self.result_points = result_points    # Sampling point budget for the member diagrams of the whole model, 0 for automatic
+        self._sample_points = None            # Sampling points shared by every load case/combo, see _plan_member_sampling()
+        self._segment_tables = {}             # Member diagram segment tables by load case/combo name, built while planning the sampling
 
     def build_model(self):
         """Build the PyNite model by converting FreeCAD objects to PyNite entities."""
         App.Console.PrintMessage("Building PyNite Model...\n")
 
         self.pynite_model = FEModel3D()  # Reset model
+        self.pynite_model.node_ordering = self.node_ordering
         self._add_nodes()
         self._add_sections()
         self._add_beams()
@@ -293,34 +361,12 @@ class PyNiteSolverEngine(BaseSolverEngine):
             max_rxn_f = 0.0
             max_rxn_m = 0.0
 
-            for node in self.pynite_model.nodes.values():
-                # Retrieve raw PyNite results and ensure they are floats before numpy operations
-                dx = float(node.DX.get(load_name, 0))
-                dy = float(node.DY.get(load_name, 0))
-                dz = float(node.DZ.get(load_name, 0))
-
-                rxn_fx = float(node.RxnFX.get(load_name, 0))
-                rxn_fy = float(node.RxnFY.get(load_name, 0))
-                rxn_fz = float(node.RxnFZ.get(load_name, 0))
-
-                rxn_mx = float(node.RxnMX.get(load_name, 0))
-                rxn_my = float(node.RxnMY.get(load_name, 0))
-                rxn_mz = float(node.RxnMZ.get(load_name, 0))
-
-                # Displacement magnitude (all are already in PyNite's SI unit: m)
-                # NOTE: Explicit float casting prevents Base.Quantity issue with numpy
-                disp_mag = np.sqrt(dx ** 2 + dy ** 2 + dz ** 2)
-                max_disp = max(max_disp, disp_mag)
-
-                # Reaction Force magnitude (all are already in PyNite's SI unit: N)
-                # NOTE: Explicit float casting prevents Base.Quantity issue with numpy
-                rxn_f_mag = np.sqrt(rxn_fx ** 2 + rxn_fy ** 2 + rxn_fz ** 2)
-                max_rxn_f = max(max_rxn_f, rxn_f_mag)
-
-                # Reaction Moment magnitude (all are already in PyNite's SI unit: N*m)
-                # NOTE: Explicit float casting prevents Base.Quantity issue with numpy
-                rxn_m_mag = np.sqrt(rxn_mx ** 2 + rxn_my ** 2 + rxn_mz ** 2)
-                max_rxn_m = max(max_rxn_m, rxn_m_mag)
+            # Whole-model displacement and reaction arrays, one row per node (all in PyNite's SI units: m, N, N*m)
+            disp, rxn = self._node_result_arrays(load_name)
+            if len(disp):
+                max_disp = float(np.sqrt((disp[:, :3] ** 2).sum(axis=1)).max())
+                max_rxn_f = float(np.sqrt((rxn[:, :3] ** 2).sum(axis=1)).max())
+                max_rxn_m = float(np.sqrt((rxn[:, 3:] ** 2).sum(axis=1)).max())
 
             results_table.add_row([
                 load_name,
@@ -338,12 +384,120 @@ class PyNiteSolverEngine(BaseSolverEngine):
         """Run the analysis."""
         if analysis_type == "Linear Static":
             App.Console.PrintMessage("Running PyNite Linear Static Analysis...\n")
-            self.pynite_model.analyze(sparse=False)
+            path, sparse = self._select_solver_path()
+            # Banded Cholesky is only offered by the linear and nonlinear paths, it falls back to sparse LU if needed
+            solver = "banded" if self.matrix_storage == "Banded" else None
+            if path == "Nonlinear":
+                # Tension/compression-only elements need the iterative solver, combinations can be shared among worker processes
+                self.pynite_model.analyze(sparse=sparse, solver=solver, workers=self._select_workers())
+            elif path == "Linear":
+                # Stiffness factorized once, each combination solved directly
+                self.pynite_model.analyze_linear(sparse=sparse, solver=solver)
+            else:
+                # Stiffness factorized once, each load case solved once and combined
+                self.pynite_model.analyze_superposition(sparse=sparse)
             if PRINT_MODEL:
                 self.check_model()
         else:
             App.Console.PrintWarning(f"PyNiteSolver does not currently support {analysis_type}\n")
 
+    def _select_solver_path(self):
+        """
+        Choose the cheapest valid analysis path and matrix storage for the PyNite model.
+        The Solver object's SolverPath and MatrixStorage properties override the choice.
+        Returns (path, sparse) with path one of "Superposition", "Linear" or "Nonlinear".
+        """
+        model = self.pynite_model
+        has_tc = self._has_tc_behaviour()
+        n_combos = max(len(model.load_combos), 1)
+        n_cases = len(model.load_cases)
+
+        # Analysis path: superposition pays off once there are more combinations than cases
+        if self.solver_path == "Automatic":
+            if has_tc:
+                path, reason = "Nonlinear", "tension/compression-only elements"
+            elif n_cases < n_combos:
+                path, reason = "Superposition", f"{n_cases} load cases < {n_combos} combinations"
+            else:
+                path, reason = "Linear", f"{n_combos} combinations <= {n_cases} load cases"
+        else:
+            path, reason = self.solver_path, "Solver property"
+            if has_tc and path != "Nonlinear":
+                App.Console.PrintWarning(f"Solver path '{path}' ignores tension/compression-only behaviour.\n")
+
+        # Matrix storage: sparse for large, sparsely connected models
+        n_dofs = 6 * len(model.nodes)
+        density = self._estimate_density()
+        if self.matrix_storage == "Automatic":
+            threshold = _calibrate_sparse_threshold()
+            sparse = n_dofs >= threshold and density <= SPARSE_DENSITY_LIMIT
+            storage_reason = f"crossover {threshold} DOFs, density {density:.3f}"
+        else:
+            sparse = self.matrix_storage in ("Sparse", "Banded")
+            storage_reason = "Solver property"
+        storage = "sparse" if sparse else "dense"
+        if self.matrix_storage == "Banded":
+            if path == "Superposition":
+                App.Console.PrintWarning("Banded storage is not available for the Superposition path, using sparse.\n")
+            else:
+                storage = "banded"
+
+        App.Console.PrintMessage(
+            f"PyNite solver path: {path} ({reason}), "
+            f"{storage} storage ({n_dofs} DOFs, {storage_reason})\n")
+        return path, sparse
+
+    def _select_workers(self):
+        """Number of worker processes for the nonlinear path, from the Solver object's Workers property."""
+        workers = int(self.workers or 0)
+        if workers <= 0:
+            workers = os.cpu_count() or 1
+        if workers > 1 and not sys.platform.startswith("linux"):
+            # Spawned workers would start a new FreeCAD instance rather than a plain Python interpreter, and forking
+            # is only safe on Linux (macOS system frameworks are not fork-safe)
+            App.Console.PrintWarning("Parallel load combinations need forked worker processes (Linux only), solving sequentially.\n")
+            return 1
+        combos = max(len(self.pynite_model.load_combos), 1)
+        if workers > 1:
+            App.Console.PrintMessage(f"PyNite nonlinear path: {min(workers, combos)} worker processes for {combos} combinations\n")
+        return workers
+
+    def _estimate_density(self):
+        """Estimate the fraction of non-zero terms in the global stiffness matrix from the model connectivity."""
+        model = self.pynite_model
+        n_nodes = len(model.nodes)
+        if n_nodes == 0:
+            return 1.0
+
+        # Each connected node pair fills two 6x6 off-diagonal blocks, each node one diagonal block
+        pairs = set()
+        for element in list(model.members.values()) + list(model.springs.values()):
+            pairs.add(frozenset((element.i_node.name, element.j_node.name)))
+        for element in list(model.plates.values()) + list(model.quads.values()):
+            names = [element.i_node.name, element.j_node.name, element.m_node.name, element.n_node.name]
+            for a in range(4):
+                for b in range(a + 1, 4):
+                    pairs.add(frozenset((names[a], names[b])))
+
+        nnz = 36 * (n_nodes + 2 * len(pairs))
+        return min(nnz / (6 * n_nodes) ** 2, 1.0)
+
+    def _has_tc_behaviour(self):
+        """Return True if any member or spring in the PyNite model is tension or compression only."""
+        model = self.pynite_model
+        for member in model.members.values():
+            if member.tension_only or member.comp_only:
+                return True
+        for spring in model.springs.values():
+            if spring.tension_only or spring.comp_only:
+                return True
+        for node in model.nodes.values():
+            for spring in (node.spring_DX, node.spring_DY, node.spring_DZ,
+                           node.spring_RX, node.spring_RY, node.spring_RZ):
+                if spring[1] is not None:
+                    return True
+        return False
+
     def extract_results(self, analysis_type="Linear Static") -> FEMResult:
         """Extract results from PyNite and store them in a standardized FEMResult object."""
         App.Console.PrintMessage("Extracting PyNite Results...\n")
@@ -551,6 +705,9 @@ class PyNiteSolverEngine(BaseSolverEngine):
 
         all_load_names = list(set(combo_names + case_names))
 
+        # Sample every load case/combo at the same points, so their results can be enveloped point by point
+        self._sample_points, self._segment_tables = self._plan_member_sampling(all_load_names)
+
         for load_name in all_load_names:
             results.load_cases[load_name] = {
                 'nodes': self._get_node_results(load_name),
@@ -558,89 +715,147 @@ class PyNiteSolverEngine(BaseSolverEngine):
             }
         return results
 
+    def _node_result_arrays(self, load_name):
+        """
+        Displacements and reactions of every node for a load case/combo, read in bulk from PyNite's
+        result matrices. Returns two (n_nodes, 6) arrays in model node order, missing results are zero.
+        """
+        model = self.pynite_model
+        nodes = list(model.nodes.values())
+        if not nodes or any(n.ID is None for n in nodes):
+            return np.zeros((0, 6)), np.zeros((0, 6))
+        rows = np.array([n.ID for n in nodes])
+        arrays = []
+        for results in (model.node_displacements, model.node_reactions):
+            try:
+                arrays.append(np.nan_to_num(results(load_name).reshape(-1, 6)[rows]))
+            except KeyError:
+                arrays.append(np.zeros((len(nodes), 6)))
+        return arrays
+
     def _get_node_results(self, load_name):
         """Get node results for a specific load case/combo."""
+        disp, rxn = self._node_result_arrays(load_name)
         nr = {}
-        for n in self.pynite_model.nodes.values():
+        for n, d, r in zip(self.pynite_model.nodes.values(), disp.tolist(), rxn.tolist()):
             nr[n.name] = {
-                'DX': Units.Quantity(float(n.DX.get(load_name, 0)), 'm'),
-                'DY': Units.Quantity(float(n.DY.get(load_name, 0)), 'm'),
-                'DZ': Units.Quantity(float(n.DZ.get(load_name, 0)), 'm'),
-                'RX': Units.Quantity(float(n.RX.get(load_name, 0)), 'rad'),
-                'RY': Units.Quantity(float(n.RY.get(load_name, 0)), 'rad'),
-                'RZ': Units.Quantity(float(n.RZ.get(load_name, 0)), 'rad'),
-                'RXN_FX': Units.Quantity(float(n.RxnFX.get(load_name, 0)), 'N'),
-                'RXN_FY': Units.Quantity(float(n.RxnFY.get(load_name, 0)), 'N'),
-                'RXN_FZ': Units.Quantity(float(n.RxnFZ.get(load_name, 0)), 'N'),
-                'RXN_MX': Units.Quantity(float(n.RxnMX.get(load_name, 0)), 'N*m'),
-                'RXN_MY': Units.Quantity(float(n.RxnMY.get(load_name, 0)), 'N*m'),
-                'RXN_MZ': Units.Quantity(float(n.RxnMZ.get(load_name, 0)), 'N*m'),
+                'DX': Units.Quantity(d[0], 'm'),
+                'DY': Units.Quantity(d[1], 'm'),
+                'DZ': Units.Quantity(d[2], 'm'),
+                'RX': Units.Quantity(d[3], 'rad'),
+                'RY': Units.Quantity(d[4], 'rad'),
+                'RZ': Units.Quantity(d[5], 'rad'),
+                'RXN_FX': Units.Quantity(r[0], 'N'),
+                'RXN_FY': Units.Quantity(r[1], 'N'),
+                'RXN_FZ': Units.Quantity(r[2], 'N'),
+                'RXN_MX': Units.Quantity(r[3], 'N*m'),
+                'RXN_MY': Units.Quantity(r[4], 'N*m'),
+                'RXN_MZ': Units.Quantity(r[5], 'N*m'),
             }
         return nr
 
-    def _get_torque_array(self, member, positions, load_name):
+    def _plan_member_sampling(self, load_names):
         """
-        Manually generate torque array by sampling at positions.
-        Workaround for member.torque_array() potentially returning None.
+        Choose the sampling points of every member: N_POINTS evenly spaced points, both sides of every
+        load discontinuity, and extra points where the diagrams curve, within the model's point budget.
+        Returns the (member_index, positions, left) arrays, see MemberDiagrams.adaptive_sample_points(),
+        and the segment tables it was planned from as a dict keyed by load combo name, so the results
+        don't have to rebuild them.
         """
-        values = []
-        for x in positions:
-            try:
-                # member.torque() returns a float
-                val = member.torque(x, load_name)
-                # Handle numpy scalar if returned
-                if hasattr(val, 'item'): val = val.item()
-            except Exception:
-                val = 0.0
-            values.append(val)
-        return np.array(values)
+        model = self.pynite_model
+        members = list(model.members.values())
+        lengths = np.array([member.L() for member in members])
+        tables = {name: MemberDiagrams.SegmentTable(members, name) for name in load_names if name in model.load_combos}
+
+        budget = int(self.result_points or 0)
+        if budget <= 0:
+            budget = len(members) * (N_POINTS + REFINE_POINTS)
+
+        start = time.perf_counter()
+        plan = MemberDiagrams.adaptive_sample_points(list(tables.values()), lengths, N_POINTS, budget,
+                                                     P_delta=model.solution in ('P-Delta', 'Pushover'))
+        App.Console.PrintMessage(f"Member diagrams: {len(plan[1])} sampling points for {len(members)} members "
+                                 f"(budget {budget}) in {time.perf_counter() - start:.3f} s\n")
+        return plan, tables
 
     def _get_member_results(self, load_name):
         """Get member results for a specific load case/combo using Units.Quantity."""
         mr = {}
-        n_points = N_POINTS
-
-        for member in self.pynite_model.members.values():
-
-            # Position array (shared)
-            axial_data = member.axial_array(n_points, load_name)
-            pos_arr = axial_data[0]
-
-            # Generate Torque manually - workaround as torque_array in pynite has an error
-            torq_values = self._get_torque_array(member, pos_arr, load_name)
-
-            raw_data = {
-                'axial': (axial_data, 'N'),
-                'shear_y': (member.shear_array('Fy', n_points, load_name), 'N'),
-                'shear_z': (member.shear_array('Fz', n_points, load_name), 'N'),
-                'moment_y': (member.moment_array('My', n_points, load_name), 'N*m'),
-                'moment_z': (member.moment_array('Mz', n_points, load_name), 'N*m'),
-                'moment_x': ((pos_arr, torq_values), 'N*m'), # Torsion using manual array
-                'deflection_y': (member.deflection_array('dy', n_points, load_name), 'm'),
-                'deflection_z': (member.deflection_array('dz', n_points, load_name), 'm'),
-                # Placeholder for CodeCheck to fill later
-                'unity_check': ((pos_arr, np.zeros(n_points)), '')
-            }
+
+        members = list(self.pynite_model.members.values())
+        if not members:
+            return mr
+
+        if self._sample_points is None:
+            self._sample_points, self._segment_tables = self._plan_member_sampling([load_name])
+        member_index, positions, left = self._sample_points
+
+        # Evaluate every quantity for every member and sample point at once from the packed segment coefficients, reusing the table built while planning the sampling when there is one
+        table = self._segment_tables.get(load_name)
+        if table is None:
+            table = MemberDiagrams.SegmentTable(members, load_name)
+        P_delta = self.pynite_model.solution in ('P-Delta', 'Pushover')
+        values = table.evaluate(member_index, positions, P_delta=P_delta, side=left)
+        values = {key: np.nan_to_num(val) for key, val in values.items()}
+        values['unity_check'] = np.zeros(len(positions))  # Placeholder for CodeCheck to fill later
+
+        # The points of each member are stored consecutively
+        bounds = np.searchsorted(member_index, np.arange(len(members) + 1))
+
+        quantities = {
+            'axial': ('axial', 'N'),
+            'shear_y': ('Fy', 'N'),
+            'shear_z': ('Fz', 'N'),
+            'moment_y': ('My', 'N*m'),
+            'moment_z': ('Mz', 'N*m'),
+            'moment_x': ('torque', 'N*m'),  # Torsion
+            'deflection_y': ('dy', 'm'),
+            'deflection_z': ('dz', 'm'),
+            'unity_check': ('unity_check', ''),
+        }
+        # Exact extrema of each diagram, found from the segment polynomials rather than the sample points, so peaks between points (e.g. under point loads) aren't missed
+        extrema = table.extrema([name for name, _ in quantities.values() if name != 'unity_check'], P_delta=P_delta)
+        extrema = {name: {k: np.nan_to_num(v) for k, v in ext.items()} for name, ext in extrema.items()}
+        extrema['unity_check'] = {k: np.zeros(len(members)) for k in ('max', 'x_max', 'min', 'x_min')}
+
+        # Critical points: wherever an internal force reaches its extremum. Every quantity is evaluated there, on both sides of any discontinuity, so design checks can combine concurrent forces at the governing locations.
+        points = np.column_stack([extrema[name][k] for name in ('axial', 'Fy', 'Fz', 'My', 'Mz', 'torque') for k in ('x_max', 'x_min')])
+        point_index = np.repeat(np.arange(len(members)), points.shape[1])
+        sides = [table.evaluate(point_index, points.reshape(-1), P_delta=P_delta, side=side) for side in ('left', 'right')]
+        critical_positions = np.hstack((points, points))
+        critical_values = {key: np.nan_to_num(np.hstack([side[key].reshape(len(members), -1) for side in sides])) for key in sides[0]}
+        critical_values['unity_check'] = np.zeros((len(members), critical_positions.shape[1]))
+
+        for i, member in enumerate(members):
+
+            pos_arr = positions[bounds[i]:bounds[i + 1]]
+            pos_m = pos_arr.tolist()
 
             structured_results = {}
-            for key, (arr, unit_str) in raw_data.items():
-                # arr[0] = positions, arr[1] = values (numpy array)
+            for key, (name, unit_str) in quantities.items():
+                # arr = values at pos_arr (numpy array)
+                arr = values[name][bounds[i]:bounds[i + 1]]
 
                 # 1. Standard Quantities (for UI/Graphs)
                 # Convert to Python list of Quantities - SLOW but needed for UI
-                val_quantities = [Units.Quantity(float(v), unit_str) for v in arr[1]]
-                pos_m = [float(p) for p in arr[0]]
+                val_quantities = [Units.Quantity(v, unit_str) for v in arr.tolist()]
 
                 structured_results[key] = {
                     'values': [pos_m, val_quantities],
 
                     # 2. RAW DATA (for CodeCheck Speed)
                     # Store numpy arrays directly to bypass Quantity overhead later
-                    'raw_values': arr[1],
-                    'raw_positions': arr[0],
+                    'raw_values': arr,
+                    'raw_positions': pos_arr,
+
+                    # 3. EXACT EXTREMA and the values at the critical points (for CodeCheck accuracy)
+                    'raw_critical_values': critical_values[name][i],
+                    'raw_critical_positions': critical_positions[i],
 
-                    'min': Units.Quantity(float(np.min(arr[1])), unit_str),
-                    'max': Units.Quantity(float(np.max(arr[1])), unit_str)
+                    'min': Units.Quantity(float(extrema[name]['min'][i]), unit_str),
+                    'max': Units.Quantity(float(extrema[name]['max'][i]), unit_str),
+                    'min_position': float(extrema[name]['x_min'][i]),
+                    'max_position': float(extrema[name]['x_max'][i])
                 }
             mr[member.name] = structured_results
         return mr
\ No newline at end of file
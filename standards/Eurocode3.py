@@ -181,14 +181,23 @@ class Eurocode3Standard(BaseStandard):
                 return np.zeros(1)
             return np.array(val)
 
+        # The forces at the exact extrema of each internal force (if the solver provides them) are checked after the sample points,
+        # so the governing unity check isn't missed when it lies between two sample points
+        KEYS = ('x', 'P', 'My', 'Mz', 'Vy', 'Vz', 'Tx')
+        data = {k: to_arr(k) for k in KEYS}
+        n_samples = len(data['x'])
+        critical = self.forces.get('critical') or {}
+        if len(critical.get('x', [])):
+            data = {k: np.concatenate((data[k], np.asarray(critical[k], dtype=float))) for k in KEYS}
+
         # Extract forces arrays (PyNite inputs usually: Tension (+), Compression (-))
-        Ned = to_arr('P')
-        My = np.abs(to_arr('My'))
-        Mz = np.abs(to_arr('Mz'))
-        Vy = np.abs(to_arr('Vy'))
-        Vz = np.abs(to_arr('Vz'))
-        Tx = np.abs(to_arr('Tx'))
-        Pos = to_arr('x')
+        Ned = data['P']
+        My = np.abs(data['My'])
+        Mz = np.abs(data['Mz'])
+        Vy = np.abs(data['Vy'])
+        Vz = np.abs(data['Vz'])
+        Tx = np.abs(data['Tx'])
+        Pos = data['x']
 
         # Identify Compression
         # EC3 uses Compression as positive N_Ed for stability checks usually
@@ -287,7 +296,7 @@ class Eurocode3Standard(BaseStandard):
         log_str = self._generate_log(section_class, Lcr_y, Lcr_z, crit_data, max_val)
 
         return {
-            'values': TOTAL_UC.tolist(),
+            'values': TOTAL_UC[:n_samples].tolist(),
             'max_uc': max_val,
             'detailed_log': log_str
         }
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Pynite is vendored at the top of the repository rather than installed
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,55 @@
+"""
+Small models shared by the tests.
+"""
+
+from Pynite import FEModel3D
+
+
+def braced_frame() -> FEModel3D:
+    """Returns a two storey, two bay steel frame with tension-only X-braces in the first bay and a compression-only support spring under the right hand column. The wind load combinations switch the braces and lift the right hand column off its spring, so the tension/compression-only iteration has work to do.
+
+    :return: The model, with load cases 'D' and 'W' and four load combinations.
+    :rtype: FEModel3D
+    """
+
+    model = FEModel3D()
+    model.add_material('Steel', 200e9, 77e9, 0.3, 7850)
+    model.add_section('Column', 0.01, 2e-5, 1e-4, 1e-5)
+    model.add_section('Brace', 0.001, 1e-7, 1e-7, 1e-8)
+
+    # Column lines at X = 0, 6 and 12 m, floors at Y = 0, 3.5 and 7 m
+    for i in range(3):
+        for j in range(3):
+            model.add_node(f'N{i}{j}', 6.0*i, 3.5*j, 0.0)
+
+    for i in range(3):
+        for j in range(2):
+            model.add_member(f'C{i}{j}', f'N{i}{j}', f'N{i}{j + 1}', 'Steel', 'Column')
+    for i in range(2):
+        for j in range(1, 3):
+            model.add_member(f'B{i}{j}', f'N{i}{j}', f'N{i + 1}{j}', 'Steel', 'Column')
+
+    # Tension-only X-braces in the left hand bay
+    for j in range(2):
+        model.add_member(f'X{j}a', f'N0{j}', f'N1{j + 1}', 'Steel', 'Brace', tension_only=True)
+        model.add_member(f'X{j}b', f'N1{j}', f'N0{j + 1}', 'Steel', 'Brace', tension_only=True)
+
+    # Fixed bases, except the right hand column which bears on a compression-only spring
+    model.def_support('N00', True, True, True, True, True, True)
+    model.def_support('N10', True, True, True, True, True, True)
+    model.def_support('N20', True, False, True, True, True, True)
+    model.def_support_spring('N20', 'DY', 1e8, '-')
+
+    # Gravity on every floor node, and wind from the left
+    for i in range(3):
+        for j in range(1, 3):
+            model.add_node_load(f'N{i}{j}', 'FY', -20e3, 'D')
+    model.add_node_load('N01', 'FX', 40e3, 'W')
+    model.add_node_load('N02', 'FX', 80e3, 'W')
+
+    model.add_load_combo('1.4D', {'D': 1.4})
+    model.add_load_combo('D+W', {'D': 0.9, 'W': 1.5})
+    model.add_load_combo('D-W', {'D': 0.9, 'W': -1.5})
+    model.add_load_combo('-W', {'W': -1.0})
+
+    return model
@@ -0,0 +1,50 @@
+"""
+The load case vectors are cached between analyses. Changing the loads, through the model's methods or by editing an element's load list directly, must be seen by the next analysis.
+"""
+
+import pytest
+
+from frames import braced_frame
+
+
+def add_point_load(model):
+    model.add_member_pt_load('B12', 'Fy', -30e3, 3.0, 'D')
+
+
+def edit_node_load(model):
+    model.nodes['N02'].NodeLoads[0] = ('FX', 120e3, 'W')
+
+
+def append_dist_load(model):
+    model.members['B01'].DistLoads.append(('Fy', -5e3, -5e3, 0.0, 6.0, 'D', False))
+
+
+def remove_node_loads(model):
+    model.nodes['N01'].NodeLoads.clear()
+
+
+@pytest.mark.parametrize('edit', [add_point_load, edit_node_load, append_dist_load, remove_node_loads])
+@pytest.mark.parametrize('method', ['analyze_linear', 'analyze'])
+def test_changed_loads_change_next_result(edit, method):
+
+    model = braced_frame()
+    model.add_member_dist_load('B01', 'Fy', -10e3, -10e3, case='D')
+    getattr(model, method)(check_statics=False)
+    before = {name: (node.DX['D+W'], node.DY['D+W'], node.RxnFY['D+W']) for name, node in model.nodes.items()}
+
+    edit(model)
+    getattr(model, method)(check_statics=False)
+
+    # Compare against a fresh model that never had the stale loads cached
+    reference = braced_frame()
+    reference.add_member_dist_load('B01', 'Fy', -10e3, -10e3, case='D')
+    edit(reference)
+    getattr(reference, method)(check_statics=False)
+
+    changed = False
+    for name, node in model.nodes.items():
+        result = (node.DX['D+W'], node.DY['D+W'], node.RxnFY['D+W'])
+        ref = reference.nodes[name]
+        assert result == pytest.approx((ref.DX['D+W'], ref.DY['D+W'], ref.RxnFY['D+W']), rel=1e-9, abs=1e-9)
+        changed |= result != pytest.approx(before[name], rel=1e-6, abs=1e-9)
+    assert changed
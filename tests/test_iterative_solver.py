@@ -0,0 +1,92 @@
+"""
+The preconditioned conjugate gradient solver (`Factorization.IterativeStiffnessSolver`), and its use in linear and P-Delta analysis.
+"""
+
+import numpy as np
+import pytest
+
+from Pynite import Analysis
+from Pynite.Factorization import IterativeStiffnessSolver, ConvergenceError
+from frames import braced_frame
+
+DOFS = ('DX', 'DY', 'DZ', 'RX', 'RY', 'RZ')
+
+
+def displacements(model):
+    """Returns every node displacement, keyed by (node name, degree of freedom, load combination)."""
+    return {(node.name, dof, combo): getattr(node, dof)[combo] for node in model.nodes.values() for dof in DOFS for combo in model.load_combos}
+
+
+@pytest.mark.parametrize('preconditioner', ['jacobi', 'block_jacobi', 'ilu'])
+def test_linear_pcg_matches_direct_solve(preconditioner):
+
+    direct = braced_frame()
+    direct.analyze_linear()
+
+    iterative = braced_frame()
+    iterative.analyze_linear(solver='pcg', preconditioner=preconditioner, tolerance=1e-12)
+
+    expected = displacements(direct)
+    for key, value in displacements(iterative).items():
+        assert value == pytest.approx(expected[key], rel=1e-8, abs=1e-12), key
+
+    # Every load combination records one solve
+    assert list(iterative.solver_stats) == list(iterative.load_combos)
+    for stats in iterative.solver_stats.values():
+        assert len(stats) == 1
+        assert stats[0]['iterations'] > 0
+        assert stats[0]['residual'] <= 1e-12
+
+
+def test_pdelta_pcg_records_stats():
+
+    model = braced_frame()
+    model.analyze_PDelta(solver='pcg', tolerance=1e-12)
+
+    # Each tension/compression-only iteration records the initial stiffness solve and the combined stiffness solve
+    for combo, stats in model.solver_stats.items():
+        assert len(stats) >= 2 and len(stats) % 2 == 0, combo
+        assert all(entry['residual'] <= 1e-12 for entry in stats)
+
+
+def test_non_convergence_raises():
+
+    model = braced_frame()
+    model.analyze_linear()
+    D1_indices, D2_indices, D2 = Analysis._partition_D(model)
+    K11, K12, K21, K22 = Analysis._partition(model, model.K('1.4D'), D1_indices, D2_indices)
+    P1, P2 = Analysis._partition(model, model.P('1.4D'), D1_indices, D2_indices)
+
+    solver = IterativeStiffnessSolver(K11, D1_indices, tolerance=1e-12, max_iter=1)
+    with pytest.raises(ConvergenceError):
+        solver.solve(P1)
+
+
+def test_pdelta_pcg_non_convergence_raises(monkeypatch):
+
+    class FailingSolver(IterativeStiffnessSolver):
+        def __init__(self, *args, **kwargs):
+            kwargs['max_iter'] = 1
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(Analysis, 'IterativeStiffnessSolver', FailingSolver)
+
+    model = braced_frame()
+    with pytest.raises(ConvergenceError):
+        model.analyze_PDelta(solver='pcg', tolerance=1e-12)
+
+
+def test_pdelta_falls_back_to_factorization(monkeypatch, capsys):
+
+    reference = braced_frame()
+    reference.analyze_PDelta()
+
+    # With no conjugate gradient iterations allowed, every combined stiffness matrix has to be factorized
+    monkeypatch.setattr(Analysis, '_PDELTA_REUSE_ITERATIONS', 0)
+    model = braced_frame()
+    model.analyze_PDelta(log=True)
+    assert '- Factorizing the combined stiffness matrix' in capsys.readouterr().out
+
+    expected = displacements(reference)
+    for key, value in displacements(model).items():
+        assert value == pytest.approx(expected[key], rel=1e-8, abs=1e-12), key
@@ -0,0 +1,57 @@
+"""
+Editing a node, section, material or member after an analysis must invalidate the members' cached matrices, so the next analysis sees the change.
+"""
+
+import pytest
+
+from frames import braced_frame
+
+
+def top_drift(model):
+    return model.nodes['N02'].DX['D+W']
+
+
+def move_node(model):
+    model.nodes['N12'].X = 5.0
+
+
+def soften_section(model):
+    model.sections['Column'].Iz /= 2
+
+
+def soften_material(model):
+    model.materials['Steel'].E /= 2
+
+
+def rotate_member(model):
+    model.members['C00'].rotation = 90.0
+
+
+@pytest.mark.parametrize('edit', [move_node, soften_section, soften_material, rotate_member])
+def test_edit_changes_next_result(edit):
+
+    model = braced_frame()
+    model.analyze_linear(check_statics=False)
+    before = top_drift(model)
+    version = model._version
+
+    edit(model)
+    assert model._version > version
+
+    model.analyze_linear(check_statics=False)
+    assert top_drift(model) != pytest.approx(before, rel=1e-6)
+
+    # A fresh model built with the same edit gives the same answer, so nothing stale was reused
+    reference = braced_frame()
+    edit(reference)
+    reference.analyze_linear(check_statics=False)
+    assert top_drift(model) == pytest.approx(top_drift(reference), rel=1e-10)
+
+
+def test_unwatched_attribute_keeps_version():
+
+    model = braced_frame()
+    version = model._version
+    model.materials['Steel'].rho = 8000
+    model.sections['Column'].name = 'Column'
+    assert model._version == version
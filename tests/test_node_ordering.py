@@ -0,0 +1,73 @@
+"""
+The node ordering only changes how the nodes are numbered internally. Results reported by node name must not depend on it.
+"""
+
+import numpy as np
+import pytest
+import scipy.sparse as sparse
+
+from Pynite import Analysis
+from frames import braced_frame
+from test_tension_compression import assert_same_results
+
+
+def analyzed(ordering, method='analyze'):
+    model = braced_frame()
+    model.node_ordering = ordering
+    getattr(model, method)(check_statics=False)
+    return model
+
+
+@pytest.mark.parametrize('method', ['analyze_linear', 'analyze'])
+@pytest.mark.parametrize('ordering', ['RCM', 'AMD'])
+def test_ordering_does_not_change_results(ordering, method):
+    assert_same_results(analyzed(ordering, method), analyzed('Natural', method))
+
+
+@pytest.mark.parametrize('ordering', ['Natural', 'RCM', 'AMD'])
+def test_permutation_round_trips(ordering):
+
+    model = analyzed(ordering)
+    nodes = list(model.nodes.values())
+    permutation = model._node_permutation
+
+    # The permutation visits every node exactly once
+    assert sorted(permutation.tolist()) == list(range(len(nodes)))
+
+    # Node IDs, the nodes listed by ID and the permutation all agree
+    for ID, node in enumerate(model._nodes_by_ID):
+        assert node.ID == ID
+        assert nodes[permutation[ID]] is node
+
+    # Each node's row of the result matrices holds that node's own results
+    D = model.node_displacements('D+W').reshape(-1, 6)
+    for node in nodes:
+        assert D[node.ID, 0] == node.DX['D+W']
+        assert D[node.ID, 1] == node.DY['D+W']
+
+
+def test_reordering_changes_numbering():
+    assert analyzed('RCM')._node_permutation.tolist() != analyzed('Natural')._node_permutation.tolist()
+
+
+def test_unknown_ordering_raises():
+    model = braced_frame()
+    model.node_ordering = 'METIS'
+    with pytest.raises(ValueError):
+        model.analyze_linear()
+
+
+def test_minimum_degree_eliminates_low_degree_nodes_first():
+
+    # A star: the hub is connected to everything, so it waits until only one leaf is left
+    n = 6
+    rows = [0]*(n - 1) + list(range(1, n))
+    cols = list(range(1, n)) + [0]*(n - 1)
+    star = sparse.csr_matrix((np.ones(len(rows)), (rows, cols)), shape=(n, n))
+    order = Analysis._minimum_degree(star)
+    assert sorted(order.tolist()) == list(range(n))
+    assert order.tolist().index(0) >= n - 2
+
+    # A path 0-1-2-3: an end node is eliminated first, which creates no fill
+    path = sparse.csr_matrix((np.ones(6), ([0, 1, 1, 2, 2, 3], [1, 0, 2, 1, 3, 2])), shape=(4, 4))
+    assert Analysis._minimum_degree(path)[0] in (0, 3)
@@ -0,0 +1,149 @@
+"""
+Nodal results are stored in one `ResultMatrix` per quantity, and the per-node dictionaries (`node.DX`, `node.RxnFY`...) are `NodeResult` views into it.
+"""
+
+import numpy as np
+import pytest
+
+from Pynite.NodeResults import ResultMatrix
+from frames import braced_frame
+
+
+@pytest.fixture
+def model():
+    model = braced_frame()
+    model.analyze(check_statics=False)
+    return model
+
+
+def test_view_reads_the_matrix(model):
+
+    D = model.node_displacements('D+W').reshape(-1, 6)
+    R = model.node_reactions('D+W').reshape(-1, 6)
+    for node in model.nodes.values():
+        assert [node.DX['D+W'], node.DY['D+W'], node.DZ['D+W'], node.RX['D+W'], node.RY['D+W'], node.RZ['D+W']] == D[node.ID].tolist()
+        assert [node.RxnFX['D+W'], node.RxnFY['D+W'], node.RxnFZ['D+W'], node.RxnMX['D+W'], node.RxnMY['D+W'], node.RxnMZ['D+W']] == R[node.ID].tolist()
+
+    # Every solved combination is listed, in the order it was added
+    assert list(model.nodes['N01'].DX) == list(model.load_combos)
+
+
+def test_view_writes_the_matrix(model):
+
+    node = model.nodes['N11']
+    other = model.nodes['N12'].DX['D+W']
+
+    node.DX['D+W'] = 1.25
+    assert model.node_displacements('D+W')[node.ID*6, 0] == 1.25
+    assert model.nodes['N12'].DX['D+W'] == other
+
+    # Deleting a result leaves a hole that reads as missing
+    del node.DY['D+W']
+    assert 'D+W' not in node.DY
+    assert np.isnan(model.node_displacements('D+W')[node.ID*6 + 1, 0])
+
+    # Assigning a dictionary replaces every result for the degree of freedom
+    node.RZ = {'1.4D': 0.5}
+    assert dict(node.RZ) == {'1.4D': 0.5}
+    assert 'D+W' in node.RX
+
+
+def test_missing_combo_raises_key_error(model):
+
+    node = model.nodes['N01']
+    with pytest.raises(KeyError):
+        node.DX['missing']
+    with pytest.raises(KeyError):
+        model.node_displacements('missing')
+    assert 'missing' not in node.DX
+    assert node.DX.get('missing') is None
+
+
+def test_pop_compacts_columns():
+
+    results = ResultMatrix()
+    for k, name in enumerate('abc'):
+        results[name] = np.full(6, float(k))
+    capacity = results.values.shape[1]
+
+    removed = results.pop('b')
+    assert removed.reshape(-1).tolist() == [1.0]*6
+    assert results.columns == {'a': 0, 'c': 1}
+    assert results['c'].reshape(-1).tolist() == [2.0]*6
+    assert np.isnan(results.values[:, 2]).all()
+    assert results.values.shape[1] == capacity
+
+    assert results.pop('b', 'default') == 'default'
+    with pytest.raises(KeyError):
+        results['b']
+
+
+def test_columns_and_rows_grow():
+
+    results = ResultMatrix()
+    for k in range(10):
+        results[f'combo {k}'] = np.full(6, float(k))
+    assert results.values.shape[1] >= 10
+    assert [results[f'combo {k}'][0, 0] for k in range(10)] == [float(k) for k in range(10)]
+
+    # A longer vector adds NaN rows to the existing columns
+    results['long'] = np.arange(12.0)
+    assert results.values.shape[0] == 12
+    assert results['long'].reshape(-1).tolist() == list(range(12))
+    assert np.isnan(results['combo 3'][6:]).all()
+    assert (results['combo 3'][:6] == 3.0).all()
+
+
+def test_combo_added_after_analysis(model):
+
+    before = model.node_displacements('D+W').copy()
+
+    model.add_load_combo('Extra', {'W': 2.0})
+    model.nodes['N02'].DX['Extra'] = 0.5
+    assert model.nodes['N02'].DX['Extra'] == 0.5
+    assert 'Extra' not in model.nodes['N01'].DX
+    assert np.array_equal(model.node_displacements('D+W'), before)
+
+    # Re-analysing solves the new combination like the others
+    model.analyze(check_statics=False)
+    assert list(model.nodes['N01'].DX) == list(model.load_combos)
+    assert model.nodes['N02'].DX['Extra'] != 0.5
+    assert model.nodes['N02'].DX['Extra'] == model.node_displacements('Extra')[model.nodes['N02'].ID*6, 0]
+
+
+def test_node_added_after_analysis(model):
+
+    model.add_node('N30', 18.0, 7.0, 0.0)
+    model.add_member('B22', 'N22', 'N30', 'Steel', 'Column')
+    model.add_node_load('N30', 'FY', -10e3, 'D')
+
+    # The new node has not been numbered yet, so it has no results
+    node = model.nodes['N30']
+    assert dict(node.DY) == {}
+    with pytest.raises(KeyError):
+        node.DY['1.4D']
+
+    model.analyze(check_statics=False)
+
+    reference = braced_frame()
+    reference.add_node('N30', 18.0, 7.0, 0.0)
+    reference.add_member('B22', 'N22', 'N30', 'Steel', 'Column')
+    reference.add_node_load('N30', 'FY', -10e3, 'D')
+    reference.analyze(check_statics=False)
+
+    for name, node in model.nodes.items():
+        assert node.DY['1.4D'] == pytest.approx(reference.nodes[name].DY['1.4D'], rel=1e-9, abs=1e-12)
+        assert node.DY['1.4D'] == model.node_displacements('1.4D')[node.ID*6 + 1, 0]
+
+
+def test_rows_follow_renumbering(model):
+
+    before = {name: (node.DX['D+W'], node.RxnFY['D+W']) for name, node in model.nodes.items()}
+    IDs = {name: node.ID for name, node in model.nodes.items()}
+
+    model.node_ordering = 'Natural'  # The model was numbered with the default RCM ordering
+    model.analyze(check_statics=False)
+
+    assert {name: node.ID for name, node in model.nodes.items()} != IDs
+    for name, node in model.nodes.items():
+        assert (node.DX['D+W'], node.RxnFY['D+W']) == pytest.approx(before[name], rel=1e-9, abs=1e-9)
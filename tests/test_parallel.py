@@ -0,0 +1,72 @@
+"""
+Solving load combinations in worker processes (`ParallelAnalysis`) gives the same results as solving them one at a time.
+"""
+
+import pytest
+
+from Pynite import Analysis
+from frames import braced_frame
+from test_tension_compression import assert_same_results
+
+
+def combo_order(model):
+    """Returns the load combinations in the order their results are stored."""
+    return list(model.nodes['N01'].DX.keys())
+
+
+@pytest.mark.parametrize('method', ['analyze', 'analyze_PDelta'])
+def test_workers_match_sequential(method):
+
+    sequential = braced_frame()
+    getattr(sequential, method)(workers=1)
+
+    parallel = braced_frame()
+    getattr(parallel, method)(workers=2)
+
+    assert combo_order(parallel) == combo_order(sequential) == list(sequential.load_combos)
+    assert_same_results(parallel, sequential)
+
+    # The node support springs are left in the final state of the last load combination
+    assert parallel.nodes['N20'].spring_DY == sequential.nodes['N20'].spring_DY
+
+
+@pytest.mark.parametrize('method', ['analyze', 'analyze_PDelta'])
+def test_combo_order_does_not_change_results(method):
+
+    # The '-W' load combination lifts the right hand column off its compression-only spring. Every load combination starts from the initial spring state, so solving it first doesn't change the others.
+    forward = braced_frame()
+    getattr(forward, method)()
+
+    reverse = braced_frame()
+    reverse.load_combos = dict(reversed(list(reverse.load_combos.items())))
+    getattr(reverse, method)()
+
+    for combo in forward.load_combos:
+        for node in forward.nodes.values():
+            for dof in ('DX', 'DY', 'DZ', 'RX', 'RY', 'RZ'):
+                assert getattr(reverse.nodes[node.name], dof)[combo] == pytest.approx(getattr(node, dof)[combo], rel=1e-8, abs=1e-12)
+        for name, member in forward.members.items():
+            assert reverse.members[name].active[combo] == member.active[combo]
+
+
+@pytest.mark.parametrize('method, driver', [('analyze', '_solve_load_steps'), ('analyze_PDelta', '_solve_PDelta')])
+def test_each_combo_starts_from_initial_spring_state(method, driver, monkeypatch):
+
+    model = braced_frame()
+
+    # Solve '-W' first, which leaves the compression-only spring switched off
+    model.load_combos = dict(reversed(list(model.load_combos.items())))
+
+    # Record the spring's state as each load combination starts
+    solve = getattr(Analysis, driver)
+    states = []
+
+    def recording_solve(combo, *args, **kwargs):
+        states.append((combo.combo_name, model.nodes['N20'].spring_DY[2]))
+        return solve(combo, *args, **kwargs)
+
+    monkeypatch.setattr(Analysis, driver, recording_solve)
+    getattr(model, method)()
+
+    assert states == [(combo, True) for combo in model.load_combos]
+    assert model.nodes['N20'].spring_DY[2] == (model.nodes['N20'].DY['1.4D'] <= 0)
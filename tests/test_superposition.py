@@ -0,0 +1,76 @@
+"""
+Linear analysis by superposition of load cases (`FEModel3D.analyze_superposition`).
+"""
+
+import pytest
+
+from Pynite import Analysis
+from Pynite.Factorization import StiffnessFactorization
+from Pynite.Member3D import Member3D
+from frames import braced_frame
+
+DOFS = ('DX', 'DY', 'DZ', 'RX', 'RY', 'RZ')
+REACTIONS = ('RxnFX', 'RxnFY', 'RxnFZ', 'RxnMX', 'RxnMY', 'RxnMZ')
+TEMPORARY = (Analysis.SUPERPOSITION_PREFIX, Analysis.CASE_LOAD_PREFIX)
+
+
+def loaded_frame():
+    """Returns the braced frame with member loads and an enforced support settlement added, so every part of the right-hand side is exercised."""
+    model = braced_frame()
+    model.add_member_dist_load('B01', 'Fy', -10e3, -15e3, case='D')
+    model.add_member_pt_load('B12', 'Fy', -25e3, 2.0, case='W')
+    model.def_node_disp('N10', 'DY', -0.002)
+    return model
+
+
+def results(model):
+    """Returns node displacements and reactions, and member end moments, keyed by name, result and load combination."""
+    values = {(node.name, result, combo): getattr(node, result)[combo]
+              for node in model.nodes.values() for result in DOFS + REACTIONS for combo in model.load_combos}
+    for name, member in model.members.items():
+        for combo in model.load_combos:
+            values[(name, 'Mz', combo)] = member.max_moment('Mz', combo)
+            values[(name, 'P', combo)] = member.max_axial(combo)
+    return values
+
+
+def assert_no_temporary_combos(model):
+    """Checks none of the temporary load combinations used by superposition analysis are left on the model."""
+    names = set(model.load_combos) | set(model.nodes['N01'].DX.keys()) | set(model.nodes['N01'].RxnFX.keys())
+    for member in model.members.values():
+        names |= set(member.active)
+    assert not [name for name in names if name.startswith(TEMPORARY)]
+
+
+@pytest.mark.parametrize('sparse', [True, False])
+def test_matches_linear_analysis(sparse):
+
+    linear = loaded_frame()
+    linear.analyze_linear(sparse=sparse)
+
+    superposition = loaded_frame()
+    superposition.analyze_superposition(sparse=sparse)
+
+    assert list(superposition.load_combos) == list(linear.load_combos)
+    assert_no_temporary_combos(superposition)
+
+    expected = results(linear)
+    for key, value in results(superposition).items():
+        assert value == pytest.approx(expected[key], rel=1e-8, abs=1e-6), key
+
+
+@pytest.mark.parametrize('target, name', [(Member3D, 'FER'), (StiffnessFactorization, 'solve'), (Analysis, '_superpose_cases')])
+def test_temporary_combos_removed_on_error(target, name, monkeypatch):
+
+    def fail(*args, **kwargs):
+        raise RuntimeError('failed on purpose')
+
+    model = loaded_frame()
+    combos = list(model.load_combos)
+    monkeypatch.setattr(target, name, fail)
+
+    with pytest.raises(RuntimeError, match='failed on purpose'):
+        model.analyze_superposition()
+
+    assert list(model.load_combos) == combos
+    assert_no_temporary_combos(model)
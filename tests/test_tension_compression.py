@@ -0,0 +1,118 @@
+"""
+Tension/compression-only analysis with low-rank updates to the stiffness factorization (`Analysis._update_factorization` and `Factorization.LowRankUpdate`).
+"""
+
+import numpy as np
+import pytest
+
+from Pynite import Analysis
+from Pynite.Factorization import LowRankUpdate
+from frames import braced_frame
+
+DOFS = ('DX', 'DY', 'DZ', 'RX', 'RY', 'RZ')
+REACTIONS = ('RxnFX', 'RxnFY', 'RxnFZ', 'RxnMX', 'RxnMY', 'RxnMZ')
+
+
+def node_results(model):
+    """Returns every node displacement and reaction, keyed by (node name, result, load combination)."""
+    return {(node.name, result, combo): getattr(node, result)[combo]
+            for node in model.nodes.values() for result in DOFS + REACTIONS for combo in model.load_combos}
+
+
+def member_states(model):
+    """Returns the `active` flag of every member, keyed by (member name, load combination)."""
+    return {(name, combo): member.active[combo] for name, member in model.members.items() for combo in model.load_combos}
+
+
+def assert_same_results(model, reference):
+    """Checks two analyses of the same model give the same displacements, reactions and tension/compression-only states."""
+    assert member_states(model) == member_states(reference)
+    results, expected = node_results(model), node_results(reference)
+    assert results.keys() == expected.keys()
+    for key, value in expected.items():
+        assert results[key] == pytest.approx(value, rel=1e-8, abs=1e-9), key
+
+
+def full_solution(model, combo_name):
+    """Solves a load combination directly, refactorizing the dense stiffness matrix for the tension/compression-only state the analysis converged to.
+
+    :return: The global displacement vector and the reactions at the rigidly supported degrees of freedom.
+    """
+
+    # Node support springs are shared by every load combination, so set them to the state this load combination converged to
+    for node in model.nodes.values():
+        for dof in DOFS:
+            spring = getattr(node, f'spring_{dof}')
+            if spring[1] is not None:
+                displacement = getattr(node, dof)[combo_name]
+                spring[2] = displacement >= 0 if spring[1] == '+' else displacement <= 0
+
+    n = 6*len(model.nodes)
+    supported = np.zeros(n, dtype=bool)
+    for node in model.nodes.values():
+        for i, dof in enumerate(DOFS):
+            supported[node.ID*6 + i] = getattr(node, f'support_{dof}')
+
+    K = model.K(combo_name, sparse=False)
+    load = model.P(combo_name).ravel() - model.FER(combo_name).ravel()
+    free = ~supported
+    D = np.zeros(n)
+    D[free] = np.linalg.solve(K[np.ix_(free, free)], load[free])
+    return D, supported, (K @ D - load)[supported]
+
+
+@pytest.fixture
+def low_rank_updates(monkeypatch):
+    """Counts the low-rank updates made during a test."""
+
+    count = []
+
+    class CountedUpdate(LowRankUpdate):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            count.append(self)
+
+    monkeypatch.setattr(Analysis, 'LowRankUpdate', CountedUpdate)
+    return count
+
+
+@pytest.mark.parametrize('sparse', [True, False])
+def test_low_rank_update_matches_refactorization(sparse, low_rank_updates):
+
+    updated = braced_frame()
+    updated.analyze(sparse=sparse, max_update_rank=96)
+    assert low_rank_updates, 'the braces switching should have been handled as low-rank updates'
+
+    refactorized = braced_frame()
+    refactorized.analyze(sparse=sparse, max_update_rank=0)
+
+    assert_same_results(updated, refactorized)
+
+
+@pytest.mark.parametrize('max_update_rank', [96, 0])
+def test_matches_full_solution(max_update_rank):
+
+    model = braced_frame()
+    model.analyze(max_update_rank=max_update_rank)
+
+    # The braces and the support spring must actually have switched for this to test anything
+    assert not all(member_states(model).values())
+    assert model.nodes['N20'].DY['-W'] > 0 > model.nodes['N20'].DY['1.4D']
+
+    nodes = sorted(model.nodes.values(), key=lambda node: node.ID)
+    for combo_name in model.load_combos:
+        D, supported, reactions = full_solution(model, combo_name)
+        np.testing.assert_allclose(model.D(combo_name).ravel(), D, rtol=1e-8, atol=1e-12)
+        stored = np.array([getattr(node, result)[combo_name] for node in nodes for result in REACTIONS])[supported]
+        np.testing.assert_allclose(stored, reactions, rtol=1e-8, atol=1e-6)
+
+
+def test_num_steps_matches_single_step():
+
+    stepped = braced_frame()
+    stepped.analyze(num_steps=4)
+
+    single = braced_frame()
+    single.analyze()
+
+    assert_same_results(stepped, single)